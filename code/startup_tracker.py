@@ -4,33 +4,44 @@
 
 import os
 import re
-import csv
 import time
 import shlex
 import queue
 import shutil
-import subprocess
+import json
 import threading
-from dataclasses import dataclass, field
+from abc import ABC, abstractmethod
+from array import array
+from dataclasses import dataclass, field, replace
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List, Dict, Tuple
+from typing import Optional, List, Dict, Tuple, Iterator, Iterable, TYPE_CHECKING
 
-import psutil
-import tkinter as tk
-from tkinter import ttk, messagebox
+import sys
 
+if TYPE_CHECKING:
+    import psutil
 
-import sys
-import ctypes
+# Heavier modules (psutil, subprocess, csv, concurrent.futures, argparse, ctypes,
+# winreg, tkinter) are imported inside the functions that need them, so importing
+# this module as a library stays cheap and has no side effects.
 
 def is_admin():
     try:
+        import ctypes
         return ctypes.windll.shell32.IsUserAnAdmin()
     except:
         return False
 
-if not is_admin():
+def relaunch_as_admin():
+    """
+    Relaunch the GUI elevated if needed (Windows only; elsewhere the GUI runs as the
+    current user). Headless modes (e.g. boot capture) skip this.
+    """
+    if os.name != "nt" or is_admin():
+        return
+    import ctypes
     # Relaunch as admin
     ctypes.windll.shell32.ShellExecuteW(
         None,
@@ -53,11 +64,23 @@ def expand_env(s: str) -> str:
     # Expand %VAR% style
     return os.path.expandvars(s)
 
-def normalize_cmd(s: str) -> str:
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# The same command lines come up on every tick and for every item, so normalization
+# is memoized in bounded LRU caches. Results depend on environment variables;
+# call clear_normalize_caches() after changing os.environ.
+
+def _normalize_cmd_uncached(s: str) -> str:
     s = expand_env(s or "").strip().strip('"').strip()
-    s = re.sub(r"\s+", " ", s).lower()
+    s = _WHITESPACE_RE.sub(" ", s).lower()
     return s
 
+_normalize_cmd_cached = lru_cache(maxsize=16384)(_normalize_cmd_uncached)
+
+def normalize_cmd(s: str) -> str:
+    return _normalize_cmd_cached(s or "")
+
+@lru_cache(maxsize=8192)
 def best_guess_exe_from_cmd(cmd: str) -> Optional[str]:
     """
     Best-effort extraction of an executable path from a startup command.
@@ -84,11 +107,31 @@ def best_guess_exe_from_cmd(cmd: str) -> Optional[str]:
     # Fallback: take up to first space
     return cmd.split(" ")[0] if cmd else None
 
+def normalized_exe_guess(cmd: str) -> Optional[str]:
+    exe = best_guess_exe_from_cmd(cmd)
+    return normalize_cmd(exe) if exe else None
+
+def normalize_cache_stats() -> Dict[str, Dict[str, int]]:
+    """
+    Hit/miss counters of the normalization caches.
+    """
+    return {
+        "normalize_cmd": _normalize_cmd_cached.cache_info()._asdict(),
+        "best_guess_exe_from_cmd": best_guess_exe_from_cmd.cache_info()._asdict(),
+    }
+
+def clear_normalize_caches() -> None:
+    _normalize_cmd_cached.cache_clear()
+    best_guess_exe_from_cmd.cache_clear()
+
 def is_probably_logon_task(row: Dict[str, str]) -> bool:
     """
     Scheduled tasks filtering heuristic.
     """
-    trig = (row.get("Triggers") or "").lower()
+    return is_logon_trigger(row.get("Triggers") or "")
+
+def is_logon_trigger(triggers: str) -> bool:
+    trig = triggers.lower()
     # Common triggers include "At log on", "At startup"
     return ("at log on" in trig) or ("at startup" in trig)
 
@@ -99,6 +142,42 @@ def mb(x: int) -> float:
 # Data model
 # -----------------------------
 
+@dataclass(slots=True)
+class MonitorResult:
+    """
+    Mutable monitoring results for one entry, kept apart from the immutable core.
+    The single declaration of the result fields: StartupItem.result, capture files
+    (RESULT_FIELDS) and StartupItemTable all go through it.
+    """
+    matched_pid: Optional[int] = None
+    matched_proc_name: Optional[str] = None
+    avg_cpu: Optional[float] = None
+    peak_cpu: Optional[float] = None
+    avg_mem_mb: Optional[float] = None
+    peak_mem_mb: Optional[float] = None
+    p50_cpu: Optional[float] = None
+    p95_cpu: Optional[float] = None
+    p99_cpu: Optional[float] = None
+    p95_mem_mb: Optional[float] = None
+    avg_disk_mb_s: Optional[float] = None  # read + write throughput
+    peak_disk_mb_s: Optional[float] = None
+    disk_read_mb: Optional[float] = None   # totals over the window
+    disk_write_mb: Optional[float] = None
+    avg_io_ops_s: Optional[float] = None
+    avg_page_faults_s: Optional[float] = None
+    peak_threads: Optional[int] = None
+    peak_handles: Optional[int] = None     # handles on Windows, file descriptors elsewhere
+    proc_create_time: Optional[float] = None  # epoch seconds, from psutil create_time
+    time_to_idle_s: Optional[float] = None  # process creation -> CPU stays below idle threshold
+    cpu_seconds: Optional[float] = None    # CPU time used during the window, whole process tree
+    impact_score: Optional[float] = None   # see impact_score()
+    notes: str = ""
+    # Descendant processes rolled up into the stats above, one dict per child
+    # (pid, ppid, name, create_time, avg_cpu, peak_cpu, avg_mem_mb, peak_mem_mb)
+    children: Optional[List[Dict]] = field(default=None, repr=False)
+    # Full per-sample time series of the matched process tree (see SampleSeries)
+    series: Optional["SampleSeries"] = field(default=None, repr=False)
+
 @dataclass
 class StartupItem:
     name: str
@@ -108,13 +187,7 @@ class StartupItem:
     enabled: bool = True
 
     # Monitoring results (filled after monitoring)
-    matched_pid: Optional[int] = None
-    matched_proc_name: Optional[str] = None
-    avg_cpu: Optional[float] = None
-    peak_cpu: Optional[float] = None
-    avg_mem_mb: Optional[float] = None
-    peak_mem_mb: Optional[float] = None
-    notes: str = ""
+    result: MonitorResult = field(default_factory=MonitorResult)
 
     # Internal matching fields
     norm_cmd: str = field(init=False)
@@ -122,14 +195,137 @@ class StartupItem:
 
     def __post_init__(self):
         self.norm_cmd = normalize_cmd(self.command)
-        self.exe_guess = best_guess_exe_from_cmd(self.command)
-        if self.exe_guess:
-            self.exe_guess = normalize_cmd(self.exe_guess)
+        self.exe_guess = normalized_exe_guess(self.command)
+
+    @classmethod
+    def from_entry(cls, entry: "StartupEntry", result: Optional[MonitorResult] = None) -> "StartupItem":
+        it = cls(name=entry.name, source=entry.source, command=entry.command, location=entry.location, enabled=entry.enabled)
+        if result is not None:
+            it.result = replace(result)
+        return it
+
+    def entry(self) -> "StartupEntry":
+        return StartupEntry(self.name, self.source, self.command, self.location, self.enabled)
+
+    @property
+    def process_count(self) -> Optional[int]:
+        """
+        Matched process plus attributed descendants; None when nothing matched.
+        """
+        if self.result.matched_pid is None:
+            return None
+        return 1 + len(self.result.children or ())
+
+    def clear_results(self) -> None:
+        """
+        Reset every monitoring result field before a new run.
+        """
+        self.result = MonitorResult()
+
+# Compact representation for large (multi-host) inventories.
+# StartupItem above stays the working type for the GUI and monitor_items.
+
+@dataclass(frozen=True, slots=True)
+class StartupEntry:
+    """
+    Immutable core of a startup entry, no per-instance dict.
+    norm_cmd / exe_guess are derived on demand instead of stored.
+    """
+    name: str
+    source: str
+    command: str
+    location: str
+    enabled: bool = True
+
+    @property
+    def norm_cmd(self) -> str:
+        return normalize_cmd(self.command)
+
+    @property
+    def exe_guess(self) -> Optional[str]:
+        return normalized_exe_guess(self.command)
+
+class StartupItemTable:
+    """
+    Columnar store for bulk inventories (e.g. merged from many hosts).
+    One list per column instead of one object per row; strings are interned
+    through a per-table pool, so the same source/name/command/location repeated
+    across hosts is stored once. Results are kept sparsely by row.
+    """
+
+    COLUMNS = ("host", "name", "source", "command", "location")
+
+    def __init__(self):
+        self._pool: Dict[str, str] = {}
+        self.host: List[str] = []
+        self.name: List[str] = []
+        self.source: List[str] = []
+        self.command: List[str] = []
+        self.location: List[str] = []
+        self.enabled = bytearray()
+        self.results: Dict[int, MonitorResult] = {}
+
+    def _intern(self, s: str) -> str:
+        return self._pool.setdefault(s, s)
+
+    def append(self, name: str, source: str, command: str, location: str, enabled: bool = True, host: str = "") -> int:
+        intern = self._intern
+        self.host.append(intern(host))
+        self.name.append(intern(name))
+        self.source.append(intern(source))
+        self.command.append(intern(command))
+        self.location.append(intern(location))
+        self.enabled.append(1 if enabled else 0)
+        return len(self.enabled) - 1
+
+    def extend(self, items: Iterable, host: str = "") -> None:
+        """
+        Add StartupItems or StartupEntries; results on StartupItems are carried over.
+        """
+        for it in items:
+            row = self.append(it.name, it.source, it.command, it.location, it.enabled, host)
+            if isinstance(it, StartupItem) and (it.result.matched_pid is not None or it.result.notes):
+                self.results[row] = replace(it.result)
+
+    def __len__(self) -> int:
+        return len(self.enabled)
+
+    def entry(self, row: int) -> StartupEntry:
+        return StartupEntry(self.name[row], self.source[row], self.command[row], self.location[row], bool(self.enabled[row]))
+
+    def __iter__(self) -> Iterator[StartupEntry]:
+        for row in range(len(self)):
+            yield self.entry(row)
+
+    def result(self, row: int) -> MonitorResult:
+        """
+        Result record for row, created on first access.
+        """
+        res = self.results.get(row)
+        if res is None:
+            res = self.results[row] = MonitorResult()
+        return res
+
+    def to_items(self, rows: Optional[Iterable[int]] = None) -> List[StartupItem]:
+        """
+        Materialize full StartupItems (e.g. for monitor_items or the GUI).
+        """
+        rows = range(len(self)) if rows is None else rows
+        return [StartupItem.from_entry(self.entry(r), self.results.get(r)) for r in rows]
 
 # -----------------------------
 # Startup enumeration
 # -----------------------------
 
+# Windows
+
+def run_keys(winreg) -> List[Tuple[str, int, str]]:
+    return [
+        ("HKCU", winreg.HKEY_CURRENT_USER, r"Software\Microsoft\Windows\CurrentVersion\Run"),
+        ("HKLM", winreg.HKEY_LOCAL_MACHINE, r"Software\Microsoft\Windows\CurrentVersion\Run"),
+        ("HKLM", winreg.HKEY_LOCAL_MACHINE, r"Software\WOW6432Node\Microsoft\Windows\CurrentVersion\Run"),
+    ]
+
 def enum_registry_run_items() -> List[StartupItem]:
     """
     Enumerate common Run keys.
@@ -140,13 +336,7 @@ def enum_registry_run_items() -> List[StartupItem]:
     except Exception:
         return items
 
-    keys = [
-        ("HKCU", winreg.HKEY_CURRENT_USER, r"Software\Microsoft\Windows\CurrentVersion\Run"),
-        ("HKLM", winreg.HKEY_LOCAL_MACHINE, r"Software\Microsoft\Windows\CurrentVersion\Run"),
-        ("HKLM", winreg.HKEY_LOCAL_MACHINE, r"Software\WOW6432Node\Microsoft\Windows\CurrentVersion\Run"),
-    ]
-
-    for hive_name, hive, subkey in keys:
+    for hive_name, hive, subkey in run_keys(winreg):
         try:
             with winreg.OpenKey(hive, subkey, 0, winreg.KEY_READ) as k:
                 i = 0
@@ -182,22 +372,22 @@ def enum_registry_run_items() -> List[StartupItem]:
 
     return items
 
-def enum_startup_folder_items() -> List[StartupItem]:
-    """
-    Enumerate files in Startup folders (shortcuts, scripts, etc).
-    """
-    items: List[StartupItem] = []
-
+def startup_folders() -> List[Tuple[str, Path]]:
     # Per-user and all-users startup folders
     user_startup = Path(os.environ.get("APPDATA", "")) / r"Microsoft\Windows\Start Menu\Programs\Startup"
     common_startup = Path(os.environ.get("PROGRAMDATA", "")) / r"Microsoft\Windows\Start Menu\Programs\Startup"
-
-    folders = [
+    return [
         ("StartupFolder:User", user_startup),
         ("StartupFolder:AllUsers", common_startup),
     ]
 
-    for src, folder in folders:
+def enum_startup_folder_items() -> List[StartupItem]:
+    """
+    Enumerate files in Startup folders (shortcuts, scripts, etc).
+    """
+    items: List[StartupItem] = []
+
+    for src, folder in startup_folders():
         if folder.exists():
             for p in folder.iterdir():
                 if p.is_file():
@@ -216,496 +406,3096 @@ def enum_startup_folder_items() -> List[StartupItem]:
 
     return items
 
-def enum_scheduled_tasks() -> List[StartupItem]:
+def parse_schtasks_csv(lines: Iterable[str]) -> Iterator[StartupItem]:
+    """
+    Lazily turn `schtasks /Query /FO CSV /V` output lines into StartupItems.
+    The logon/startup filter runs on the raw row, so dicts/items are only built for matches.
+    """
+    import csv
+    # schtasks CSV can have blank lines, and repeats the header for each task folder
+    reader = csv.reader(ln for ln in lines if ln.strip())
+    header = next(reader, None)
+    if not header:
+        return
+    col = {name: i for i, name in enumerate(header)}
+    i_name = col.get("TaskName")
+    i_trig = col.get("Triggers")
+    if i_name is None or i_trig is None:
+        return
+
+    for raw in reader:
+        if len(raw) <= max(i_name, i_trig) or raw == header:
+            continue
+        # Filter for likely startup/logon tasks
+        if not is_logon_trigger(raw[i_trig]):
+            continue
+
+        row = dict(zip(header, raw))
+        task_name = row.get("TaskName") or ""
+        status = (row.get("Status") or "").strip()
+        task_to_run = (row.get("Task To Run") or "").strip()
+        triggers = (row.get("Triggers") or "").strip()
+
+        if not task_name:
+            continue
+
+        enabled = (status.lower() != "disabled")
+        yield StartupItem(
+            name=task_name,
+            source="TaskScheduler",
+            command=task_to_run if task_to_run else f"(See task) Triggers={triggers}",
+            location=task_name,
+            enabled=enabled
+        )
+
+def iter_scheduled_tasks() -> Iterator[StartupItem]:
     """
     Best-effort: query schtasks and pick tasks that appear to run at logon/startup.
+    Reads the pipe incrementally, so items are produced before schtasks exits and
+    the full verbose output is never held in memory.
     Disabling uses schtasks /Change /DISABLE.
     """
-    items: List[StartupItem] = []
-
+    import subprocess
     try:
         # CSV output is easier to parse than the default table
         cmd = ["schtasks", "/Query", "/FO", "CSV", "/V"]
-        proc = subprocess.run(cmd, capture_output=True, text=True, check=False)
-        if proc.returncode != 0 or not proc.stdout.strip():
-            return items
-
-        # schtasks CSV can have an initial blank line sometimes
-        lines = [ln for ln in proc.stdout.splitlines() if ln.strip()]
-        reader = csv.DictReader(lines)
-        for row in reader:
-            task_name = row.get("TaskName") or ""
-            status = (row.get("Status") or "").strip()
-            task_to_run = (row.get("Task To Run") or "").strip()
-            triggers = (row.get("Triggers") or "").strip()
-
-            if not task_name:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    except FileNotFoundError:
+        # schtasks not found (unlikely on Windows)
+        return
+    except Exception:
+        return
+
+    try:
+        yield from parse_schtasks_csv(proc.stdout)
+    except Exception:
+        return
+    finally:
+        proc.stdout.close()
+        if proc.poll() is None:
+            proc.kill()
+        proc.wait()
+
+def enum_scheduled_tasks() -> List[StartupItem]:
+    return list(iter_scheduled_tasks())
+
+# Linux
+
+def xdg_autostart_dirs() -> List[Tuple[str, Path]]:
+    """
+    (source, directory) pairs for XDG autostart entries, user first.
+    """
+    config_home = Path(os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config")
+    dirs = [("XDGAutostart:User", config_home / "autostart")]
+    for d in (os.environ.get("XDG_CONFIG_DIRS") or "/etc/xdg").split(":"):
+        if d:
+            dirs.append(("XDGAutostart:System", Path(d) / "autostart"))
+    return dirs
+
+def parse_ini_section(path: Path, section: str) -> Dict[str, str]:
+    """
+    Minimal reader for .desktop / systemd unit files: key=value pairs of one section.
+    The first occurrence of a key wins (systemd allows repeats, e.g. ExecStart).
+    """
+    values: Dict[str, str] = {}
+    current = None
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith(("#", ";")):
+                continue
+            if line.startswith("[") and line.endswith("]"):
+                current = line[1:-1]
                 continue
+            if current == section and "=" in line:
+                k, v = line.split("=", 1)
+                values.setdefault(k.strip(), v.strip())
+    return values
 
-            # Filter for likely startup/logon tasks
-            if not is_probably_logon_task(row):
+def enum_xdg_autostart_items(dirs: Optional[List[Tuple[str, Path]]] = None) -> List[StartupItem]:
+    """
+    Enumerate ~/.config/autostart and /etc/xdg/autostart *.desktop entries.
+    A user entry with the same file name overrides the system one. A user file that
+    only masks a system entry (Hidden=true, no Exec; see disable_xdg_autostart) is
+    reported as that system entry, disabled, so it keeps its source and location.
+    """
+    items: List[StartupItem] = []
+    seen_names = set()
+    masks: Dict[str, StartupItem] = {}  # file name -> user item, until a system entry turns up
+    for src, folder in (dirs if dirs is not None else xdg_autostart_dirs()):
+        if not folder.is_dir():
+            continue
+        for p in sorted(folder.glob("*.desktop")):
+            if p.name in seen_names:
                 continue
+            try:
+                entry = parse_ini_section(p, "Desktop Entry")
+            except OSError:
+                continue
+            hidden = entry.get("Hidden", "").lower() == "true"
+            gnome_off = entry.get("X-GNOME-Autostart-enabled", "").lower() == "false"
+            it = StartupItem(
+                name=entry.get("Name") or p.stem,
+                source=src,
+                command=entry.get("Exec", ""),
+                location=str(p),
+                enabled=not (hidden or gnome_off)
+            )
+            if p.name in masks:
+                del masks[p.name]
+                it.enabled = False
+            elif src == "XDGAutostart:User" and hidden and "Exec" not in entry:
+                masks[p.name] = it
+                continue
+            seen_names.add(p.name)
+            items.append(it)
+    # Masks with nothing behind them are listed as the user entries they are
+    items.extend(masks.values())
+    return items
+
+def systemd_wants_dirs() -> List[Tuple[str, Path]]:
+    """
+    (source, *.wants directory) pairs for units started with the default target.
+    Enabled units with WantedBy=default.target are symlinked into default.target.wants;
+    on most servers default.target is multi-user.target, so that one is included for system units.
+    """
+    config_home = Path(os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config")
+    return [
+        ("Systemd:User", config_home / "systemd" / "user" / "default.target.wants"),
+        ("Systemd:User", Path("/etc/systemd/user/default.target.wants")),
+        ("Systemd:System", Path("/etc/systemd/system/default.target.wants")),
+        ("Systemd:System", Path("/etc/systemd/system/multi-user.target.wants")),
+    ]
 
-            enabled = (status.lower() != "disabled")
+def enum_systemd_units(dirs: Optional[List[Tuple[str, Path]]] = None) -> List[StartupItem]:
+    """
+    Enumerate enabled systemd services wanted by the default target.
+    Reads the unit files directly instead of calling systemctl.
+    """
+    items: List[StartupItem] = []
+    for src, folder in (dirs if dirs is not None else systemd_wants_dirs()):
+        if not folder.is_dir():
+            continue
+        for p in sorted(folder.glob("*.service")):
+            command = ""
+            try:
+                service = parse_ini_section(p.resolve(), "Service")
+                # Strip systemd exec prefixes (-, @, +, !, :)
+                command = service.get("ExecStart", "").lstrip("-@+!:")
+            except OSError:
+                pass
             items.append(
                 StartupItem(
-                    name=task_name,
-                    source="TaskScheduler",
-                    command=task_to_run if task_to_run else f"(See task) Triggers={triggers}",
-                    location=task_name,
-                    enabled=enabled
+                    name=p.stem,
+                    source=src,
+                    command=command,
+                    location=p.name,
+                    enabled=True
                 )
             )
+    return items
+
+def read_crontab() -> Optional[str]:
+    """
+    Current user's crontab, or None if there is none / crontab isn't available.
+    """
+    import subprocess
+    try:
+        proc = subprocess.run(["crontab", "-l"], capture_output=True, text=True, check=False)
     except FileNotFoundError:
-        # schtasks not found (unlikely on Windows)
+        return None
+    if proc.returncode != 0:
+        return None
+    return proc.stdout
+
+def enum_cron_reboot_items(crontab_text: Optional[str] = None) -> List[StartupItem]:
+    """
+    Enumerate @reboot lines in the user's crontab.
+    Location is the full crontab line, which is what disabling looks for.
+    """
+    items: List[StartupItem] = []
+    text = read_crontab() if crontab_text is None else crontab_text
+    if not text:
         return items
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped.startswith("@reboot"):
+            continue
+        command = stripped[len("@reboot"):].strip()
+        items.append(
+            StartupItem(
+                name=(best_guess_exe_from_cmd(command) or command).rsplit("/", 1)[-1],
+                source="Cron:@reboot",
+                command=command,
+                location=line,
+                enabled=True
+            )
+        )
+    return items
+
+# -----------------------------
+# Disable/remove actions
+# -----------------------------
+
+def _parse_registry_location(loc: str) -> Tuple[str, str, str]:
+    # "HKCU\...\Run::ValueName" -> (hive, key path, value name)
+    if "::" not in loc:
+        raise ValueError("Invalid registry location format.")
+    hive_part, rest = loc.split("\\", 1)
+    key_path, value_name = rest.split("::", 1)
+    return hive_part, key_path, value_name
+
+def disable_registry_item(item: StartupItem, backup_dir: Path) -> Tuple[bool, str]:
+    """
+    Delete a Run key value.
+    """
+    try:
+        import winreg
+        if "::" not in item.location:
+            return False, "Invalid registry location format."
+        hive_part, key_path, value_name = _parse_registry_location(item.location)
+
+        hive = winreg.HKEY_CURRENT_USER if hive_part == "HKCU" else winreg.HKEY_LOCAL_MACHINE
+
+        # Need write access to delete value
+        with winreg.OpenKey(hive, key_path, 0, winreg.KEY_SET_VALUE) as k:
+            winreg.DeleteValue(k, value_name)
+
+        return True, f"Removed registry Run entry: {value_name}"
+    except PermissionError:
+        return False, "Permission denied. Try running as Administrator."
+    except FileNotFoundError:
+        return False, "Registry key/value not found (already removed?)."
+    except Exception as e:
+        return False, f"Registry removal failed: {e}"
+
+def move_to_backup(item: StartupItem, backup_dir: Path) -> Tuple[bool, str]:
+    """
+    Startup file removal (move to backup).
+    """
+    try:
+        p = Path(item.location)
+        if not p.exists():
+            return False, "Startup file not found (already removed?)."
+
+        backup_dir.mkdir(parents=True, exist_ok=True)
+        dest = backup_dir / p.name
+        # Avoid overwrite
+        if dest.exists():
+            dest = backup_dir / f"{p.stem}_{now_str()}{p.suffix}"
+
+        shutil.move(str(p), str(dest))
+        return True, f"Moved startup file to backup: {dest}"
+    except PermissionError:
+        return False, "Permission denied. Try running as Administrator."
+    except Exception as e:
+        return False, f"File move failed: {e}"
+
+def disable_scheduled_task(item: StartupItem, backup_dir: Path) -> Tuple[bool, str]:
+    import subprocess
+    try:
+        # Disable task
+        cmd = ["schtasks", "/Change", "/TN", item.location, "/DISABLE"]
+        proc = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        if proc.returncode == 0:
+            return True, f"Disabled scheduled task: {item.location}"
+        else:
+            msg = proc.stderr.strip() or proc.stdout.strip() or "Unknown error."
+            return False, f"Failed to disable task: {msg}"
+    except PermissionError:
+        return False, "Permission denied. Try running as Administrator."
+    except Exception as e:
+        return False, f"Task disable failed: {e}"
+
+def disable_xdg_autostart(item: StartupItem, backup_dir: Path) -> Tuple[bool, str]:
+    """
+    User entries are moved to backup. System entries are left alone and masked with a
+    Hidden=true override of the same name in the user's autostart folder (the XDG way).
+    """
+    if item.source == "XDGAutostart:User":
+        return move_to_backup(item, backup_dir)
+    try:
+        user_dir = xdg_autostart_dirs()[0][1]
+        user_dir.mkdir(parents=True, exist_ok=True)
+        override = user_dir / Path(item.location).name
+        with open(override, "w", encoding="utf-8") as f:
+            f.write(f"[Desktop Entry]\nType=Application\nName={item.name}\nHidden=true\n")
+        return True, f"Masked system autostart entry with: {override}"
+    except PermissionError:
+        return False, "Permission denied writing autostart override."
+    except Exception as e:
+        return False, f"Autostart override failed: {e}"
+
+def disable_systemd_unit(item: StartupItem, backup_dir: Path) -> Tuple[bool, str]:
+    import subprocess
+    try:
+        cmd = ["systemctl"] + (["--user"] if item.source == "Systemd:User" else []) + ["disable", item.location]
+        proc = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        if proc.returncode == 0:
+            return True, f"Disabled systemd unit: {item.location}"
+        msg = proc.stderr.strip() or proc.stdout.strip() or "Unknown error."
+        return False, f"Failed to disable unit: {msg}"
+    except Exception as e:
+        return False, f"Unit disable failed: {e}"
+
+def disable_cron_reboot(item: StartupItem, backup_dir: Path) -> Tuple[bool, str]:
+    """
+    Comment out the @reboot line; the whole crontab is backed up first.
+    """
+    import subprocess
+    try:
+        text = read_crontab()
+        if text is None or item.location not in text.splitlines():
+            return False, "Crontab line not found (already removed?)."
+
+        backup_dir.mkdir(parents=True, exist_ok=True)
+        backup = backup_dir / f"crontab_{now_str()}.txt"
+        backup.write_text(text, encoding="utf-8")
+
+        lines = [f"# disabled by StartupTracker: {ln}" if ln == item.location else ln for ln in text.splitlines()]
+        proc = subprocess.run(["crontab", "-"], input="\n".join(lines) + "\n", capture_output=True, text=True, check=False)
+        if proc.returncode != 0:
+            return False, f"Failed to write crontab: {proc.stderr.strip() or 'Unknown error.'}"
+        return True, f"Commented out @reboot line (crontab backed up to {backup})"
+    except Exception as e:
+        return False, f"Crontab edit failed: {e}"
+
+# Prior state + restore, used by the disable journal. snapshot_* runs before the
+# disable and returns a JSON-serializable state (raising if it can't be captured);
+# restore_* puts that state back and returns (success, message).
+
+def snapshot_registry_item(item: StartupItem, store_dir: Path) -> Dict:
+    import winreg
+    hive_part, key_path, value_name = _parse_registry_location(item.location)
+    hive = winreg.HKEY_CURRENT_USER if hive_part == "HKCU" else winreg.HKEY_LOCAL_MACHINE
+    with winreg.OpenKey(hive, key_path, 0, winreg.KEY_READ) as k:
+        data, value_type = winreg.QueryValueEx(k, value_name)
+    if isinstance(data, bytes):
+        data = {"hex": data.hex()}  # REG_BINARY
+    return {"hive": hive_part, "key": key_path, "value": value_name, "type": value_type, "data": data}
+
+def restore_registry_item(item: StartupItem, state: Dict) -> Tuple[bool, str]:
+    try:
+        import winreg
+        hive = winreg.HKEY_CURRENT_USER if state["hive"] == "HKCU" else winreg.HKEY_LOCAL_MACHINE
+        data = state["data"]
+        if isinstance(data, dict):
+            data = bytes.fromhex(data["hex"])
+        with winreg.CreateKeyEx(hive, state["key"], 0, winreg.KEY_SET_VALUE) as k:
+            winreg.SetValueEx(k, state["value"], 0, state["type"], data)
+        return True, f"Restored registry Run entry: {state['value']}"
+    except PermissionError:
+        return False, "Permission denied. Try running as Administrator."
+    except Exception as e:
+        return False, f"Registry restore failed: {e}"
+
+def snapshot_file_item(item: StartupItem, store_dir: Path) -> Dict:
+    """
+    Keep a copy of the file with the journal, so restoring doesn't depend on where
+    (or whether) the disable moved it.
+    """
+    import tempfile
+    p = Path(item.location)
+    store_dir.mkdir(parents=True, exist_ok=True)
+    fd, copy = tempfile.mkstemp(dir=store_dir, suffix="_" + p.name)
+    os.close(fd)
+    shutil.copy2(str(p), copy)
+    return {"path": str(p), "copy": copy}
+
+def restore_file_item(item: StartupItem, state: Dict) -> Tuple[bool, str]:
+    try:
+        p = Path(state["path"])
+        if p.exists():
+            return True, f"Startup file already in place: {p}"
+        p.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(state["copy"], str(p))
+        return True, f"Restored startup file: {p}"
+    except PermissionError:
+        return False, "Permission denied. Try running as Administrator."
+    except Exception as e:
+        return False, f"File restore failed: {e}"
+
+def _task_enabled(task_name: str) -> Optional[bool]:
+    import subprocess
+    import csv
+    proc = subprocess.run(["schtasks", "/Query", "/TN", task_name, "/FO", "CSV", "/V"],
+                          capture_output=True, text=True, check=False)
+    if proc.returncode != 0:
+        return None
+    rows = list(csv.reader(ln for ln in proc.stdout.splitlines() if ln.strip()))
+    if len(rows) < 2 or "Status" not in rows[0]:
+        return None
+    return rows[1][rows[0].index("Status")].strip().lower() != "disabled"
+
+def snapshot_scheduled_task(item: StartupItem, store_dir: Path) -> Dict:
+    enabled = _task_enabled(item.location)
+    return {"task": item.location, "enabled": item.enabled if enabled is None else enabled}
+
+def restore_scheduled_task(item: StartupItem, state: Dict) -> Tuple[bool, str]:
+    import subprocess
+    if not state.get("enabled"):
+        return True, f"Task was already disabled: {state['task']}"
+    try:
+        proc = subprocess.run(["schtasks", "/Change", "/TN", state["task"], "/ENABLE"],
+                              capture_output=True, text=True, check=False)
+        if proc.returncode == 0:
+            return True, f"Re-enabled scheduled task: {state['task']}"
+        return False, f"Failed to enable task: {proc.stderr.strip() or proc.stdout.strip() or 'Unknown error.'}"
+    except Exception as e:
+        return False, f"Task enable failed: {e}"
+
+def snapshot_xdg_autostart(item: StartupItem, store_dir: Path) -> Dict:
+    if item.source == "XDGAutostart:User":
+        return snapshot_file_item(item, store_dir)
+    override = xdg_autostart_dirs()[0][1] / Path(item.location).name
+    existed = override.exists()
+    return {
+        "override": str(override),
+        "existed": existed,
+        "content": override.read_text(encoding="utf-8") if existed else None,
+    }
+
+def restore_xdg_autostart(item: StartupItem, state: Dict) -> Tuple[bool, str]:
+    if "override" not in state:
+        return restore_file_item(item, state)
+    try:
+        override = Path(state["override"])
+        if state["existed"]:
+            override.write_text(state["content"], encoding="utf-8")
+            return True, f"Restored previous autostart override: {override}"
+        if override.exists():
+            override.unlink()
+        return True, f"Removed autostart override: {override}"
+    except Exception as e:
+        return False, f"Autostart restore failed: {e}"
+
+def _systemctl(item_source: str, *args: str):
+    import subprocess
+    cmd = ["systemctl"] + (["--user"] if item_source == "Systemd:User" else []) + list(args)
+    return subprocess.run(cmd, capture_output=True, text=True, check=False)
+
+def snapshot_systemd_unit(item: StartupItem, store_dir: Path) -> Dict:
+    proc = _systemctl(item.source, "is-enabled", item.location)
+    return {"unit": item.location, "state": proc.stdout.strip()}
+
+def restore_systemd_unit(item: StartupItem, state: Dict) -> Tuple[bool, str]:
+    if state.get("state") != "enabled":
+        return True, f"Unit was not enabled before ({state.get('state') or 'unknown'}): {state['unit']}"
+    try:
+        proc = _systemctl(item.source, "enable", state["unit"])
+        if proc.returncode == 0:
+            return True, f"Re-enabled systemd unit: {state['unit']}"
+        return False, f"Failed to enable unit: {proc.stderr.strip() or proc.stdout.strip() or 'Unknown error.'}"
+    except Exception as e:
+        return False, f"Unit enable failed: {e}"
+
+def snapshot_cron(item: StartupItem, store_dir: Path) -> Dict:
+    text = read_crontab()
+    if text is None:
+        raise OSError("crontab could not be read")
+    return {"crontab": text}
+
+def restore_cron(item: StartupItem, state: Dict) -> Tuple[bool, str]:
+    # Journal entries are restored newest first, so the oldest snapshot wins
+    import subprocess
+    try:
+        proc = subprocess.run(["crontab", "-"], input=state["crontab"], capture_output=True, text=True, check=False)
+        if proc.returncode != 0:
+            return False, f"Failed to write crontab: {proc.stderr.strip() or 'Unknown error.'}"
+        return True, "Restored previous crontab."
+    except Exception as e:
+        return False, f"Crontab restore failed: {e}"
+
+# -----------------------------
+# Change detection
+# -----------------------------
+
+def paths_fingerprint(paths: Iterable[Path], recursive: bool = False) -> List:
+    """
+    Cheap validator for folder-based sources: mtime and entry count of each folder
+    plus the newest mtime of anything inside it (following symlinks).
+    """
+    fp = []
+    for folder in paths:
+        folder = Path(folder)
+        try:
+            st_dir = folder.stat()
+        except OSError:
+            fp.append([str(folder), None])
+            continue
+        count, newest = 0, 0
+        entries = folder.rglob("*") if recursive else folder.iterdir()
+        try:
+            for p in entries:
+                try:
+                    newest = max(newest, p.stat().st_mtime_ns)
+                except OSError:
+                    pass
+                count += 1
+        except OSError:
+            pass
+        fp.append([str(folder), st_dir.st_mtime_ns, count, newest])
+    return fp
+
+def registry_run_fingerprint() -> Optional[List]:
+    """
+    Last-write time of each Run key.
+    """
+    try:
+        import winreg
     except Exception:
-        return items
+        return None
+    fp = []
+    for hive_name, hive, subkey in run_keys(winreg):
+        try:
+            with winreg.OpenKey(hive, subkey, 0, winreg.KEY_READ) as k:
+                fp.append([hive_name, subkey, winreg.QueryInfoKey(k)[2]])
+        except OSError:
+            fp.append([hive_name, subkey, None])
+    return fp
 
-    return items
+def task_store_fingerprint() -> List:
+    """
+    The task scheduler keeps one XML file per task under System32\\Tasks.
+    """
+    tasks = Path(os.environ.get("SystemRoot", r"C:\Windows")) / "System32" / "Tasks"
+    return paths_fingerprint([tasks], recursive=True)
+
+# -----------------------------
+# Startup source backends
+# -----------------------------
+
+class StartupSource:
+    """
+    One place programs get started from. enumerate_all_startup_items() and
+    disable_item() dispatch through the registered sources.
+    """
+
+    name = "base"
+    prefixes: Tuple[str, ...] = ()  # StartupItem.source values this backend owns
+
+    def available(self) -> bool:
+        return True
 
-def enumerate_all_startup_items() -> List[StartupItem]:
-    items = []
-    items.extend(enum_registry_run_items())
-    items.extend(enum_startup_folder_items())
-    items.extend(enum_scheduled_tasks())
+    def enumerate(self) -> List[StartupItem]:
+        return []
+
+    def fingerprint(self):
+        """
+        JSON-serializable validator that changes whenever the source's entries may have
+        changed (key last-write time, folder mtimes, ...). None means "always re-query".
+        """
+        return None
+
+    def iter_batches(self, batch_size: int = 200) -> Iterator[List[StartupItem]]:
+        """
+        Items in batches as they become available. Sources that can stream override this.
+        """
+        items = self.enumerate()
+        if items:
+            yield items
+
+    def handles(self, item: StartupItem) -> bool:
+        return item.source.startswith(self.prefixes)
+
+    def disable(self, item: StartupItem, backup_dir: Path) -> Tuple[bool, str]:
+        return False, "Unsupported item type."
+
+    # Disables of the same source run concurrently unless they share state (e.g. one crontab)
+    serial_disable = False
+
+    def snapshot(self, item: StartupItem, store_dir: Path) -> Optional[Dict]:
+        """
+        Prior state of item, taken right before disabling it, for restore().
+        None means the source can't restore.
+        """
+        return None
+
+    def restore(self, item: StartupItem, state: Dict) -> Tuple[bool, str]:
+        return False, "Restore is not supported for this item type."
+
+class FunctionSource(StartupSource):
+    """
+    Source built from an enumerate function and a disable function.
+    """
+
+    def __init__(self, name: str, prefixes: Tuple[str, ...], enumerate_fn, disable_fn, available_fn=None,
+                 iter_fn=None, fingerprint_fn=None, snapshot_fn=None, restore_fn=None, serial_disable=False):
+        self.name = name
+        self.prefixes = prefixes
+        self._enumerate = enumerate_fn
+        self._disable = disable_fn
+        self._available = available_fn
+        self._iter = iter_fn  # optional lazy generator of items
+        self._fingerprint = fingerprint_fn
+        self._snapshot = snapshot_fn
+        self._restore = restore_fn
+        self.serial_disable = serial_disable
+
+    def available(self) -> bool:
+        return self._available() if self._available else True
+
+    def fingerprint(self):
+        return self._fingerprint() if self._fingerprint else None
+
+    def enumerate(self) -> List[StartupItem]:
+        return self._enumerate()
+
+    def iter_batches(self, batch_size: int = 200) -> Iterator[List[StartupItem]]:
+        if self._iter is None:
+            yield from super().iter_batches(batch_size)
+            return
+        batch = []
+        for it in self._iter():
+            batch.append(it)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def disable(self, item: StartupItem, backup_dir: Path) -> Tuple[bool, str]:
+        return self._disable(item, backup_dir)
+
+    def snapshot(self, item: StartupItem, store_dir: Path) -> Optional[Dict]:
+        return self._snapshot(item, store_dir) if self._snapshot else None
+
+    def restore(self, item: StartupItem, state: Dict) -> Tuple[bool, str]:
+        if self._restore is None:
+            return super().restore(item, state)
+        return self._restore(item, state)
+
+STARTUP_SOURCES: List[StartupSource] = []
+
+def register_startup_source(source: StartupSource) -> StartupSource:
+    STARTUP_SOURCES.append(source)
+    return source
+
+def _is_windows() -> bool:
+    return os.name == "nt"
+
+def _is_linux() -> bool:
+    return sys.platform.startswith("linux")
+
+# Windows
+register_startup_source(FunctionSource(
+    "registry", ("Registry:",), enum_registry_run_items, disable_registry_item, _is_windows,
+    fingerprint_fn=registry_run_fingerprint, snapshot_fn=snapshot_registry_item, restore_fn=restore_registry_item))
+register_startup_source(FunctionSource(
+    "startup_folder", ("StartupFolder:",), enum_startup_folder_items, move_to_backup, _is_windows,
+    fingerprint_fn=lambda: paths_fingerprint(p for _, p in startup_folders()),
+    snapshot_fn=snapshot_file_item, restore_fn=restore_file_item))
+register_startup_source(FunctionSource(
+    "scheduled_tasks", ("TaskScheduler",), enum_scheduled_tasks, disable_scheduled_task, _is_windows,
+    iter_fn=iter_scheduled_tasks, fingerprint_fn=task_store_fingerprint,
+    snapshot_fn=snapshot_scheduled_task, restore_fn=restore_scheduled_task))
+
+# Linux
+register_startup_source(FunctionSource(
+    "xdg_autostart", ("XDGAutostart:",), enum_xdg_autostart_items, disable_xdg_autostart, _is_linux,
+    fingerprint_fn=lambda: paths_fingerprint(p for _, p in xdg_autostart_dirs()),
+    snapshot_fn=snapshot_xdg_autostart, restore_fn=restore_xdg_autostart))
+register_startup_source(FunctionSource(
+    "systemd", ("Systemd:",), enum_systemd_units, disable_systemd_unit, _is_linux,
+    fingerprint_fn=lambda: paths_fingerprint(p for _, p in systemd_wants_dirs()),
+    snapshot_fn=snapshot_systemd_unit, restore_fn=restore_systemd_unit))
+register_startup_source(FunctionSource(
+    "cron", ("Cron:",), enum_cron_reboot_items, disable_cron_reboot, lambda: _is_linux() and bool(shutil.which("crontab")),
+    snapshot_fn=snapshot_cron, restore_fn=restore_cron, serial_disable=True))
+
+def active_startup_sources() -> List[StartupSource]:
+    return [src for src in STARTUP_SOURCES if src.available()]
+
+def iter_startup_sources(sources: Optional[List[StartupSource]] = None, max_workers: Optional[int] = None,
+                         batch_size: int = 200) -> Iterator[Tuple[StartupSource, List[StartupItem]]]:
+    """
+    Enumerate every source concurrently and yield (source, items) batches as they arrive,
+    so fast sources (registry, folders) aren't held up by slow ones (schtasks), and
+    streaming sources deliver rows before they finish. A source that raises just stops.
+    """
+    sources = sources if sources is not None else active_startup_sources()
+    if not sources:
+        return
+    from concurrent.futures import ThreadPoolExecutor
+    results = queue.Queue()
+
+    def run(src: StartupSource):
+        try:
+            for batch in src.iter_batches(batch_size):
+                results.put((src, batch))
+        except Exception:
+            pass
+        finally:
+            results.put((src, None))  # end of this source
+
+    with ThreadPoolExecutor(max_workers=max_workers or len(sources), thread_name_prefix="enum") as pool:
+        for src in sources:
+            pool.submit(run, src)
+        remaining = len(sources)
+        while remaining:
+            src, batch = results.get()
+            if batch is None:
+                remaining -= 1
+                continue
+            yield src, batch
+
+def item_key(it: StartupItem) -> Tuple[str, str]:
+    return (it.source, it.location)
+
+def enumerate_all_startup_items(sources: Optional[List[StartupSource]] = None) -> List[StartupItem]:
+    sources = sources if sources is not None else active_startup_sources()
+    by_source: Dict[int, List[StartupItem]] = {}
+    for src, batch in iter_startup_sources(sources):
+        by_source.setdefault(id(src), []).extend(batch)
+    # Keep registration order regardless of which source finished first
+    items = [it for src in sources for it in by_source.get(id(src), [])]
     # Deduplicate by (source, location)
     seen = set()
     deduped = []
     for it in items:
-        key = (it.source, it.location)
+        key = item_key(it)
         if key not in seen:
             seen.add(key)
             deduped.append(it)
     return deduped
 
-# -----------------------------
-# Disable/remove actions
-# -----------------------------
-
 def disable_item(item: StartupItem, backup_dir: Path) -> Tuple[bool, str]:
     """
     Disables/removes startup entry depending on source.
     Returns (success, message).
     """
-    # Registry removal
-    if item.source.startswith("Registry:"):
-        try:
-            import winreg
-            # location: "HKCU\...\Run::ValueName"
-            loc = item.location
-            if "::" not in loc:
-                return False, "Invalid registry location format."
-            hive_part, rest = loc.split("\\", 1)
-            key_path, value_name = rest.split("::", 1)
+    for src in STARTUP_SOURCES:
+        if src.handles(item):
+            return src.disable(item, backup_dir)
+    return False, "Unsupported item type."
 
-            hive = winreg.HKEY_CURRENT_USER if hive_part == "HKCU" else winreg.HKEY_LOCAL_MACHINE
+def source_for_item(item: StartupItem) -> Optional[StartupSource]:
+    for src in STARTUP_SOURCES:
+        if src.handles(item):
+            return src
+    return None
 
-            # Need write access to delete value
-            with winreg.OpenKey(hive, key_path, 0, winreg.KEY_SET_VALUE) as k:
-                winreg.DeleteValue(k, value_name)
+# -----------------------------
+# Batch disable + restore journal
+# -----------------------------
 
-            return True, f"Removed registry Run entry: {value_name}"
-        except PermissionError:
-            return False, "Permission denied. Try running as Administrator."
-        except FileNotFoundError:
-            return False, "Registry key/value not found (already removed?)."
-        except Exception as e:
-            return False, f"Registry removal failed: {e}"
+class DisableJournal:
+    """
+    Append-only NDJSON log of a disable batch, flushed and fsynced per record:
+      {"op": "prior", "seq", "item", "source", "state"}  before the change
+      {"op": "result", "seq", "ok", "msg"}                after it
+      {"op": "restored", "seq", "ok", "msg"}              after restore
+    A change is only made once its prior state is on disk. Files the restore
+    needs (copies of startup files) are kept in a folder next to the journal.
+    The journal file is created by its first record, so a batch that changed
+    nothing doesn't hide the previous one from latest_journal().
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.store_dir = self.path.with_suffix("")
+        self._lock = threading.Lock()
+        self._seq = 0
+
+    @classmethod
+    def create(cls, backup_dir: Path) -> "DisableJournal":
+        folder = journal_dir(backup_dir)
+        folder.mkdir(parents=True, exist_ok=True)
+        path = folder / f"disable_{now_str()}.jsonl"
+        n = 1
+        while path.exists():
+            n += 1
+            path = folder / f"disable_{now_str()}_{n}.jsonl"
+        return cls(path)
+
+    def _write(self, rec: Dict) -> None:
+        line = json.dumps(rec) + "\n"
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def prior(self, item: StartupItem, source: StartupSource, state: Dict) -> int:
+        with self._lock:
+            self._seq += 1
+            seq = self._seq
+        self._write({"op": "prior", "seq": seq, "time": now_str(), "item": _base_item_dict(item),
+                     "source": source.name, "state": state})
+        return seq
+
+    def result(self, seq: int, ok: bool, msg: str) -> None:
+        self._write({"op": "result", "seq": seq, "ok": ok, "msg": msg})
+
+    def restored(self, seq: int, ok: bool, msg: str) -> None:
+        self._write({"op": "restored", "seq": seq, "ok": ok, "msg": msg})
+
+    def records(self) -> List[Dict]:
+        with open(self.path, "r", encoding="utf-8") as f:
+            return [json.loads(ln) for ln in f if ln.strip()]
+
+    def pending(self) -> List[Dict]:
+        """
+        Prior-state records still to restore, newest first: changes that weren't
+        restored yet, including ones without a result (interrupted batch).
+        Changes whose disable failed are left out.
+        """
+        priors: Dict[int, Dict] = {}
+        done = set()
+        for rec in self.records():
+            if rec["op"] == "prior":
+                priors[rec["seq"]] = rec
+            elif (rec["op"] == "result" and not rec["ok"]) or (rec["op"] == "restored" and rec["ok"]):
+                done.add(rec["seq"])
+        self._seq = max(self._seq, max(priors, default=0))
+        return [priors[seq] for seq in sorted(priors, reverse=True) if seq not in done]
+
+def journal_dir(backup_dir: Path) -> Path:
+    return Path(backup_dir) / "journal"
+
+def _journal_order(path: Path) -> Tuple[str, int]:
+    # "disable_<now_str()>[_<n>]": creation time from the name, then the same-second counter
+    rest = path.stem[len("disable_"):]
+    stamp, n = rest[:len("YYYY-mm-dd_HH-MM-SS")], rest[len("YYYY-mm-dd_HH-MM-SS_"):]
+    return stamp, int(n) if n.isdigit() else 1
+
+def latest_journal(backup_dir: Path) -> Optional[Path]:
+    """
+    Most recently created journal that still has something to restore. Ordered by
+    the name, not mtime: restoring appends to a journal and would bump it to the top.
+    """
+    for path in sorted(journal_dir(backup_dir).glob("disable_*.jsonl"), key=_journal_order, reverse=True):
+        if DisableJournal(path).pending():
+            return path
+    return None
+
+def disable_items(items: List[StartupItem], backup_dir: Path, journal: Optional[DisableJournal] = None,
+                  max_workers: int = 4, progress_cb=None) -> Tuple[DisableJournal, List[Tuple[StartupItem, bool, str]]]:
+    """
+    Disable items concurrently (off the caller's thread if run from a worker), writing
+    each item's prior state to the journal before touching it. An item whose state
+    can't be captured is left alone. Items of a serial_disable source go one at a time.
+    progress_cb(done, total) is called after each item. Returns (journal, results in item order).
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    journal = journal or DisableJournal.create(backup_dir)
+    locks = {src.name: threading.Lock() for src in STARTUP_SOURCES if src.serial_disable}
+    done = [0]
+    done_lock = threading.Lock()
+
+    def run(it: StartupItem) -> Tuple[StartupItem, bool, str]:
+        src = source_for_item(it)
+        if src is None:
+            ok, msg = False, "Unsupported item type."
+        else:
+            lock = locks.get(src.name)
+            if lock is not None:
+                lock.acquire()
+            try:
+                ok, msg = _disable_journaled(it, src, backup_dir, journal)
+            finally:
+                if lock is not None:
+                    lock.release()
+        with done_lock:
+            done[0] += 1
+            n = done[0]
+        if progress_cb:
+            progress_cb(n, len(items))
+        return it, ok, msg
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="disable") as pool:
+        results = list(pool.map(run, items))
+    return journal, results
 
-    # Startup folder removal (move to backup)
-    if item.source.startswith("StartupFolder:"):
+def _disable_journaled(it: StartupItem, src: StartupSource, backup_dir: Path,
+                       journal: DisableJournal) -> Tuple[bool, str]:
+    try:
+        state = src.snapshot(it, journal.store_dir)
+    except FileNotFoundError:
+        return False, "Not found (already removed?)."
+    except Exception as e:
+        return False, f"Could not record prior state, left unchanged: {e}"
+    if state is None:
+        return False, "No restore support for this item type, left unchanged."
+    seq = journal.prior(it, src, state)
+    try:
+        ok, msg = src.disable(it, backup_dir)
+    except Exception as e:
+        ok, msg = False, f"Disable failed: {e}"
+    journal.result(seq, ok, msg)
+    return ok, msg
+
+def restore_journal(path: Path) -> List[Tuple[Dict, bool, str]]:
+    """
+    Undo a disable batch: newest change first, each entry at most once. Entries whose
+    disable failed are skipped; ones without a result (interrupted batch) are restored
+    too, since the restore actions are safe to repeat.
+    Returns (item dict, success, message) per restored entry.
+    """
+    journal = DisableJournal(path)
+    results = []
+    for rec in journal.pending():
+        seq = rec["seq"]
+        it = StartupItem(**rec["item"])
+        src = next((s for s in STARTUP_SOURCES if s.name == rec["source"]), None)
+        if src is None:
+            ok, msg = False, f"Unknown source: {rec['source']}"
+        else:
+            try:
+                ok, msg = src.restore(it, rec["state"])
+            except Exception as e:
+                ok, msg = False, f"Restore failed: {e}"
+        journal.restored(seq, ok, msg)
+        results.append((rec["item"], ok, msg))
+    return results
+
+# -----------------------------
+# Enumeration cache
+# -----------------------------
+
+def _base_item_dict(it: StartupItem) -> Dict:
+    return {"name": it.name, "source": it.source, "command": it.command, "location": it.location, "enabled": it.enabled}
+
+class EnumerationCache:
+    """
+    On-disk cache of the last enumeration, one entry per source with its fingerprint.
+    Wrap sources with cached() before enumerating: unchanged sources are served from the
+    cache, changed ones are re-queried and diffed against the previous run.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else Path.home() / "StartupTracker_Cache" / "enumeration.json"
+        self.entries: Dict[str, Dict] = {}
+        self.added: List[StartupItem] = []
+        self.removed: List[Dict] = []
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self) -> None:
         try:
-            p = Path(item.location)
-            if not p.exists():
-                return False, "Startup file not found (already removed?)."
-
-            backup_dir.mkdir(parents=True, exist_ok=True)
-            dest = backup_dir / p.name
-            # Avoid overwrite
-            if dest.exists():
-                dest = backup_dir / f"{p.stem}_{now_str()}{p.suffix}"
-
-            shutil.move(str(p), str(dest))
-            return True, f"Moved startup file to backup: {dest}"
-        except PermissionError:
-            return False, "Permission denied. Try running as Administrator."
-        except Exception as e:
-            return False, f"File move failed: {e}"
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.entries = json.load(f).get("sources", {})
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        with self._lock:
+            doc = {"saved": time.time(), "sources": self.entries}
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(doc, f)
+        os.replace(tmp, self.path)
+
+    def cached(self, sources: List[StartupSource]) -> List[StartupSource]:
+        self.added, self.removed = [], []
+        return [CachedSource(src, self) for src in sources]
+
+    def _store(self, src: StartupSource, fingerprint, items: List[StartupItem]) -> None:
+        with self._lock:
+            prev = self.entries.get(src.name)
+            if prev is not None:
+                # Diff against the previous run by the usual (source, location) key
+                old = {(d["source"], d["location"]): d for d in prev["items"]}
+                new_keys = {item_key(it) for it in items}
+                self.added.extend(it for it in items if item_key(it) not in old)
+                self.removed.extend(d for k, d in old.items() if k not in new_keys)
+            self.entries[src.name] = {"fingerprint": fingerprint, "items": [_base_item_dict(it) for it in items]}
+
+class CachedSource(StartupSource):
+    """
+    Wraps a source so unchanged sources come from the EnumerationCache.
+    """
+
+    def __init__(self, inner: StartupSource, cache: EnumerationCache):
+        self.inner = inner
+        self.cache = cache
+        self.name = inner.name
+        self.prefixes = inner.prefixes
+        self.from_cache = False
+
+    def available(self) -> bool:
+        return self.inner.available()
 
-    # Scheduled task disable
-    if item.source == "TaskScheduler":
+    def fingerprint(self):
+        return self.inner.fingerprint()
+
+    def disable(self, item: StartupItem, backup_dir: Path) -> Tuple[bool, str]:
+        return self.inner.disable(item, backup_dir)
+
+    def enumerate(self) -> List[StartupItem]:
+        return [it for batch in self.iter_batches() for it in batch]
+
+    def iter_batches(self, batch_size: int = 200) -> Iterator[List[StartupItem]]:
         try:
-            # Disable task
-            cmd = ["schtasks", "/Change", "/TN", item.location, "/DISABLE"]
-            proc = subprocess.run(cmd, capture_output=True, text=True, check=False)
-            if proc.returncode == 0:
-                return True, f"Disabled scheduled task: {item.location}"
-            else:
-                msg = proc.stderr.strip() or proc.stdout.strip() or "Unknown error."
-                return False, f"Failed to disable task: {msg}"
-        except PermissionError:
-            return False, "Permission denied. Try running as Administrator."
-        except Exception as e:
-            return False, f"Task disable failed: {e}"
+            fp = self.inner.fingerprint()
+        except Exception:
+            fp = None
+        prev = self.cache.entries.get(self.name)
+        if fp is not None and prev is not None and prev.get("fingerprint") == json.loads(json.dumps(fp)):
+            self.from_cache = True
+            items = [item_from_dict(d) for d in prev["items"]]
+            if items:
+                yield items
+            return
 
-    return False, "Unsupported item type."
+        items: List[StartupItem] = []
+        for batch in self.inner.iter_batches(batch_size):
+            items.extend(batch)
+            yield batch
+        self.cache._store(self.inner, fp, items)
 
 # -----------------------------
 # Monitoring logic
 # -----------------------------
 
+def _proc_entry(info: Dict) -> Dict:
+    """
+    Turn psutil process info into the dict shape used for matching.
+    """
+    exe = info.get("exe") or ""
+    cmdline = " ".join(info.get("cmdline") or [])
+    return {
+        "pid": info["pid"],
+        "name": info.get("name") or "",
+        "exe": normalize_cmd(exe),
+        "cmd": normalize_cmd(cmdline),
+        "create_time": info.get("create_time") or 0.0,
+        "ppid": info.get("ppid"),
+    }
+
 def build_process_index() -> List[Dict]:
     """
     Snapshot current processes into dicts for matching.
     """
+    import psutil
     procs = []
-    for p in psutil.process_iter(attrs=["pid", "name", "exe", "cmdline"]):
+    for p in psutil.process_iter(attrs=["pid", "ppid", "name", "exe", "cmdline", "create_time"]):
         try:
-            info = p.info
-            exe = info.get("exe") or ""
-            cmdline = " ".join(info.get("cmdline") or [])
-            procs.append({
-                "pid": info["pid"],
-                "name": info.get("name") or "",
-                "exe": normalize_cmd(exe),
-                "cmd": normalize_cmd(cmdline),
-            })
+            procs.append(_proc_entry(p.info))
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             continue
         except Exception:
             continue
     return procs
 
+class ProcessTable:
+    """
+    Incremental process index.
+    Keeps the previous snapshot keyed by (pid, create_time) and only fetches
+    and normalizes attributes for PIDs that appeared since the last refresh,
+    so a refresh costs roughly as much as the process churn, not the process count.
+    A PID that exits and is reused between refreshes looks unchanged in the PID set,
+    so PIDs that matter (tracked, about to be matched) are passed as verify and their
+    create_time is re-read; a mismatch is reported as removed + added.
+    """
+
+    ATTRS = ["pid", "ppid", "name", "exe", "cmdline", "create_time"]
+
+    def __init__(self, source: Optional["ProcessSource"] = None):
+        self.source = source if source is not None else ProcessSampler()
+        self._entries: Dict[Tuple[int, float], Dict] = {}
+        self._key_by_pid: Dict[int, Tuple[int, float]] = {}
+        self._index: Optional[List[Dict]] = None
+
+    def refresh(self, verify: Iterable[int] = ()) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Sync with the live process table.
+        Returns (added, removed) entries.
+        """
+        live = self.source.pids()
+        known = set(self._key_by_pid)
+
+        gone = known - live
+        for pid in verify:
+            if pid in known and pid in live and not self._same_process(pid):
+                gone.add(pid)
+
+        removed = []
+        for pid in gone:
+            key = self._key_by_pid.pop(pid)
+            removed.append(self._entries.pop(key))
+
+        added = []
+        for pid in live - (known - gone):
+            info = self.source.info(pid)
+            if info is None:
+                continue
+            entry = _proc_entry(info)
+            key = (pid, entry["create_time"])
+            self._key_by_pid[pid] = key
+            self._entries[key] = entry
+            added.append(entry)
+
+        if added or removed:
+            self._index = None
+        return added, removed
+
+    def _same_process(self, pid: int) -> bool:
+        known_ct = self._key_by_pid[pid][1]
+        ct = self.source.create_time(pid)
+        # 0.0 / None: create_time unreadable (or the process just exited); not evidence of reuse
+        return not known_ct or not ct or ct == known_ct
+
+    def current(self, pid: int) -> bool:
+        """
+        True if pid is known and still the same process (re-reads its create_time).
+        """
+        return pid in self._key_by_pid and self._same_process(pid)
+
+    def get(self, pid: int) -> Optional[Dict]:
+        key = self._key_by_pid.get(pid)
+        return None if key is None else self._entries[key]
+
+    def snapshot(self) -> List[Dict]:
+        """
+        Current index in the same shape as build_process_index().
+        """
+        if self._index is None:
+            self._index = list(self._entries.values())
+        return self._index
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+class ProcessTree:
+    """
+    Attributes descendant processes to root PIDs (the matched process of each item).
+    Follows ppid links, maintained incrementally from ProcessTable.refresh() deltas.
+    A parent only counts if it was created no later than the child, so a recycled
+    PID can't adopt processes that aren't really its children.
+    """
+
+    def __init__(self):
+        self.entries: Dict[int, Dict] = {}      # pid -> live process entry
+        self.children: Dict[int, set] = {}      # ppid -> child pids
+        self.root_of: Dict[int, int] = {}       # attributed pid -> root pid (roots map to themselves)
+
+    @staticmethod
+    def _is_parent(parent: Optional[Dict], child: Dict) -> bool:
+        if parent is None:
+            return False
+        # create_time is 0.0 when it couldn't be read; don't reject on that
+        return not parent["create_time"] or not child["create_time"] or parent["create_time"] <= child["create_time"]
+
+    def update(self, added: List[Dict], removed: List[Dict]) -> List[Tuple[int, int]]:
+        """
+        Apply a ProcessTable delta. Returns (pid, root) for newly attributed processes.
+        Descendants stay attributed after their parent exits.
+        """
+        for e in removed:
+            pid = e["pid"]
+            if self.entries.get(pid) is e:
+                del self.entries[pid]
+                self.root_of.pop(pid, None)
+                siblings = self.children.get(e.get("ppid"))
+                if siblings is not None:
+                    siblings.discard(pid)
+                    if not siblings:
+                        del self.children[e.get("ppid")]
+
+        new = []
+        # Parents before children, so a whole new subtree is attributed in one pass
+        for e in sorted(added, key=lambda e: e["create_time"]):
+            pid, ppid = e["pid"], e.get("ppid")
+            self.entries[pid] = e
+            if ppid is None or ppid == pid:
+                continue
+            self.children.setdefault(ppid, set()).add(pid)
+            root = self.root_of.get(ppid)
+            if root is not None and pid not in self.root_of and self._is_parent(self.entries.get(ppid), e):
+                self.root_of[pid] = root
+                new.append((pid, root))
+        return new
+
+    def add_root(self, pid: int) -> List[int]:
+        """
+        Make pid a root and attribute its current descendants to it, including ones
+        previously attributed to another root. Other roots and their subtrees are left alone.
+        """
+        self.root_of[pid] = pid
+        out = []
+        stack = [pid]
+        while stack:
+            p = stack.pop()
+            parent = self.entries.get(p)
+            for c in self.children.get(p, ()):
+                if self.root_of.get(c) == c or not self._is_parent(parent, self.entries.get(c, {"create_time": 0.0})):
+                    continue
+                if self.root_of.get(c) != pid:
+                    self.root_of[c] = pid
+                    out.append(c)
+                stack.append(c)
+        return out
+
+    def descendants(self, root: int) -> List[int]:
+        return [p for p, r in self.root_of.items() if r == root and p != root]
+
+def _match_keys(item: StartupItem) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """
+    Patterns used to match an item against processes: (exe, cmd prefix, name).
+    Any of them can be None when the item doesn't qualify for that rule.
+    """
+    exe_guess = item.exe_guess or ""
+    cmd_norm = item.norm_cmd or ""
+    name_norm = normalize_cmd(item.name)
+
+    # Looks like a path: Windows exe/backslash, or an absolute POSIX path
+    exe_pat = exe_guess if exe_guess and (".exe" in exe_guess or "\\" in exe_guess or exe_guess.startswith("/")) else None
+    cmd_pat = cmd_norm[:20] if cmd_norm and len(cmd_norm) >= 6 else None
+    name_pat = name_norm if name_norm and len(name_norm) >= 3 else None
+    return exe_pat, cmd_pat, name_pat
+
+def _exe_base(exe: str) -> str:
+    return exe.replace("/", "\\").rsplit("\\", 1)[-1]
+
 def match_item_to_process(item: StartupItem, proc_index: List[Dict]) -> Optional[int]:
     """
     Best-effort match:
-    - If we can guess exe, try match exe substring
+    - If we can guess exe, try an exact exe (or exe file name) match, then exe substring
     - Else match by command substring
     - Else fallback by name match (item name)
+    Within a rule the first process in index order wins.
     """
-    exe_guess = item.exe_guess or ""
-    cmd_norm = item.norm_cmd or ""
-    name_norm = normalize_cmd(item.name)
+    exe_pat, cmd_pat, name_pat = _match_keys(item)
 
     # Prefer exact-ish exe match if it looks like a path
-    if exe_guess and (".exe" in exe_guess or "\\" in exe_guess):
+    if exe_pat:
+        # A bare file name (no directory) also matches exactly on the exe's file name
+        bare = "\\" not in exe_pat and "/" not in exe_pat
+        first_sub = None
         for pr in proc_index:
-            if pr["exe"] and exe_guess in pr["exe"]:
+            exe = pr["exe"]
+            if not exe or exe_pat not in exe:
+                continue
+            if exe == exe_pat or (bare and exe.endswith(exe_pat) and _exe_base(exe) == exe_pat):
                 return pr["pid"]
+            if first_sub is None:
+                first_sub = pr["pid"]
+        if first_sub is not None:
+            return first_sub
 
     # Try match by command text
-    if cmd_norm and len(cmd_norm) >= 6:
+    if cmd_pat:
         for pr in proc_index:
-            if pr["cmd"] and cmd_norm[:20] in pr["cmd"]:
+            if pr["cmd"] and cmd_pat in pr["cmd"]:
                 return pr["pid"]
 
     # Fallback by process name containing item name
-    if name_norm and len(name_norm) >= 3:
+    if name_pat:
         for pr in proc_index:
-            if name_norm in normalize_cmd(pr["name"]):
+            if name_pat in normalize_cmd(pr["name"]):
                 return pr["pid"]
 
     return None
 
-def monitor_items(items: List[StartupItem], duration_s: int, sample_interval: float, progress_cb=None) -> None:
+class AhoCorasick:
     """
-    Monitors CPU/mem for matched processes over duration window.
-    Writes results into each StartupItem.
+    Minimal Aho-Corasick automaton for finding many literal patterns in one pass over a text.
+    """
+
+    def __init__(self, patterns):
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.out: List[Tuple[str, ...]] = [()]
+
+        for pat in set(patterns):
+            if not pat:
+                continue
+            state = 0
+            for ch in pat:
+                nxt = self.goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[state][ch] = nxt
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.out.append(())
+                state = nxt
+            self.out[state] = self.out[state] + (pat,)
+
+        # Breadth-first pass to fill in failure links
+        todo = list(self.goto[0].values())
+        while todo:
+            nxt_todo = []
+            for state in todo:
+                for ch, child in self.goto[state].items():
+                    f = self.fail[state]
+                    while f and ch not in self.goto[f]:
+                        f = self.fail[f]
+                    self.fail[child] = self.goto[f].get(ch, 0)
+                    self.out[child] = self.out[child] + self.out[self.fail[child]]
+                    nxt_todo.append(child)
+            todo = nxt_todo
+
+    def __bool__(self) -> bool:
+        return len(self.goto) > 1
+
+    def find(self, text: str) -> List[str]:
+        """
+        Return every pattern that occurs in text (possibly with repeats).
+        """
+        goto, fail, out = self.goto, self.fail, self.out
+        found = []
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                found.extend(out[state])
+        return found
+
+class _MatchPatterns:
+    """
+    exe / cmd / name patterns of a set of items, compiled once (exact exe sets plus
+    Aho-Corasick automatons) and then scanned against any number of process batches.
+    """
+
+    def __init__(self, keys: List[Tuple[Optional[str], Optional[str], Optional[str]]]):
+        self.exe = {k[0] for k in keys if k[0]}
+        cmd = {k[1] for k in keys if k[1]}
+        name = {k[2] for k in keys if k[2]}
+        self.exe_bare = {p for p in self.exe if "\\" not in p and "/" not in p}
+        self.exe_ac, self.cmd_ac, self.name_ac = AhoCorasick(self.exe), AhoCorasick(cmd), AhoCorasick(name)
+        self.total = len(self.exe) + len(cmd) + len(name)
+
+    def scan(self, procs: List[Dict]) -> Tuple[Dict[str, int], Dict[str, int], Dict[str, int]]:
+        """
+        (exe, cmd, name) hits: pattern -> pid of the first process in procs matching it.
+        For exe patterns an exact match anywhere in procs beats an earlier substring
+        match, same as match_item_to_process.
+        """
+        exe_hits: Dict[str, int] = {}
+        if self.exe:
+            for pr in procs:
+                exe = pr["exe"]
+                if not exe:
+                    continue
+                if exe in self.exe:
+                    exe_hits.setdefault(exe, pr["pid"])
+                if self.exe_bare:
+                    base = _exe_base(exe)
+                    if base in self.exe_bare:
+                        exe_hits.setdefault(base, pr["pid"])
+
+        exe_ac, cmd_ac, name_ac = self.exe_ac, self.cmd_ac, self.name_ac
+        cmd_hits: Dict[str, int] = {}
+        name_hits: Dict[str, int] = {}
+        remaining = self.total - len(exe_hits)
+
+        # Single pass; first process (in batch order) containing a pattern wins
+        for pr in procs:
+            if not remaining:
+                break
+            pid = pr["pid"]
+            if exe_ac and pr["exe"]:
+                for pat in exe_ac.find(pr["exe"]):
+                    if pat not in exe_hits:
+                        exe_hits[pat] = pid
+                        remaining -= 1
+            if cmd_ac and pr["cmd"]:
+                for pat in cmd_ac.find(pr["cmd"]):
+                    if pat not in cmd_hits:
+                        cmd_hits[pat] = pid
+                        remaining -= 1
+            if name_ac and pr["name"]:
+                for pat in name_ac.find(normalize_cmd(pr["name"])):
+                    if pat not in name_hits:
+                        name_hits[pat] = pid
+                        remaining -= 1
+        return exe_hits, cmd_hits, name_hits
+
+    @staticmethod
+    def resolve(keys, hits) -> List[Optional[int]]:
+        exe_hits, cmd_hits, name_hits = hits
+        results: List[Optional[int]] = []
+        for exe_pat, cmd_pat, name_pat in keys:
+            pid = exe_hits.get(exe_pat) if exe_pat else None
+            if pid is None and cmd_pat:
+                pid = cmd_hits.get(cmd_pat)
+            if pid is None and name_pat:
+                pid = name_hits.get(name_pat)
+            results.append(pid)
+        return results
+
+class MatcherIndex:
+    """
+    Matcher over one process snapshot.
+    Resolves all pending items in a single pass over the processes instead of
+    scanning the process list once per item and rule like match_item_to_process,
+    with the same results.
+    """
+
+    def __init__(self, proc_index: List[Dict]):
+        self.proc_index = proc_index
+
+    def match_all(self, items: List[StartupItem]) -> List[Optional[int]]:
+        """
+        Match every item at once. Returns PIDs in the same order as items.
+        """
+        keys = [_match_keys(it) for it in items]
+        return _MatchPatterns.resolve(keys, _MatchPatterns(keys).scan(self.proc_index))
+
+class PendingMatcher:
+    """
+    Matches pending items against a ProcessTable across ticks, for monitor_items.
+    The compiled patterns are kept between ticks and only the processes a refresh
+    added are scanned, so matching costs as much as the churn. An item seen for the
+    first time (or after reset()) gets one scan of the whole snapshot. Processes that
+    were there before didn't match (or the item wouldn't be pending), so the result is
+    the same as MatcherIndex over the full snapshot.
+    """
+
+    def __init__(self):
+        self._keys: Dict[int, Tuple[Optional[str], Optional[str], Optional[str]]] = {}  # id(item) -> keys
+        self._patterns: Optional[_MatchPatterns] = None
+
+    def match(self, pending: List[StartupItem], proc_index: List[Dict],
+              added: List[Dict]) -> List[Optional[int]]:
+        """
+        PIDs for pending (same order), given the current snapshot and the entries
+        added to it since the previous call.
+        """
+        new = [it for it in pending if id(it) not in self._keys]
+        full_hits = None
+        if new:
+            new_keys = [_match_keys(it) for it in new]
+            for it, k in zip(new, new_keys):
+                self._keys[id(it)] = k
+            full_hits = _MatchPatterns(new_keys).scan(proc_index)
+            self._patterns = _MatchPatterns([self._keys[id(it)] for it in pending])
+        new_ids = {id(it) for it in new}
+        old_keys = [self._keys[id(it)] for it in pending if id(it) not in new_ids]
+
+        added_hits = self._patterns.scan(added) if old_keys and added else ({}, {}, {})
+        old_res = iter(_MatchPatterns.resolve(old_keys, added_hits))
+        new_res = iter(_MatchPatterns.resolve([self._keys[id(it)] for it in new], full_hits) if new else [])
+        return [next(new_res) if id(it) in new_ids else next(old_res) for it in pending]
+
+    def reset(self, it: StartupItem) -> None:
+        """
+        The PID matched for it couldn't be used (exited, or the entry was stale):
+        scan the whole snapshot for it again next call, since other processes
+        that were already running may match it too.
+        """
+        self._keys.pop(id(it), None)
+
+class SampleSeries:
+    """
+    Fixed-capacity ring buffer of samples for one process, one typed array per column.
+    Once full, the oldest samples are overwritten so memory stays bounded for long windows.
+    """
+
+    # column name -> array typecode
+    COLUMNS = {
+        "ts": "d",           # seconds since monitoring started
+        "cpu": "d",          # cpu_percent
+        "rss": "Q",          # bytes
+        "read_bytes": "Q",   # cumulative io_counters
+        "write_bytes": "Q",
+        "threads": "I",
+        "read_ops": "Q",     # cumulative io_counters read/write counts
+        "write_ops": "Q",
+        "handles": "I",      # num_handles (Windows) / num_fds
+        "page_faults": "Q",  # cumulative
+    }
+
+    def __init__(self, capacity: int):
+        self.capacity = max(1, capacity)
+        self.cols: Dict[str, array] = {
+            name: array(code, [0]) * self.capacity for name, code in self.COLUMNS.items()
+        }
+        self.head = 0   # next slot to write
+        self.count = 0  # valid samples (<= capacity)
+        self.total = 0  # samples ever appended
+
+    def append(self, ts: float, cpu: float, rss: int, read_bytes: int = 0, write_bytes: int = 0, threads: int = 0,
+               read_ops: int = 0, write_ops: int = 0, handles: int = 0, page_faults: int = 0) -> None:
+        i = self.head
+        cols = self.cols
+        cols["ts"][i] = ts
+        cols["cpu"][i] = cpu
+        cols["rss"][i] = rss
+        cols["read_bytes"][i] = read_bytes
+        cols["write_bytes"][i] = write_bytes
+        cols["threads"][i] = threads
+        cols["read_ops"][i] = read_ops
+        cols["write_ops"][i] = write_ops
+        cols["handles"][i] = handles
+        cols["page_faults"][i] = page_faults
+        self.head = (i + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+        self.total += 1
+
+    @classmethod
+    def from_columns(cls, cols: Dict[str, List]) -> "SampleSeries":
+        """
+        Rebuild a series from column lists (as written by save_capture).
+        """
+        n = len(cols.get("ts", []))
+        series = cls(n)
+        for name in cls.COLUMNS:
+            vals = cols.get(name) or [0] * n
+            series.cols[name][:n] = array(cls.COLUMNS[name], vals)
+        series.count = series.total = n
+        series.head = 0
+        return series
+
+    def __len__(self) -> int:
+        return self.count
+
+    def column(self, name: str) -> List:
+        """
+        Retained values of one column, oldest first.
+        """
+        col = self.cols[name]
+        if self.count < self.capacity:
+            return col[:self.count].tolist()
+        return col[self.head:].tolist() + col[:self.head].tolist()
+
+# Order of the stat tuple a sampler returns per process (SampleSeries columns after ts)
+SAMPLE_FIELDS = tuple(name for name in SampleSeries.COLUMNS if name != "ts")
+
+def _percentile(sorted_vals: List[float], q: float) -> float:
+    """
+    Linear-interpolated percentile (q in 0..100) of an already sorted list.
+    """
+    if not sorted_vals:
+        return 0.0
+    pos = (len(sorted_vals) - 1) * q / 100.0
+    lo = int(pos)
+    hi = min(lo + 1, len(sorted_vals) - 1)
+    return sorted_vals[lo] + (sorted_vals[hi] - sorted_vals[lo]) * (pos - lo)
+
+# CPU% (whole process tree) below which an item counts as settled
+IDLE_CPU_PCT = 2.0
+
+def time_to_idle(series: SampleSeries, create_time: float, start_wall: float, idle_cpu: float = IDLE_CPU_PCT) -> Optional[float]:
+    """
+    Seconds from process creation until its CPU% stays below idle_cpu for the rest of the series.
+    None if it never settled. start_wall is the wall-clock time of series ts == 0.
+    """
+    ts = series.column("ts")
+    cpu = series.column("cpu")
+    if not ts:
+        return None
+    settled_at = None
+    for t, c in zip(reversed(ts), reversed(cpu)):
+        if c >= idle_cpu:
+            break
+        settled_at = t
+    if settled_at is None:
+        return None
+    # The first sample covers the time since tracking began, so an already-idle
+    # process is reported as idle at its first sample.
+    return max(0.0, start_wall + settled_at - create_time)
+
+def series_stats(series: SampleSeries) -> Dict[str, float]:
+    """
+    Avg/peak/percentiles over the retained samples, one pass per column.
+    """
+    if not len(series):
+        return {}
+    cpu = sorted(series.column("cpu"))
+    rss = sorted(series.column("rss"))
+    n = len(cpu)
+    return {
+        "avg_cpu": sum(cpu) / n,
+        "peak_cpu": cpu[-1],
+        "p50_cpu": _percentile(cpu, 50),
+        "p95_cpu": _percentile(cpu, 95),
+        "p99_cpu": _percentile(cpu, 99),
+        "avg_mem": sum(rss) / n,
+        "peak_mem": rss[-1],
+        "p95_mem": _percentile(rss, 95),
+        "peak_threads": max(series.column("threads")),
+        "peak_handles": max(series.column("handles")),
+    }
+
+def cpu_seconds(parts: List[SampleSeries]) -> float:
+    """
+    CPU time used by one process or a process tree, integrated from the samples:
+    each cpu_percent reading covers the gap since the previous sample of that process.
+    A process's first sample has no known gap and is left out.
+    """
+    total = 0.0
+    for s in parts:
+        ts = s.column("ts")
+        cpu = s.column("cpu")
+        for i in range(1, len(ts)):
+            total += cpu[i] / 100.0 * (ts[i] - ts[i - 1])
+    return total
+
+# Weights that put disk I/O and time-to-idle on the CPU-seconds scale
+IMPACT_DISK_MB_PER_CPU_S = 50.0  # this much disk I/O weighs as much as one CPU-second
+IMPACT_PER_BUSY_S = 0.1          # per second the item takes to settle after launch
+
+def impact_score(cpu_s: float, disk_mb: float, settle_s: Optional[float]) -> float:
+    """
+    Single number for ranking startup items, in CPU-second equivalents:
+    CPU-seconds + disk MB / IMPACT_DISK_MB_PER_CPU_S + IMPACT_PER_BUSY_S * seconds to settle.
+    """
+    return cpu_s + disk_mb / IMPACT_DISK_MB_PER_CPU_S + IMPACT_PER_BUSY_S * (settle_s or 0.0)
+
+def counter_rates(series: SampleSeries, name: str) -> List[Tuple[float, float]]:
+    """
+    (ts, units per second) between consecutive samples of a cumulative counter column.
+    A counter going backwards (e.g. unreadable that tick) counts as no activity.
+    """
+    ts = series.column("ts")
+    vals = series.column(name)
+    out = []
+    for i in range(1, len(ts)):
+        dt = ts[i] - ts[i - 1]
+        if dt > 0:
+            out.append((ts[i], max(0, vals[i] - vals[i - 1]) / dt))
+    return out
+
+def io_stats(parts: List[SampleSeries]) -> Dict[str, float]:
+    """
+    Disk throughput, I/O ops and page-fault rates for one process or a whole process tree.
+    Counters are cumulative per process, so rates are taken per process first and then
+    summed per tick; a process appearing or exiting doesn't show up as a jump.
+    """
+    disk: Dict[float, float] = {}
+    ops: Dict[float, float] = {}
+    faults: Dict[float, float] = {}
+    read_total = write_total = 0
+    for s in parts:
+        if not len(s):
+            continue
+        rb = s.column("read_bytes")
+        wb = s.column("write_bytes")
+        read_total += max(0, rb[-1] - rb[0])
+        write_total += max(0, wb[-1] - wb[0])
+        for name, acc in (("read_bytes", disk), ("write_bytes", disk), ("read_ops", ops),
+                          ("write_ops", ops), ("page_faults", faults)):
+            for t, r in counter_rates(s, name):
+                acc[t] = acc.get(t, 0.0) + r
+
+    def avg(d):
+        return sum(d.values()) / len(d) if d else 0.0
+
+    return {
+        "avg_disk_bps": avg(disk),
+        "peak_disk_bps": max(disk.values()) if disk else 0.0,
+        "read_bytes": read_total,
+        "write_bytes": write_total,
+        "avg_io_ops_s": avg(ops),
+        "avg_page_faults_s": avg(faults),
+    }
+
+def rollup_series(parts: List[SampleSeries]) -> SampleSeries:
+    """
+    Sum several per-process series into one, tick by tick. Processes sampled in
+    the same tick share the exact same ts, so samples are grouped on it.
+    """
+    if len(parts) == 1:
+        return parts[0]
+    names = [n for n in SampleSeries.COLUMNS if n != "ts"]
+    totals: Dict[float, List] = {}
+    for s in parts:
+        cols = [s.column(n) for n in names]
+        for i, t in enumerate(s.column("ts")):
+            row = totals.get(t)
+            if row is None:
+                totals[t] = [c[i] for c in cols]
+            else:
+                for j, c in enumerate(cols):
+                    row[j] += c[i]
+    ts = sorted(totals)
+    out = {"ts": ts}
+    for j, n in enumerate(names):
+        out[n] = [totals[t][j] for t in ts]
+    return SampleSeries.from_columns(out)
+
+class SampleStore:
+    """
+    Columnar per-PID sample storage used by monitor_items.
+    Series are kept after a process exits so they can still be finalized.
+    series holds the current process of each PID; when a PID is reused by another
+    process, forget() (or tracking the PID again after it retired) moves the old
+    series to exited.
+    """
+
+    def __init__(self, capacity: int = 4096, sample_interval: float = 1.0):
+        self.capacity = capacity
+        self.sample_interval = sample_interval
+        self.series: Dict[int, SampleSeries] = {}
+        self.exited: List[Tuple[int, SampleSeries]] = []  # series of processes whose PID was closed
+        self.live: set = set()
+        self.start_wall = time.time()  # wall clock at ts == 0, to line up with process create_time
+        self.tick_ts = array("d")  # start of each sampling tick, seconds since monitoring started
+        self.tick_lateness = array("d")  # seconds each tick started after its deadline
+        self.missed_ticks = 0
+        self.resumed_ticks: set = set()  # indexes into tick_ts of the first tick after a pause
+        self.paused_s = 0.0
+        self.cancelled = False
+
+    def track(self, pid: int) -> SampleSeries:
+        """
+        Series for a PID being sampled. A PID that isn't live any more is taken to be
+        a new process: its old series moves to exited and a fresh one is started.
+        """
+        if pid not in self.live:
+            self.forget(pid)
+            self.series[pid] = SampleSeries(self.capacity)
+            self.live.add(pid)
+        return self.series[pid]
+
+    def retire(self, pid: int) -> None:
+        """
+        Stop sampling a PID (process exited) but keep its samples.
+        """
+        self.live.discard(pid)
+
+    def forget(self, pid: int) -> None:
+        """
+        The PID now belongs to a different process: keep the old samples under
+        exited, and let a later track(pid) start a new series.
+        """
+        self.live.discard(pid)
+        series = self.series.pop(pid, None)
+        if series is not None:
+            self.exited.append((pid, series))
+
+    def all_series(self) -> List[Tuple[int, SampleSeries]]:
+        return self.exited + list(self.series.items())
+
+    def append(self, pid: int, *sample) -> None:
+        self.series[pid].append(*sample)
+
+    def timing(self) -> Dict[str, float]:
+        """
+        Achieved sample rate and jitter of tick intervals vs the requested interval.
+        """
+        ts = self.tick_ts
+        late = self.tick_lateness
+        report = {
+            "ticks": len(ts),
+            "missed_ticks": self.missed_ticks,
+            "mean_lateness": sum(late) / len(late) if late else 0.0,
+            "max_lateness": max(late) if late else 0.0,
+            "paused_s": self.paused_s,
+            "cancelled": self.cancelled,
+        }
+        # Gaps that span a pause aren't sampling jitter
+        gaps = [ts[i] - ts[i - 1] for i in range(1, len(ts)) if i not in self.resumed_ticks]
+        if not gaps:
+            report.update(rate_hz=0.0, mean_interval=0.0, jitter=0.0, max_interval=0.0)
+            return report
+        dev = [g - self.sample_interval for g in gaps]
+        report.update(
+            rate_hz=len(gaps) / sum(gaps),
+            mean_interval=sum(gaps) / len(gaps),
+            jitter=(sum(d * d for d in dev) / len(dev)) ** 0.5,  # RMS deviation from requested
+            max_interval=max(gaps),
+        )
+        return report
+
+class ProcessGone(Exception):
+    """
+    Sample result for a process that exited (or is a zombie).
+    """
+
+class ProcessDenied(Exception):
+    """
+    Sample result for a process whose stats can't be read.
     """
-    # Prepare per-item tracking
-    tracked: Dict[int, Dict] = {}  # pid -> stats
-    pid_to_item: Dict[int, StartupItem] = {}
 
-    start = time.time()
-    end = start + duration_s
+class ProcessSource(ABC):
+    """
+    Where monitor_items gets its process table, samples and clock from.
+    ProcessSampler is the live psutil source. TraceRecorder, TraceReplaySource and
+    SimulatedProcessSource record a run, and replay or simulate one faster than real time.
+    sample() maps pid -> stat tuple (fields in SAMPLE_FIELDS order), or a
+    ProcessGone / ProcessDenied / other exception instance for that pid.
+    Subclasses must implement pids, info, track and sample; the rest have defaults.
+    """
+
+    realtime = True  # False: clock() is virtual and sleep() just advances it
+
+    def clock(self) -> int:
+        return time.monotonic_ns()
+
+    def sleep(self, seconds: float) -> None:
+        time.sleep(seconds)
+
+    def wall(self) -> float:
+        return time.time()
+
+    @abstractmethod
+    def pids(self) -> set:
+        ...
+
+    @abstractmethod
+    def info(self, pid: int) -> Optional[Dict]:
+        """
+        psutil-style info dict with ProcessTable.ATTRS, or None if the process is gone.
+        """
 
-    # Prime cpu_percent for existing processes
-    for p in psutil.process_iter():
+    def create_time(self, pid: int) -> Optional[float]:
+        """
+        Current create_time of pid, None if it's gone. Tells a reused PID apart
+        from the process seen before.
+        """
+        info = self.info(pid)
+        return None if info is None else info.get("create_time")
+
+    @abstractmethod
+    def track(self, pid: int) -> bool:
+        """
+        Start sampling pid (idempotent). False if the process is gone.
+        """
+
+    def untrack(self, pid: int) -> None:
+        pass
+
+    @abstractmethod
+    def sample(self, pids) -> Dict[int, object]:
+        ...
+
+    def close(self) -> None:
+        pass
+
+class ProcessSampler(ProcessSource):
+    """
+    Live process source on psutil.
+    Process handles are cached across ticks (cpu_percent needs the same object
+    between calls), each read is done inside oneshot(), and with workers > 1
+    reads are fanned out over a bounded thread pool.
+    """
+
+    def __init__(self, workers: int = 1):
+        self.workers = max(1, workers)
+        self.handles: Dict[int, "psutil.Process"] = {}
+        self._pool = None
+        if self.workers > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="sampler")
+
+    def pids(self) -> set:
+        import psutil
+        return set(psutil.pids())
+
+    def info(self, pid: int) -> Optional[Dict]:
+        import psutil
         try:
-            p.cpu_percent(interval=None)
+            return psutil.Process(pid).as_dict(attrs=ProcessTable.ATTRS, ad_value=None)
+        except Exception:
+            return None
+
+    def create_time(self, pid: int) -> Optional[float]:
+        import psutil
+        try:
+            # A fresh Process object; a cached handle keeps the create_time it was made with
+            return psutil.Process(pid).create_time()
         except Exception:
+            return None
+
+    def track(self, pid: int) -> bool:
+        """
+        Cache a handle for pid and prime cpu_percent. False if the process is gone.
+        """
+        import psutil
+        if pid in self.handles:
+            return True
+        try:
+            p = psutil.Process(pid)
+            p.cpu_percent(interval=None)
+        except (psutil.NoSuchProcess, psutil.ZombieProcess):
+            return False
+        except psutil.AccessDenied:
             pass
+        self.handles[pid] = p
+        return True
+
+    def untrack(self, pid: int) -> None:
+        self.handles.pop(pid, None)
+
+    @staticmethod
+    def _read(p: "psutil.Process"):
+        import psutil
+        try:
+            with p.oneshot():
+                cpu = p.cpu_percent(interval=None)  # percent since last call
+                mem = p.memory_info()
+                try:
+                    io = p.io_counters()
+                    read_bytes, write_bytes = io.read_bytes, io.write_bytes
+                    read_ops, write_ops = io.read_count, io.write_count
+                except (AttributeError, psutil.AccessDenied):
+                    # io_counters isn't available on every platform
+                    read_bytes = write_bytes = read_ops = write_ops = 0
+                threads = p.num_threads()
+                try:
+                    handles = p.num_handles() if hasattr(p, "num_handles") else p.num_fds()
+                except psutil.AccessDenied:
+                    handles = 0
+                faults = ProcessSampler._page_faults(p.pid, mem)
+            return (cpu, mem.rss, read_bytes, write_bytes, threads, read_ops, write_ops, handles, faults)
+        except (psutil.NoSuchProcess, psutil.ZombieProcess):
+            return ProcessGone(p.pid)
+        except psutil.AccessDenied:
+            return ProcessDenied(p.pid)
+        except Exception as e:
+            return e
+
+    @staticmethod
+    def _page_faults(pid: int, mem) -> int:
+        """
+        Cumulative page faults: from memory_info() on Windows (num_page_faults) and
+        macOS (pfaults); on Linux psutil doesn't expose them, so minflt + majflt are
+        read from /proc/<pid>/stat.
+        """
+        n = getattr(mem, "num_page_faults", None)
+        if n is None:
+            n = getattr(mem, "pfaults", None)
+        if n is None and sys.platform.startswith("linux"):
+            try:
+                with open(f"/proc/{pid}/stat", "rb") as f:
+                    # Fields after "(comm)"; minflt and majflt are fields 10 and 12
+                    fields = f.read().rsplit(b")", 1)[1].split()
+                n = int(fields[7]) + int(fields[9])
+            except (OSError, IndexError, ValueError):
+                n = 0
+        return n or 0
+
+    def sample(self, pids) -> Dict[int, object]:
+        """
+        Sample the given PIDs. Values are stat tuples, or the exception for that PID.
+        """
+        handles = [(pid, self.handles[pid]) for pid in pids if pid in self.handles]
+        if self._pool is None or len(handles) < 2:
+            return {pid: self._read(p) for pid, p in handles}
+        results = self._pool.map(self._read, [p for _, p in handles])
+        return {pid: res for (pid, _), res in zip(handles, results)}
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
+class TickScheduler:
+    """
+    Drift-free sampling clock on time.monotonic_ns().
+    Ticks aim at absolute deadlines start + k * interval, so an overrunning tick
+    doesn't push every later tick back. Missed deadlines are handled by policy:
+    - "coalesce": fire once right away for all missed ticks, then continue on the grid
+    - "skip": drop missed ticks and wait for the next deadline still in the future
+    The lateness of each tick (actual start - deadline) is recorded in seconds.
+    """
+
+    POLICIES = ("coalesce", "skip")
+
+    def __init__(self, interval_s: float, duration_s: float, policy: str = "coalesce",
+                 clock=time.monotonic_ns, sleep=time.sleep):
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown missed-tick policy: {policy}")
+        self.interval_ns = max(1, int(interval_s * 1e9))
+        self.duration_ns = int(duration_s * 1e9)
+        self.policy = policy
+        self.clock = clock
+        self.sleep = sleep
+        self.start_ns = clock()
+        self.k = -1  # index of the current tick on the deadline grid
+        self.missed = 0
+        self.paused_ns = 0  # time spent paused; doesn't count towards duration
+        self.lateness = array("d")
+
+    def elapsed(self) -> float:
+        return (self.clock() - self.start_ns) / 1e9
+
+    def active_elapsed(self) -> float:
+        return (self.clock() - self.start_ns - self.paused_ns) / 1e9
+
+    def resume_after(self, paused_ns: int) -> None:
+        """
+        Account for a pause: extend the window by its length and continue from the
+        next deadline on the grid, without counting the paused-over ticks as missed.
+        """
+        self.paused_ns += paused_ns
+        self.k = max(self.k, (self.clock() - self.start_ns) // self.interval_ns)
+
+    def wait(self) -> bool:
+        """
+        Block until the next tick deadline. False once the window is over.
+        """
+        k = self.k + 1
+        now = self.clock()
+        behind = (now - self.start_ns) // self.interval_ns  # last deadline already passed
+        if behind > k:
+            if self.policy == "skip":
+                self.missed += behind - k + 1
+                k = behind + 1
+            else:
+                self.missed += behind - k
+                k = behind
+
+        deadline = self.start_ns + k * self.interval_ns
+        if deadline - self.start_ns - self.paused_ns >= self.duration_ns:
+            return False
+        if now < deadline:
+            self.sleep((deadline - now) / 1e9)
+            now = self.clock()
+
+        self.k = k
+        self.lateness.append(max(0, now - deadline) / 1e9)
+        return True
+
+class MonitorControl:
+    """
+    Cooperative stop/pause for a monitor_items run; the methods are safe to call from
+    any thread. stop() also interrupts the sleep between ticks, so a run ends right
+    away instead of after up to one sample interval. Paused time doesn't count
+    towards the monitoring window; it is measured from the pause() call, although
+    the run only stops sampling at the next tick.
+    """
+
+    def __init__(self, clock=time.monotonic_ns):
+        self._stop = threading.Event()
+        self._running = threading.Event()
+        self._running.set()
+        self.clock = clock
+        self.paused_at: Optional[int] = None  # clock() at the last pause()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._running.set()  # release a paused run so it can finish
+
+    def pause(self) -> None:
+        if not self._stop.is_set() and self._running.is_set():
+            self.paused_at = self.clock()
+            self._running.clear()
+
+    def resume(self) -> None:
+        self._running.set()
+
+    @property
+    def stopped(self) -> bool:
+        return self._stop.is_set()
+
+    @property
+    def paused(self) -> bool:
+        return not self._running.is_set()
+
+    def sleep(self, seconds: float) -> None:
+        # TickScheduler's sleep; returns early on stop()
+        self._stop.wait(seconds)
+
+    def wait_while_paused(self) -> None:
+        self._running.wait()
+
+def monitor_items(items: List[StartupItem], duration_s: int, sample_interval: float, progress_cb=None,
+                  workers: int = 1, missed_tick_policy: str = "coalesce", sample_cb=None,
+                  control: Optional[MonitorControl] = None, follow_children: bool = True,
+                  source: Optional[ProcessSource] = None) -> SampleStore:
+    """
+    Monitors CPU/mem for matched processes over duration window.
+    Writes results into each StartupItem and returns the per-PID sample store.
+    workers > 1 samples tracked processes in parallel on a thread pool.
+    missed_tick_policy is passed to TickScheduler ("coalesce" or "skip").
+    sample_cb(ts, rows) is called every tick with rows of (item, pid, sample tuple).
+    control (MonitorControl) lets another thread pause or stop the run; on stop the
+    samples taken so far are still finalized into the items.
+    follow_children rolls descendants of each matched process (launchers, helpers)
+    up into the item's stats; sample_cb then also gets rows for those child PIDs.
+    source replaces the live psutil process table (see ProcessSource); a source with
+    a virtual clock runs the whole window as fast as it can be computed. A source
+    passed in is left open for the caller to close.
+    """
+    # Prepare per-item tracking
+    # Enough room for the whole window at the requested rate, capped for very long runs
+    capacity = min(int(duration_s / max(sample_interval, 0.01)) + 2, 100_000)
+    store = SampleStore(capacity, sample_interval)
+    sampler = source if source is not None else ProcessSampler(workers)
+    pid_to_item: Dict[int, StartupItem] = {}
+
+    sleep = control.sleep if control is not None and sampler.realtime else sampler.sleep
+    sched = TickScheduler(sample_interval, duration_s, missed_tick_policy, clock=sampler.clock, sleep=sleep)
+    store.start_wall = sampler.wall()
+
+    # cpu_percent is primed per process when the sampler starts tracking it
 
     # Sampling loop
     samples_taken = 0
-    while time.time() < end:
-        t = time.time()
-
-        # rebuild index occasionally for processes that appear after monitoring starts
-        proc_index = build_process_index()
+    proc_table = ProcessTable(sampler)
+    matcher = PendingMatcher()
+    tree = ProcessTree()
+    # id(series) -> (item, process entry); series outlive their PID if it's reused
+    owner: Dict[int, Tuple[StartupItem, Dict]] = {}
+    suspect: set = set()  # matched PIDs whose create_time didn't agree with the table
+
+    def attach(pid: int, it: StartupItem) -> Optional[SampleSeries]:
+        if not sampler.track(pid):
+            return None
+        series = store.track(pid)
+        pid_to_item[pid] = it
+        owner[id(series)] = (it, tree.entries.get(pid) or proc_table.get(pid) or {})
+        return series
+
+    while sched.wait():
+        if control is not None:
+            if control.paused and not control.stopped:
+                t0 = sched.clock()
+                if sampler.realtime and control.paused_at is not None:
+                    # Count from the pause() call, not from this tick boundary
+                    t0 = min(t0, control.paused_at)
+                control.wait_while_paused()
+                sched.resume_after(sched.clock() - t0)
+                store.resumed_ticks.add(len(store.tick_ts))
+                if not control.stopped:
+                    continue  # sample again on the next grid deadline
+            if control.stopped:
+                store.cancelled = True
+                break
+        ts = sched.elapsed()
+
+        # pick up processes that appear after monitoring starts (only new PIDs are fetched);
+        # tracked PIDs are re-checked so a reused PID isn't sampled as the old process
+        added, removed = proc_table.refresh(verify=set(pid_to_item) | suspect)
+        suspect.clear()
+        for e in removed:
+            pid = e["pid"]
+            if pid in pid_to_item:
+                # The tracked process has exited (its PID may already belong to another
+                # one): close its series so a later track(pid) doesn't append to it
+                store.forget(pid)
+                sampler.untrack(pid)
+                del pid_to_item[pid]
+        proc_index = proc_table.snapshot()
+        if follow_children:
+            for pid, root in tree.update(added, removed):
+                if root in pid_to_item:
+                    attach(pid, pid_to_item[root])
 
         # match items that don't have a pid yet
-        for it in items:
-            if not it.enabled:
-                continue
-            if it.matched_pid is None:
-                pid = match_item_to_process(it, proc_index)
+        pending = [it for it in items if it.enabled and it.result.matched_pid is None]
+        if pending:
+            matches = matcher.match(pending, proc_index, added)
+            for it, pid in zip(pending, matches):
                 if pid is not None:
-                    it.matched_pid = pid
-                    # Get name if possible
-                    try:
-                        it.matched_proc_name = psutil.Process(pid).name()
-                    except Exception:
-                        it.matched_proc_name = None
-
-                    tracked[pid] = {
-                        "cpu_sum": 0.0,
-                        "cpu_peak": 0.0,
-                        "mem_sum": 0.0,
-                        "mem_peak": 0.0,
-                        "n": 0
-                    }
-                    pid_to_item[pid] = it
+                    if not proc_table.current(pid):
+                        suspect.add(pid)  # entry is stale; refreshed and re-matched next tick
+                        matcher.reset(it)
+                        continue
+                    series = attach(pid, it)
+                    if series is None:
+                        matcher.reset(it)  # exited already; full re-match next tick
+                        continue
+                    entry = proc_table.get(pid) or {}
+                    it.result.matched_pid = pid
+                    it.result.matched_proc_name = entry.get("name") or None
+                    it.result.proc_create_time = entry.get("create_time") or None
+                    it.result.series = series
+                    if follow_children:
+                        # Children already running when the item matched
+                        for child in tree.add_root(pid):
+                            attach(child, it)
 
         # sample tracked pids
         dead_pids = []
-        for pid, st in list(tracked.items()):
-            try:
-                p = psutil.Process(pid)
-                cpu = p.cpu_percent(interval=None)  # percent since last call
-                mem = p.memory_info().rss
-
-                st["cpu_sum"] += cpu
-                st["cpu_peak"] = max(st["cpu_peak"], cpu)
-                st["mem_sum"] += mem
-                st["mem_peak"] = max(st["mem_peak"], mem)
-                st["n"] += 1
-            except (psutil.NoSuchProcess, psutil.ZombieProcess):
+        rows = []
+        store.tick_ts.append(ts)
+        for pid, res in sampler.sample(store.live).items():
+            if isinstance(res, ProcessGone):
                 dead_pids.append(pid)
-            except psutil.AccessDenied:
+            elif isinstance(res, ProcessDenied):
                 # keep but annotate
-                pid_to_item[pid].notes = "AccessDenied during sampling (some stats may be missing)."
-            except Exception:
-                pass
+                pid_to_item[pid].result.notes = "AccessDenied during sampling (some stats may be missing)."
+            elif isinstance(res, tuple):
+                store.append(pid, ts, *res)
+                if sample_cb:
+                    rows.append((pid_to_item[pid], pid, res))
+
+        if sample_cb:
+            sample_cb(ts, rows)
 
         for pid in dead_pids:
-            tracked.pop(pid, None)
+            store.retire(pid)
+            sampler.untrack(pid)
 
         samples_taken += 1
         if progress_cb:
-            progress_cb(min(1.0, (time.time() - start) / duration_s), samples_taken)
-
-        # sleep to next interval
-        elapsed = time.time() - t
-        to_sleep = max(0.0, sample_interval - elapsed)
-        time.sleep(to_sleep)
-
-    # Finalize stats into items
-    for pid, st in tracked.items():
-        it = pid_to_item.get(pid)
-        if not it:
+            progress_cb(min(1.0, sched.active_elapsed() / duration_s), samples_taken)
+
+    if source is None:
+        sampler.close()
+    store.tick_lateness = sched.lateness
+    store.missed_ticks = sched.missed
+    store.paused_s = sched.paused_ns / 1e9
+
+    # Finalize stats into items (including processes that exited mid-window),
+    # summing each item's process tree
+    parts_by_item: Dict[int, Tuple[StartupItem, List[Tuple[int, SampleSeries, Dict]]]] = {}
+    for pid, series in store.all_series():
+        it, info = owner[id(series)]
+        parts_by_item.setdefault(id(it), (it, []))[1].append((pid, series, info))
+    for it, parts in parts_by_item.values():
+        res = it.result
+        children = [p for p in parts if p[1] is not res.series]
+        if children:
+            res.children = []
+            for pid, child, info in children:
+                cs = series_stats(child)
+                res.children.append({
+                    "pid": pid,
+                    "ppid": info.get("ppid"),
+                    "name": info.get("name"),
+                    "create_time": info.get("create_time"),
+                    "avg_cpu": cs.get("avg_cpu"),
+                    "peak_cpu": cs.get("peak_cpu"),
+                    "avg_mem_mb": mb(cs["avg_mem"]) if cs else None,
+                    "peak_mem_mb": mb(cs["peak_mem"]) if cs else None,
+                    "avg_disk_mb_s": mb(io_stats([child])["avg_disk_bps"]),
+                })
+            res.series = rollup_series([s for _, s, _ in parts])
+        series = res.series
+        stats = series_stats(series)
+        if not stats:
             continue
-        n = max(1, st["n"])
-        it.avg_cpu = st["cpu_sum"] / n
-        it.peak_cpu = st["cpu_peak"]
-        it.avg_mem_mb = mb(st["mem_sum"] / n)
-        it.peak_mem_mb = mb(st["mem_peak"])
+        res.avg_cpu = stats["avg_cpu"]
+        res.peak_cpu = stats["peak_cpu"]
+        res.p50_cpu = stats["p50_cpu"]
+        res.p95_cpu = stats["p95_cpu"]
+        res.p99_cpu = stats["p99_cpu"]
+        res.avg_mem_mb = mb(stats["avg_mem"])
+        res.peak_mem_mb = mb(stats["peak_mem"])
+        res.p95_mem_mb = mb(stats["p95_mem"])
+        res.peak_threads = stats["peak_threads"]
+        res.peak_handles = stats["peak_handles"]
+        io = io_stats([s for _, s, _ in parts])
+        res.avg_disk_mb_s = mb(io["avg_disk_bps"])
+        res.peak_disk_mb_s = mb(io["peak_disk_bps"])
+        res.disk_read_mb = mb(io["read_bytes"])
+        res.disk_write_mb = mb(io["write_bytes"])
+        res.avg_io_ops_s = io["avg_io_ops_s"]
+        res.avg_page_faults_s = io["avg_page_faults_s"]
+        if res.proc_create_time:
+            res.time_to_idle_s = time_to_idle(series, res.proc_create_time, store.start_wall)
+        res.cpu_seconds = cpu_seconds([s for _, s, _ in parts])
+        # An item still busy at the end of the window counts as busy for the whole window
+        settle_s = res.time_to_idle_s
+        if settle_s is None and res.proc_create_time and len(series):
+            settle_s = max(0.0, store.start_wall + series.column("ts")[-1] - res.proc_create_time)
+        res.impact_score = impact_score(res.cpu_seconds, res.disk_read_mb + res.disk_write_mb, settle_s)
 
     # Items never matched
     for it in items:
-        if it.enabled and it.matched_pid is None:
-            it.notes = (it.notes + " " if it.notes else "") + "No matching process found during monitoring window."
+        res = it.result
+        if it.enabled and res.matched_pid is None:
+            res.notes = (res.notes + " " if res.notes else "") + "No matching process found during monitoring window."
+        if store.cancelled and res.matched_pid is not None:
+            res.notes = (res.notes + " " if res.notes else "") + "Monitoring stopped early; partial stats."
+
+    return store
 
 # -----------------------------
-# GUI
+# Record / replay / simulation
 # -----------------------------
 
-class App(tk.Tk):
-    def __init__(self):
-        super().__init__()
-        self.title("Windows Startup Tracker (Python)")
-        self.geometry("1250x650")
+# Binary trace: MAGIC, u32 header length + JSON header (start_wall, items, meta),
+# then records in call order. Each pids() call starts a frame; info/track/sample
+# results that follow belong to it. Every clock() / wall() reading is recorded too,
+# so a replay's scheduler sees the same times (including overrunning ticks).
+TRACE_MAGIC = b"STRACE1\n"
+_TRACE_FRAME = "<cqII"         # b"F", t_ns since start, n added pids, n removed pids (+ u32 pids)
+_TRACE_INFO = "<cIBqdHHH"      # b"I", pid, ok, ppid (-1 = none), create_time, len(name/exe/cmdline)
+_TRACE_TRACK = "<cIB"          # b"T", pid, ok
+_TRACE_CTIME = "<cId"          # b"C", pid, create_time (NaN = gone)
+_TRACE_CLOCK = "<cq"           # b"K", clock() reading, ns since start
+_TRACE_WALL = "<cd"            # b"W", wall() reading
+_TRACE_SAMPLES = "<cI"         # b"S", n samples, each _TRACE_SAMPLE + n fields as doubles
+_TRACE_SAMPLE = "<IBB"         # pid, status, n fields
+
+_SAMPLE_OK, _SAMPLE_GONE, _SAMPLE_DENIED, _SAMPLE_ERROR = range(4)
+
+class TraceRecorder(ProcessSource):
+    """
+    Wraps another source and writes everything monitor_items read from it to a
+    compact binary trace, for TraceReplaySource. items (and any JSON-able meta) are
+    stored in the header so the run can be replayed against the same entries.
+    """
 
-        self.items: List[StartupItem] = []
-        self.item_by_iid: Dict[str, StartupItem] = {}
+    def __init__(self, inner: ProcessSource, path: Path, items: Optional[List[StartupItem]] = None,
+                 meta: Optional[Dict] = None):
+        import struct
+        self._struct = struct
+        self.inner = inner
+        self.realtime = inner.realtime
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fp = open(self.path, "wb")
+        header = {
+            "start_wall": inner.wall(),
+            "items": [item_to_dict(it, with_series=False) for it in (items or [])],
+            "meta": meta or {},
+        }
+        raw = json.dumps(header).encode("utf-8")
+        self._fp.write(TRACE_MAGIC + struct.pack("<I", len(raw)) + raw)
+        self._t0 = inner.clock()
+        self._last_pids: set = set()
+
+    def clock(self) -> int:
+        t = self.inner.clock()
+        self._fp.write(self._struct.pack(_TRACE_CLOCK, b"K", t - self._t0))
+        return t
+
+    def sleep(self, seconds: float) -> None:
+        self.inner.sleep(seconds)
+
+    def wall(self) -> float:
+        w = self.inner.wall()
+        self._fp.write(self._struct.pack(_TRACE_WALL, b"W", w))
+        return w
+
+    def pids(self) -> set:
+        pids = self.inner.pids()
+        added = sorted(pids - self._last_pids)
+        removed = sorted(self._last_pids - pids)
+        self._last_pids = set(pids)
+        pack = self._struct.pack
+        self._fp.write(pack(_TRACE_FRAME, b"F", self.inner.clock() - self._t0, len(added), len(removed)))
+        self._fp.write(pack(f"<{len(added)}I", *added) + pack(f"<{len(removed)}I", *removed))
+        return pids
+
+    def info(self, pid: int) -> Optional[Dict]:
+        info = self.inner.info(pid)
+        if info is None:
+            self._fp.write(self._struct.pack(_TRACE_INFO, b"I", pid, 0, -1, 0.0, 0, 0, 0))
+            return None
+        # Field lengths are u16; anything longer is truncated in the trace
+        name = (info.get("name") or "").encode("utf-8")[:0xFFFF]
+        exe = (info.get("exe") or "").encode("utf-8")[:0xFFFF]
+        cmd = "\0".join(info.get("cmdline") or []).encode("utf-8")[:0xFFFF]
+        ppid = info.get("ppid")
+        self._fp.write(self._struct.pack(
+            _TRACE_INFO, b"I", pid, 1, -1 if ppid is None else ppid, info.get("create_time") or 0.0,
+            len(name), len(exe), len(cmd)
+        ) + name + exe + cmd)
+        return info
+
+    def create_time(self, pid: int) -> Optional[float]:
+        ct = self.inner.create_time(pid)
+        self._fp.write(self._struct.pack(_TRACE_CTIME, b"C", pid, float("nan") if ct is None else ct))
+        return ct
+
+    def track(self, pid: int) -> bool:
+        ok = self.inner.track(pid)
+        self._fp.write(self._struct.pack(_TRACE_TRACK, b"T", pid, 1 if ok else 0))
+        return ok
+
+    def untrack(self, pid: int) -> None:
+        self.inner.untrack(pid)
+
+    def sample(self, pids) -> Dict[int, object]:
+        results = self.inner.sample(pids)
+        pack = self._struct.pack
+        parts = [pack(_TRACE_SAMPLES, b"S", len(results))]
+        for pid, res in results.items():
+            if isinstance(res, tuple):
+                parts.append(pack(_TRACE_SAMPLE, pid, _SAMPLE_OK, len(res)) + pack(f"<{len(res)}d", *res))
+            else:
+                status = (_SAMPLE_GONE if isinstance(res, ProcessGone)
+                          else _SAMPLE_DENIED if isinstance(res, ProcessDenied) else _SAMPLE_ERROR)
+                parts.append(pack(_TRACE_SAMPLE, pid, status, 0))
+        self._fp.write(b"".join(parts))
+        return results
+
+    def close(self) -> None:
+        self.inner.close()
+        if not self._fp.closed:
+            self._fp.close()
+
+class _VirtualClockSource(ProcessSource):
+    """
+    Source with its own clock: sleep() advances it instead of blocking.
+    """
 
-        self.ui_queue = queue.Queue()
-        self.monitor_thread: Optional[threading.Thread] = None
-        self.monitor_stop = threading.Event()
+    realtime = False
 
-        self.backup_dir = Path.home() / "StartupTracker_Backups"
+    def __init__(self, start_wall: float):
+        self.start_wall = start_wall
+        self.now_ns = 0
 
-        self._build_ui()
-        self.refresh()
+    def clock(self) -> int:
+        return self.now_ns
 
-        self.after(100, self._poll_ui_queue)
+    def sleep(self, seconds: float) -> None:
+        self.now_ns += max(0, int(seconds * 1e9))
 
-    def _build_ui(self):
-        top = ttk.Frame(self)
-        top.pack(fill="x", padx=10, pady=10)
+    def wall(self) -> float:
+        return self.start_wall + self.now_ns / 1e9
 
-        ttk.Button(top, text="Refresh Startup List", command=self.refresh).pack(side="left")
+class _TraceFrame:
+    __slots__ = ("t_ns", "added", "removed", "infos", "ctimes", "tracks", "samples")
 
-        ttk.Label(top, text="  Monitor duration (sec):").pack(side="left")
-        self.duration_var = tk.IntVar(value=120)
-        ttk.Entry(top, textvariable=self.duration_var, width=8).pack(side="left")
+    def __init__(self, t_ns: int, added: List[int], removed: List[int]):
+        self.t_ns = t_ns
+        self.added = added
+        self.removed = removed
+        self.infos: Dict[int, Optional[Dict]] = {}
+        self.ctimes: Dict[int, Optional[float]] = {}
+        self.tracks: Dict[int, bool] = {}
+        self.samples: Dict[int, object] = {}
 
-        ttk.Label(top, text="  Sample interval (sec):").pack(side="left")
-        self.interval_var = tk.DoubleVar(value=1.0)
-        ttk.Entry(top, textvariable=self.interval_var, width=6).pack(side="left")
+class TraceReplaySource(_VirtualClockSource):
+    """
+    Replays a TraceRecorder trace on a virtual clock. Each pids() call moves to the
+    next recorded frame, and clock() / wall() return the recorded readings in order,
+    so the tick schedule (late and missed ticks included) is the recorded one.
+    Replaying with the same items and settings reproduces the recorded run; PIDs
+    that weren't sampled in the recording read as gone. Once the recorded readings
+    run out (or with different settings) the clock just advances by sleep(). After
+    the last frame every process is gone.
+    """
 
-        ttk.Button(top, text="Start Monitoring", command=self.start_monitoring).pack(side="left", padx=8)
+    def __init__(self, path: Path):
+        import struct
+        with open(path, "rb") as f:
+            data = f.read()
+        if not data.startswith(TRACE_MAGIC):
+            raise ValueError(f"{path} is not a startup_tracker trace")
+        pos = len(TRACE_MAGIC)
+        (n,) = struct.unpack_from("<I", data, pos)
+        pos += 4
+        header = json.loads(data[pos:pos + n].decode("utf-8"))
+        pos += n
+        super().__init__(header["start_wall"])
+        self.meta: Dict = header.get("meta", {})
+        self._item_dicts: List[Dict] = header.get("items", [])
+        self.clock_reads: List[int] = []
+        self.wall_reads: List[float] = []
+        self.frames: List[_TraceFrame] = self._parse(struct, data, pos, self.clock_reads, self.wall_reads)
+        self._clock_i = 0
+        self._wall_i = 0
+        self._next = 0
+        self._live: set = set()
+        self._frame: Optional[_TraceFrame] = None
+
+    @staticmethod
+    def _parse(struct, data: bytes, pos: int, clock_reads: List[int], wall_reads: List[float]) -> List[_TraceFrame]:
+        frames: List[_TraceFrame] = []
+        frame_sz = struct.calcsize(_TRACE_FRAME)
+        info_sz = struct.calcsize(_TRACE_INFO)
+        track_sz = struct.calcsize(_TRACE_TRACK)
+        ctime_sz = struct.calcsize(_TRACE_CTIME)
+        clock_sz = struct.calcsize(_TRACE_CLOCK)
+        wall_sz = struct.calcsize(_TRACE_WALL)
+        samples_sz = struct.calcsize(_TRACE_SAMPLES)
+        sample_sz = struct.calcsize(_TRACE_SAMPLE)
+        while pos < len(data):
+            kind = data[pos:pos + 1]
+            if kind == b"F":
+                _, t_ns, n_add, n_rem = struct.unpack_from(_TRACE_FRAME, data, pos)
+                pos += frame_sz
+                added = list(struct.unpack_from(f"<{n_add}I", data, pos))
+                pos += 4 * n_add
+                removed = list(struct.unpack_from(f"<{n_rem}I", data, pos))
+                pos += 4 * n_rem
+                frames.append(_TraceFrame(t_ns, added, removed))
+            elif kind == b"I":
+                _, pid, ok, ppid, create_time, ln, le, lc = struct.unpack_from(_TRACE_INFO, data, pos)
+                pos += info_sz
+                name, exe, cmd = data[pos:pos + ln], data[pos + ln:pos + ln + le], data[pos + ln + le:pos + ln + le + lc]
+                pos += ln + le + lc
+                frames[-1].infos[pid] = None if not ok else {
+                    "pid": pid, "ppid": None if ppid < 0 else ppid, "name": name.decode("utf-8", "replace"),
+                    "exe": exe.decode("utf-8", "replace"),
+                    "cmdline": cmd.decode("utf-8", "replace").split("\0") if cmd else [],
+                    "create_time": create_time,
+                }
+            elif kind == b"T":
+                _, pid, ok = struct.unpack_from(_TRACE_TRACK, data, pos)
+                pos += track_sz
+                frames[-1].tracks[pid] = bool(ok)
+            elif kind == b"C":
+                _, pid, ct = struct.unpack_from(_TRACE_CTIME, data, pos)
+                pos += ctime_sz
+                frames[-1].ctimes[pid] = None if ct != ct else ct  # NaN: gone
+            elif kind == b"K":
+                clock_reads.append(struct.unpack_from(_TRACE_CLOCK, data, pos)[1])
+                pos += clock_sz
+            elif kind == b"W":
+                wall_reads.append(struct.unpack_from(_TRACE_WALL, data, pos)[1])
+                pos += wall_sz
+            elif kind == b"S":
+                _, n = struct.unpack_from(_TRACE_SAMPLES, data, pos)
+                pos += samples_sz
+                samples = frames[-1].samples
+                for _ in range(n):
+                    pid, status, nf = struct.unpack_from(_TRACE_SAMPLE, data, pos)
+                    pos += sample_sz
+                    if status == _SAMPLE_OK:
+                        vals = struct.unpack_from(f"<{nf}d", data, pos)
+                        pos += 8 * nf
+                        # rss / io / thread counts are ints in live samples
+                        samples[pid] = (vals[0],) + tuple(int(v) for v in vals[1:])
+                    elif status == _SAMPLE_GONE:
+                        samples[pid] = ProcessGone(pid)
+                    elif status == _SAMPLE_DENIED:
+                        samples[pid] = ProcessDenied(pid)
+                    else:
+                        samples[pid] = RuntimeError("sampling error (recorded)")
+            else:
+                raise ValueError(f"Corrupt trace record at offset {pos}")
+        return frames
+
+    def items(self) -> List[StartupItem]:
+        """
+        Fresh copies of the startup items the trace was recorded with.
+        """
+        return [item_from_dict(d) for d in self._item_dicts]
+
+    @property
+    def duration_s(self) -> float:
+        return self.frames[-1].t_ns / 1e9 if self.frames else 0.0
+
+    def clock(self) -> int:
+        if self._clock_i < len(self.clock_reads):
+            self.now_ns = max(self.now_ns, self.clock_reads[self._clock_i])
+            self._clock_i += 1
+        return self.now_ns
+
+    def sleep(self, seconds: float) -> None:
+        # While there are recorded readings, they decide what time it is
+        if self._clock_i >= len(self.clock_reads):
+            super().sleep(seconds)
+
+    def wall(self) -> float:
+        if self._wall_i < len(self.wall_reads):
+            self._wall_i += 1
+            return self.wall_reads[self._wall_i - 1]
+        return super().wall()
+
+    def pids(self) -> set:
+        if self._next >= len(self.frames):
+            self._frame = None
+            self._live = set()
+            return set()
+        frame = self._frame = self.frames[self._next]
+        self._next += 1
+        self.now_ns = max(self.now_ns, frame.t_ns)
+        self._live.difference_update(frame.removed)
+        self._live.update(frame.added)
+        return set(self._live)
+
+    def info(self, pid: int) -> Optional[Dict]:
+        return self._frame.infos.get(pid) if self._frame else None
+
+    def create_time(self, pid: int) -> Optional[float]:
+        # Not looked up in the recording: report no evidence of reuse
+        return self._frame.ctimes.get(pid) if self._frame else None
+
+    def track(self, pid: int) -> bool:
+        if self._frame is None:
+            return False
+        return self._frame.tracks.get(pid, pid in self._live)
+
+    def sample(self, pids) -> Dict[int, object]:
+        samples = self._frame.samples if self._frame else {}
+        return {pid: samples.get(pid) or ProcessGone(pid) for pid in pids}
+
+class SimulatedProcessSource(_VirtualClockSource):
+    """
+    Deterministic synthetic process table on a virtual clock.
+    n_apps "startup apps" (see startup_items()) each run a launcher with
+    children_per_app helpers; the rest of n_procs is background noise. churn_per_s
+    background processes exit and get replaced per virtual second. CPU follows a
+    launch burst that decays towards a small baseline, RSS ramps up to a plateau,
+    and disk reads/writes accumulate with the CPU burst. Same seed, same run.
+    """
 
-        self.progress = ttk.Progressbar(top, length=250, mode="determinate")
-        self.progress.pack(side="left", padx=8)
-        self.progress["value"] = 0
+    def __init__(self, n_procs: int = 2000, n_apps: int = 50, children_per_app: int = 2,
+                 churn_per_s: float = 5.0, seed: int = 0, start_wall: float = 1_700_000_000.0):
+        super().__init__(start_wall)
+        import random
+        self.rng = random.Random(seed)
+        self.n_apps = n_apps
+        self.churn_per_s = churn_per_s
+        self.procs: Dict[int, Dict] = {}
+        self.tracked: set = set()
+        self._background: List[int] = []  # churn candidates
+        self._next_pid = 1000
+        self._churn_debt = 0.0
+        self._last_ns = 0
+
+        self.app_pids: List[int] = []
+        for i in range(n_apps):
+            # Apps launch over the first half-minute after logon
+            born = self.rng.uniform(-30.0, 0.0)
+            root = self._spawn(f"app{i}.exe", f"c:\\program files\\vendor{i}\\app{i}.exe",
+                               ["--startup"], None, born, burst=self.rng.uniform(20, 90))
+            self.app_pids.append(root)
+            for c in range(children_per_app):
+                self._spawn(f"app{i}_helper{c}.exe", f"c:\\program files\\vendor{i}\\helper{c}.exe",
+                            ["--type=renderer"], root, born + self.rng.uniform(0.5, 5.0),
+                            burst=self.rng.uniform(5, 60))
+        while len(self.procs) < n_procs:
+            self._spawn_background(self.rng.uniform(-600.0, 0.0))
+
+    def _spawn(self, name: str, exe: str, args: List[str], ppid: Optional[int], born_s: float,
+               burst: float) -> int:
+        pid = self._next_pid
+        self._next_pid += 1
+        rng = self.rng
+        self.procs[pid] = {
+            "pid": pid, "ppid": ppid, "name": name, "exe": exe, "cmdline": [exe] + args,
+            "born": born_s,                           # seconds relative to start_wall
+            "burst": burst,                           # initial CPU %
+            "tau": rng.uniform(2.0, 20.0),            # burst decay, seconds
+            "base": rng.uniform(0.0, 1.5),            # steady CPU %
+            "rss": rng.uniform(5, 400) * 2**20,       # plateau RSS, bytes
+            "io_rate": rng.uniform(0, 20) * 2**20,    # disk bytes/s at full burst
+            "threads": rng.randrange(1, 40),
+        }
+        return pid
+
+    def _spawn_background(self, born_s: float) -> int:
+        n = self._next_pid
+        pid = self._spawn(f"proc{n}.exe", f"c:\\windows\\system32\\proc{n}.exe", [], None, born_s,
+                          burst=self.rng.uniform(0, 10))
+        self._background.append(pid)
+        return pid
+
+    def startup_items(self, n_unmatched: int = 0) -> List[StartupItem]:
+        """
+        One item per simulated app (matched by exe), plus n_unmatched that never run.
+        """
+        items = []
+        for i, pid in enumerate(self.app_pids):
+            items.append(StartupItem(name=f"App {i}", source="Registry:HKCU Run",
+                                     command=f"\"{self.procs[pid]['exe']}\" --startup",
+                                     location=f"HKCU\\Run::App {i}"))
+        for i in range(n_unmatched):
+            items.append(StartupItem(name=f"Missing {i}", source="Registry:HKCU Run",
+                                     command=f"\"c:\\tools\\missing{i}\\svc{i}.exe\"",
+                                     location=f"HKCU\\Run::Missing {i}"))
+        return items
 
-        ttk.Button(top, text="Disable Selected (One Click)", command=self.disable_selected).pack(side="right")
+    def _churn(self) -> None:
+        self._churn_debt += (self.now_ns - self._last_ns) / 1e9 * self.churn_per_s
+        self._last_ns = self.now_ns
+        now_s = self.now_ns / 1e9
+        bg = self._background
+        while self._churn_debt >= 1.0:
+            self._churn_debt -= 1.0
+            if bg:
+                # swap-remove a random background process
+                i = self.rng.randrange(len(bg))
+                bg[i], bg[-1] = bg[-1], bg[i]
+                del self.procs[bg.pop()]
+            self._spawn_background(now_s)
+
+    def pids(self) -> set:
+        self._churn()
+        now_s = self.now_ns / 1e9
+        return {pid for pid, p in self.procs.items() if p["born"] <= now_s}
+
+    def info(self, pid: int) -> Optional[Dict]:
+        p = self.procs.get(pid)
+        if p is None or p["born"] > self.now_ns / 1e9:
+            return None
+        return {
+            "pid": pid, "ppid": p["ppid"], "name": p["name"], "exe": p["exe"],
+            "cmdline": list(p["cmdline"]), "create_time": self.start_wall + p["born"],
+        }
+
+    def track(self, pid: int) -> bool:
+        if pid not in self.procs:
+            return False
+        self.tracked.add(pid)
+        return True
+
+    def untrack(self, pid: int) -> None:
+        self.tracked.discard(pid)
+
+    def sample(self, pids) -> Dict[int, object]:
+        import math
+        now_s = self.now_ns / 1e9
+        out: Dict[int, object] = {}
+        for pid in pids:
+            p = self.procs.get(pid)
+            if p is None:
+                out[pid] = ProcessGone(pid)
+                continue
+            age = max(0.0, now_s - p["born"])
+            decay = math.exp(-age / p["tau"])
+            # Deterministic jitter from (pid, time) instead of shared RNG state
+            jitter = ((pid * 2654435761 + self.now_ns // 1_000_000) % 1000) / 1000.0
+            cpu = p["base"] + p["burst"] * decay * (0.8 + 0.4 * jitter)
+            rss = int(p["rss"] * (1.0 - math.exp(-age / 3.0)))
+            # Integral of io_rate * decay from 0 to age
+            io = int(p["io_rate"] * p["tau"] * (1.0 - decay))
+            out[pid] = (cpu, rss, io, io // 4, p["threads"], io // 65536, io // 262144,
+                        p["threads"] * 8, rss // 4096)
+        return out
 
-        # Tree/table
-        cols = (
-            "Name", "Source", "Enabled", "Command/Path", "PID", "ProcName",
-            "AvgCPU%", "PeakCPU%", "AvgMemMB", "PeakMemMB", "Notes"
-        )
-        self.tree = ttk.Treeview(self, columns=cols, show="headings", height=22)
-        for c in cols:
-            self.tree.heading(c, text=c)
-            # widths
-            w = 120
-            if c in ("Command/Path", "Notes"):
-                w = 420 if c == "Command/Path" else 260
-            if c in ("AvgCPU%", "PeakCPU%", "AvgMemMB", "PeakMemMB", "PID"):
-                w = 90
-            if c in ("Enabled",):
-                w = 70
-            self.tree.column(c, width=w, anchor="w")
-        self.tree.pack(fill="both", expand=True, padx=10, pady=(0,10))
-
-        # Bottom help
-        bottom = ttk.Frame(self)
-        bottom.pack(fill="x", padx=10, pady=(0,10))
-        ttk.Label(
-            bottom,
-            text=(
-                "Tip: Run as Administrator to disable HKLM Run entries and some scheduled tasks. "
-                f"Startup-folder removals are backed up to: {self.backup_dir}"
-            )
-        ).pack(side="left")
-
-    def refresh(self):
-        self.items = enumerate_all_startup_items()
-        self._render_items()
-
-    def _render_items(self):
-        self.tree.delete(*self.tree.get_children())
-        self.item_by_iid.clear()
-
-        for it in self.items:
-            iid = str(id(it))
-            self.item_by_iid[iid] = it
-            self.tree.insert("", "end", iid=iid, values=self._row_values(it))
-
-    def _row_values(self, it: StartupItem):
-        def fmt(x, digits=2):
-            return "" if x is None else f"{x:.{digits}f}"
-
-        return (
-            it.name,
-            it.source,
-            "Yes" if it.enabled else "No",
-            it.command,
-            "" if it.matched_pid is None else str(it.matched_pid),
-            it.matched_proc_name or "",
-            fmt(it.avg_cpu, 2),
-            fmt(it.peak_cpu, 2),
-            fmt(it.avg_mem_mb, 2),
-            fmt(it.peak_mem_mb, 2),
-            it.notes or ""
-        )
+# -----------------------------
+# Boot-time capture
+# -----------------------------
 
-    def start_monitoring(self):
-        if self.monitor_thread and self.monitor_thread.is_alive():
-            messagebox.showinfo("Monitoring", "Monitoring is already running.")
-            return
+class CaptureBackend:
+    """
+    Platform hooks used by headless boot-time capture.
+    The default works anywhere psutil does; a fake can override any method for testing.
+    """
 
-        # Clear previous results
-        for it in self.items:
-            it.matched_pid = None
-            it.matched_proc_name = None
-            it.avg_cpu = None
-            it.peak_cpu = None
-            it.avg_mem_mb = None
-            it.peak_mem_mb = None
-            it.notes = ""
+    name = "generic"
 
-        self._render_items()
-        self.progress["value"] = 0
+    def boot_time(self) -> float:
+        import psutil
+        return psutil.boot_time()
 
-        duration = max(10, int(self.duration_var.get() or 120))
-        interval = max(0.25, float(self.interval_var.get() or 1.0))
+    def enumerate_items(self) -> List[StartupItem]:
+        return enumerate_all_startup_items()
 
-        def progress_cb(frac, samples):
-            self.ui_queue.put(("progress", frac))
+    def capture_command(self, extra_args: List[str]) -> List[str]:
+        return [sys.executable, os.path.abspath(__file__), "capture"] + list(extra_args)
 
-        def worker():
-            try:
-                monitor_items(self.items, duration, interval, progress_cb=progress_cb)
-                self.ui_queue.put(("done", None))
-            except Exception as e:
-                self.ui_queue.put(("error", str(e)))
+    def register_logon(self, extra_args: List[str]) -> Tuple[bool, str]:
+        return False, f"Logon registration is not supported on this platform ({self.name})."
 
-        self.monitor_thread = threading.Thread(target=worker, daemon=True)
-        self.monitor_thread.start()
+    def unregister_logon(self) -> Tuple[bool, str]:
+        return False, f"Logon registration is not supported on this platform ({self.name})."
 
-    def disable_selected(self):
-        sel = self.tree.selection()
-        if not sel:
-            messagebox.showwarning("Disable", "Select at least one startup entry.")
-            return
+class WindowsCaptureBackend(CaptureBackend):
+    """
+    Registers the capture under HKCU Run so it starts at logon, without a console window.
+    """
 
-        # Confirm
-        if not messagebox.askyesno(
-            "Confirm Disable",
-            "This will disable/remove the selected startup entries.\n\n"
-            "Registry Run entries will be deleted.\n"
-            "Startup-folder files will be moved to a backup folder.\n"
-            "Scheduled tasks will be disabled.\n\nProceed?"
-        ):
-            return
+    name = "windows"
+    RUN_KEY = r"Software\Microsoft\Windows\CurrentVersion\Run"
+    VALUE_NAME = "StartupTrackerCapture"
 
-        ok_count = 0
-        msgs = []
+    def capture_command(self, extra_args: List[str]) -> List[str]:
+        cmd = super().capture_command(extra_args)
+        pythonw = Path(sys.executable).with_name("pythonw.exe")
+        if pythonw.exists():
+            cmd[0] = str(pythonw)
+        return cmd
 
-        for iid in sel:
-            it = self.item_by_iid.get(iid)
-            if not it:
-                continue
-            if not it.enabled:
-                msgs.append(f"{it.name}: already disabled / unavailable.")
-                continue
+    def register_logon(self, extra_args: List[str]) -> Tuple[bool, str]:
+        try:
+            import winreg
+            import subprocess
+            cmdline = subprocess.list2cmdline(self.capture_command(extra_args))
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, self.RUN_KEY, 0, winreg.KEY_SET_VALUE) as k:
+                winreg.SetValueEx(k, self.VALUE_NAME, 0, winreg.REG_SZ, cmdline)
+            return True, f"Registered logon capture: {cmdline}"
+        except Exception as e:
+            return False, f"Registering logon capture failed: {e}"
 
-            success, msg = disable_item(it, self.backup_dir)
-            if success:
-                ok_count += 1
-                it.enabled = False
-                it.notes = msg
-            else:
-                it.notes = msg
-                msgs.append(f"{it.name}: {msg}")
+    def unregister_logon(self) -> Tuple[bool, str]:
+        try:
+            import winreg
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, self.RUN_KEY, 0, winreg.KEY_SET_VALUE) as k:
+                winreg.DeleteValue(k, self.VALUE_NAME)
+            return True, "Removed logon capture."
+        except FileNotFoundError:
+            return False, "Logon capture is not registered."
+        except Exception as e:
+            return False, f"Removing logon capture failed: {e}"
 
-        self._render_items()
-        if msgs:
-            messagebox.showwarning("Some actions failed", "\n".join(msgs[:20]) + ("\n..." if len(msgs) > 20 else ""))
-        else:
-            messagebox.showinfo("Disable", f"Disabled/removed {ok_count} item(s).")
+class LinuxCaptureBackend(CaptureBackend):
+    """
+    Registers the capture as a user XDG autostart entry.
+    """
+
+    name = "linux"
+    DESKTOP_FILE = "startup-tracker-capture.desktop"
 
-    def _poll_ui_queue(self):
+    def _desktop_path(self) -> Path:
+        return xdg_autostart_dirs()[0][1] / self.DESKTOP_FILE
+
+    def register_logon(self, extra_args: List[str]) -> Tuple[bool, str]:
         try:
-            while True:
-                kind, payload = self.ui_queue.get_nowait()
-                if kind == "progress":
-                    self.progress["value"] = payload * 100
-                elif kind == "done":
-                    self.progress["value"] = 100
-                    self._render_items()
-                    messagebox.showinfo("Monitoring", "Monitoring complete. Stats updated in the table.")
-                elif kind == "error":
-                    messagebox.showerror("Error", f"Monitoring error:\n{payload}")
-        except queue.Empty:
-            pass
-        self.after(100, self._poll_ui_queue)
+            path = self._desktop_path()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            cmdline = shlex.join(self.capture_command(extra_args))
+            path.write_text(
+                "[Desktop Entry]\nType=Application\nName=Startup Tracker Capture\n"
+                f"Exec={cmdline}\nNoDisplay=true\n",
+                encoding="utf-8"
+            )
+            return True, f"Registered logon capture: {path}"
+        except Exception as e:
+            return False, f"Registering logon capture failed: {e}"
+
+    def unregister_logon(self) -> Tuple[bool, str]:
+        path = self._desktop_path()
+        if not path.exists():
+            return False, "Logon capture is not registered."
+        try:
+            path.unlink()
+            return True, "Removed logon capture."
+        except Exception as e:
+            return False, f"Removing logon capture failed: {e}"
+
+def default_capture_backend() -> CaptureBackend:
+    if _is_windows():
+        return WindowsCaptureBackend()
+    if _is_linux():
+        return LinuxCaptureBackend()
+    return CaptureBackend()
+
+def default_capture_path() -> Path:
+    return Path.home() / "StartupTracker_Captures" / f"capture_{now_str()}.json"
+
+# MonitorResult fields written to / read from capture files (the series is stored column-wise)
+RESULT_FIELDS = tuple(f for f in MonitorResult.__slots__ if f != "series")
+
+def item_to_dict(it: StartupItem, with_series: bool = True) -> Dict:
+    d = {"name": it.name, "source": it.source, "command": it.command, "location": it.location, "enabled": it.enabled}
+    res = it.result
+    for f in RESULT_FIELDS:
+        d[f] = getattr(res, f)
+    if with_series and res.series is not None and len(res.series):
+        d["series"] = {name: res.series.column(name) for name in SampleSeries.COLUMNS}
+    return d
+
+def item_from_dict(d: Dict) -> StartupItem:
+    it = StartupItem(
+        name=d["name"], source=d["source"], command=d["command"], location=d["location"],
+        enabled=d.get("enabled", True)
+    )
+    for f in RESULT_FIELDS:
+        if f in d:
+            setattr(it.result, f, d[f])
+    if d.get("series"):
+        it.result.series = SampleSeries.from_columns(d["series"])
+    return it
+
+def save_capture(path: Path, items: List[StartupItem], meta: Dict) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    doc = dict(meta)
+    doc["items"] = [item_to_dict(it) for it in items]
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(doc, f)
+    os.replace(tmp, path)
+    return path
+
+def load_capture(path: Path) -> Tuple[List[StartupItem], Dict]:
+    """
+    Read a capture file. Returns (items, metadata).
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        doc = json.load(f)
+    items = [item_from_dict(d) for d in doc.pop("items", [])]
+    return items, doc
+
+def capture_startup(out_path: Optional[Path] = None, duration_s: int = 180, sample_interval: float = 1.0,
+                    backend: Optional[CaptureBackend] = None, workers: int = 4) -> Path:
+    """
+    Headless capture meant to run at logon.
+    Sampling starts right away while startup entries are still being enumerated in the
+    background (monitor_items picks up items as they're appended). Processes already
+    running are placed by their create_time, so launch order relative to boot and
+    time-to-idle are known even for things that started before the capture did.
+    """
+    backend = backend or default_capture_backend()
+    out_path = Path(out_path) if out_path else default_capture_path()
+    started = time.time()
+
+    items: List[StartupItem] = []
+
+    def enumerate_in_background():
+        items.extend(backend.enumerate_items())
+
+    enum_thread = threading.Thread(target=enumerate_in_background, daemon=True)
+    enum_thread.start()
+    store = monitor_items(items, duration_s, sample_interval, workers=workers)
+    enum_thread.join()
+
+    boot = backend.boot_time()
+    launched = sorted(
+        (it for it in items if it.result.proc_create_time),
+        key=lambda it: it.result.proc_create_time
+    )
+    meta = {
+        "kind": "startup_capture",
+        "backend": backend.name,
+        "boot_time": boot,
+        "capture_started": started,
+        "duration_s": duration_s,
+        "sample_interval": sample_interval,
+        "timing": store.timing(),
+        # names in launch order with seconds after boot
+        "launch_order": [[it.name, it.result.proc_create_time - boot] for it in launched],
+    }
+    return save_capture(out_path, items, meta)
+
+# -----------------------------
+# Headless CLI / export
+# -----------------------------
+
+class RecordWriter:
+    """
+    Streams records as NDJSON (one object per line) or as a JSON array written
+    incrementally, so nothing from a long run is buffered.
+    """
+
+    def __init__(self, fp, fmt: str = "ndjson"):
+        self.fp = fp
+        self.fmt = fmt
+        self.count = 0
+        if fmt == "json":
+            fp.write("[")
+
+    def write(self, record: Dict) -> None:
+        line = json.dumps(record, separators=(",", ":"))
+        if self.fmt == "json":
+            self.fp.write(("," if self.count else "") + "\n" + line)
+        else:
+            self.fp.write(line + "\n")
+        self.fp.flush()
+        self.count += 1
+
+    def close(self) -> None:
+        if self.fmt == "json":
+            self.fp.write("\n]\n")
+        self.fp.flush()
+
+def sample_record(ts: float, it: StartupItem, pid: int, sample: Tuple) -> Dict:
+    rec = {"type": "sample", "t": round(ts, 4), "item": it.name, "source": it.source, "pid": pid}
+    rec.update(zip(SAMPLE_FIELDS, sample))
+    return rec
+
+def cli_list(writer: RecordWriter) -> int:
+    for _, batch in iter_startup_sources():
+        for it in batch:
+            writer.write(dict(type="item", **_base_item_dict(it)))
+    return 0
+
+def cli_monitor(writer: RecordWriter, duration_s: Optional[int], interval: Optional[float], workers: int,
+                samples: bool = True, record: Optional[Path] = None, replay: Optional[Path] = None,
+                simulate: int = 0) -> int:
+    """
+    record writes a trace of the run; replay / simulate monitor a trace or a synthetic
+    process table instead of the live one, as fast as it can be computed.
+    """
+    source: Optional[ProcessSource] = None
+    if replay:
+        source = TraceReplaySource(replay)
+        items = source.items()
+        duration_s = duration_s or int(source.meta.get("duration_s") or source.duration_s + 1)
+        interval = interval or source.meta.get("interval") or 1.0
+    elif simulate:
+        source = SimulatedProcessSource(n_procs=simulate)
+        items = source.startup_items()
+    else:
+        items = enumerate_all_startup_items()
+    duration_s = duration_s or 120
+    interval = interval or 1.0
+    if record:
+        inner = source if source is not None else ProcessSampler(workers)
+        source = TraceRecorder(inner, record, items, meta={"duration_s": duration_s, "interval": interval})
+
+    def on_samples(ts, rows):
+        for it, pid, sample in rows:
+            writer.write(sample_record(ts, it, pid, sample))
+
+    # Ctrl+C ends the run early but still writes summaries for what was sampled
+    import signal
+    control = MonitorControl()
+    prev = signal.signal(signal.SIGINT, lambda signum, frame: control.stop())
+    try:
+        store = monitor_items(items, duration_s, interval, workers=workers,
+                              sample_cb=on_samples if samples else None, control=control, source=source)
+    finally:
+        signal.signal(signal.SIGINT, prev)
+        if source is not None:
+            source.close()
+    for it in items:
+        writer.write(dict(type="summary", **item_to_dict(it, with_series=False)))
+    writer.write(dict(type="timing", **store.timing()))
+    return 0
+
+def main(argv=None) -> int:
+    import argparse
+    parser = argparse.ArgumentParser(description="Track and disable startup applications.")
+    sub = parser.add_subparsers(dest="command")
+
+    cap = sub.add_parser("capture", help="Headless boot-time capture (run at logon)")
+    cap.add_argument("--out", type=Path, default=None, help="Capture file (default: ~/StartupTracker_Captures)")
+    cap.add_argument("--duration", type=int, default=180, help="Seconds to sample")
+    cap.add_argument("--interval", type=float, default=1.0, help="Seconds between samples")
+    cap.add_argument("--register", action="store_true", help="Run this capture at every logon")
+    cap.add_argument("--unregister", action="store_true", help="Stop running the capture at logon")
+
+    def add_output_args(p):
+        p.add_argument("--format", choices=("ndjson", "json"), default="ndjson", help="Output format")
+        p.add_argument("--out", type=Path, default=None, help="Output file (default: stdout)")
+
+    lst = sub.add_parser("list", help="Enumerate startup entries")
+    add_output_args(lst)
+
+    mon = sub.add_parser("monitor", help="Enumerate, monitor and stream samples + per-item summaries")
+    mon.add_argument("--duration", type=int, default=None, help="Seconds to sample (default 120, or the trace's)")
+    mon.add_argument("--interval", type=float, default=None, help="Seconds between samples (default 1, or the trace's)")
+    mon.add_argument("--workers", type=int, default=4, help="Sampler threads")
+    mon.add_argument("--no-samples", action="store_true", help="Only write the final summaries")
+    mon.add_argument("--record", type=Path, default=None, help="Also write a binary trace of the run")
+    replay = mon.add_mutually_exclusive_group()
+    replay.add_argument("--replay", type=Path, default=None, help="Monitor a recorded trace instead of live processes")
+    replay.add_argument("--simulate", type=int, default=0, metavar="N",
+                        help="Monitor a synthetic table of N processes instead of live processes")
+    add_output_args(mon)
+
+    rst = sub.add_parser("restore", help="Undo a disable batch from its journal")
+    rst.add_argument("--journal", type=Path, default=None,
+                     help="Journal file (default: the latest unrestored one in ~/StartupTracker_Backups/journal)")
+
+    sub.add_parser("gui", help="Start the GUI (default)")
+
+    args = parser.parse_args(argv)
+
+    if args.command in ("list", "monitor"):
+        fp = open(args.out, "w", encoding="utf-8") if args.out else sys.stdout
+        writer = RecordWriter(fp, args.format)
+        try:
+            if args.command == "list":
+                return cli_list(writer)
+            return cli_monitor(writer, args.duration, args.interval, args.workers, not args.no_samples,
+                               record=args.record, replay=args.replay, simulate=args.simulate)
+        finally:
+            writer.close()
+            if args.out:
+                fp.close()
+
+    if args.command == "capture":
+        backend = default_capture_backend()
+        if args.register or args.unregister:
+            if args.register:
+                extra = ["--duration", str(args.duration), "--interval", str(args.interval)]
+                if args.out:
+                    extra += ["--out", str(args.out)]
+                ok, msg = backend.register_logon(extra)
+            else:
+                ok, msg = backend.unregister_logon()
+            print(msg)
+            return 0 if ok else 1
+        path = capture_startup(args.out, args.duration, args.interval, backend=backend)
+        print(f"Capture written to {path}")
+        return 0
+
+    if args.command == "restore":
+        path = args.journal or latest_journal(Path.home() / "StartupTracker_Backups")
+        if path is None or not path.exists():
+            print("No disable batch left to restore.")
+            return 1
+        results = restore_journal(path)
+        for d, ok, msg in results:
+            print(f"{'OK' if ok else 'FAILED'}  {d['name']}: {msg}")
+        return 0 if all(ok for _, ok, _ in results) else 1
+
+    # Run as a script, this module is __main__; let the GUI module reuse it instead of importing a second copy
+    sys.modules.setdefault("startup_tracker", sys.modules[__name__])
+    from startup_tracker_gui import run_gui
+    return run_gui()
 
 if __name__ == "__main__":
-    app = App()
-    app.mainloop()
+    sys.exit(main())
@@ -0,0 +1,547 @@
+# Benchmarks for the hot paths in startup_tracker.py
+# Run: python startup_tracker_bench.py [--max-n N] [--save-baseline] [--check]
+# Scaling sweeps are compared against startup_tracker_bench_baseline.json (next to this file);
+# --check exits non-zero when a case got slower than REGRESSION_RATIO x its baseline.
+
+import gc
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import startup_tracker as st
+
+# -----------------------------
+# Synthetic data
+# -----------------------------
+
+def synthetic_proc_index(n_procs: int, seed: int = 0) -> List[Dict]:
+    """
+    Fake process table in the shape build_process_index() returns.
+    """
+    rng = random.Random(seed)
+    procs = []
+    for i in range(n_procs):
+        vendor = f"vendor{rng.randrange(200)}"
+        exe = f"c:\\program files\\{vendor}\\app{i}\\app{i}.exe"
+        procs.append({
+            "pid": 1000 + i,
+            "name": f"App{i}.exe",
+            "exe": exe,
+            "cmd": f"\"{exe}\" --profile={rng.randrange(10)} --instance {i}",
+            "create_time": 0.0,
+        })
+    return procs
+
+def synthetic_items(n_items: int, n_procs: int, seed: int = 1) -> List[st.StartupItem]:
+    """
+    Startup items where roughly a third match by exe, a third by command and the rest never match.
+    """
+    rng = random.Random(seed)
+    items = []
+    for i in range(n_items):
+        j = rng.randrange(n_procs)
+        kind = i % 3
+        if kind == 0:
+            cmd = f"\"C:\\Program Files\\vendor\\app{j}\\app{j}.exe\" --minimized"
+            name = f"App {j}"
+        elif kind == 1:
+            cmd = f"app{j}.exe --background"
+            name = f"Helper{j}"
+        else:
+            cmd = f"\"C:\\Tools\\missing{i}\\svc{i}.exe\""
+            name = f"Missing{i}"
+        items.append(make_item(name, cmd))
+    return items
+
+def make_item(name: str, cmd: str) -> st.StartupItem:
+    return st.StartupItem(name=name, source="Registry:HKCU Run", command=cmd, location=f"HKCU\\Run::{name}")
+
+# -----------------------------
+# Benchmarks
+# -----------------------------
+
+def timeit(fn, repeat: int = 3) -> float:
+    """
+    Best of repeat runs, with the cyclic GC off like the stdlib timeit, so a collection
+    landing in one run doesn't decide the result.
+    """
+    best = float("inf")
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            t = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - t)
+    finally:
+        gc.enable()
+    return best
+
+def bench_matcher(n_procs: int = 5000, n_items: int = 500) -> None:
+    """
+    Linear match_item_to_process vs MatcherIndex on the same synthetic tables.
+    """
+    procs = synthetic_proc_index(n_procs)
+    items = synthetic_items(n_items, n_procs)
+
+    linear = [st.match_item_to_process(it, procs) for it in items]
+    indexed = st.MatcherIndex(procs).match_all(items)
+    mismatches = sum(1 for a, b in zip(linear, indexed) if a != b)
+
+    t_linear = timeit(lambda: [st.match_item_to_process(it, procs) for it in items], repeat=1)
+    t_indexed = timeit(lambda: st.MatcherIndex(procs).match_all(items))
+
+    print(f"matcher {n_procs} procs / {n_items} items")
+    print(f"  linear:  {t_linear * 1000:9.1f} ms")
+    print(f"  indexed: {t_indexed * 1000:9.1f} ms  ({t_linear / t_indexed:.1f}x)")
+    print(f"  matched: {sum(p is not None for p in indexed)}, mismatches vs linear: {mismatches}")
+
+def bench_item_memory(n_rows: int = 100_000, n_hosts: int = 500) -> None:
+    """
+    Memory for an inventory merged from many hosts: StartupItem list vs StartupItemTable.
+    """
+    per_host = max(1, n_rows // n_hosts)
+    base = synthetic_items(per_host, 5000)
+
+    def measure(build):
+        tracemalloc.start()
+        obj = build()
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        return obj, size
+
+    def build_items():
+        # Each host reports its own copies of the strings, like a parsed inventory would
+        return [
+            st.StartupItem(name=it.name + "", source=it.source + "", command=it.command + " ",
+                           location=it.location + "")
+            for h in range(n_hosts) for it in base
+        ]
+
+    def build_table():
+        table = st.StartupItemTable()
+        for h in range(n_hosts):
+            for it in base:
+                table.append(it.name + "", it.source + "", it.command + " ", it.location + "", host=f"host{h}")
+        return table
+
+    items, items_size = measure(build_items)
+    del items
+    table, table_size = measure(build_table)
+    rows = len(table)
+
+    print(f"inventory memory, {rows} rows")
+    print(f"  StartupItem list: {items_size / 2**20:8.1f} MB  ({items_size / rows:.0f} B/row)")
+    print(f"  StartupItemTable: {table_size / 2**20:8.1f} MB  ({table_size / rows:.0f} B/row)")
+
+def bench_normalization(n_procs: int = 5000, ticks: int = 5) -> None:
+    """
+    Normalization work of one process-index tick (exe + cmdline + name per process),
+    uncached vs the LRU-cached normalize_cmd once the cache is warm.
+    """
+    procs = synthetic_proc_index(n_procs)
+    # Raw, un-normalized strings as psutil would report them
+    raw = [(p["exe"].upper(), p["cmd"].upper() + "   ", p["name"]) for p in procs]
+
+    def tick(norm):
+        for exe, cmd, name in raw:
+            norm(exe)
+            norm(cmd)
+            norm(name)
+
+    st.clear_normalize_caches()
+    t_uncached = timeit(lambda: tick(st._normalize_cmd_uncached), repeat=ticks)
+    tick(st.normalize_cmd)  # warm
+    t_cached = timeit(lambda: tick(st.normalize_cmd), repeat=ticks)
+    info = st.normalize_cache_stats()["normalize_cmd"]
+
+    print(f"normalization per tick, {n_procs} procs")
+    print(f"  uncached: {t_uncached * 1000:9.2f} ms")
+    print(f"  cached:   {t_cached * 1000:9.2f} ms  ({t_uncached / t_cached:.1f}x)")
+    print(f"  cache hits {info['hits']}, misses {info['misses']}, size {info['currsize']}")
+
+# Library-only import budget. Heavy modules must stay out of a plain import.
+IMPORT_BUDGET_MS = 100.0
+LAZY_MODULES = ("tkinter", "psutil", "winreg", "ctypes", "subprocess", "argparse", "concurrent.futures")
+
+def import_time_ms(module: str = "startup_tracker") -> float:
+    """
+    Cumulative import time of module in a fresh interpreter, from -X importtime.
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, cwd=here, check=True
+    )
+    for line in proc.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        parts = [p.strip() for p in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1]) / 1000.0
+    raise RuntimeError(f"{module} not found in -X importtime output")
+
+def check_import_budget(budget_ms: float = IMPORT_BUDGET_MS, runs: int = 5) -> None:
+    """
+    Assert the library-only import stays under budget and loads none of LAZY_MODULES.
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    import_time_ms()  # first run writes the .pyc
+    best = min(import_time_ms() for _ in range(runs))
+
+    probe = f"import sys, startup_tracker; print(' '.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    loaded = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, cwd=here, check=True).stdout.split()
+
+    print(f"import startup_tracker: {best:.1f} ms (budget {budget_ms:.0f} ms)")
+    assert not loaded, f"import startup_tracker eagerly loaded: {', '.join(loaded)}"
+    assert best < budget_ms, f"import took {best:.1f} ms, budget is {budget_ms:.0f} ms"
+
+def check_replay_roundtrip(duration_s: int = 3, interval: float = 0.1) -> None:
+    """
+    Record a live monitor_items run over a busy child process (CPU + disk writes),
+    replay the trace and assert the per-item results are identical.
+    """
+    busy = (
+        "import os, tempfile, time\n"
+        "end = time.time() + 30\n"
+        "with tempfile.TemporaryFile() as f:\n"
+        "    while time.time() < end:\n"
+        "        sum(i * i for i in range(20000)); f.write(os.urandom(65536)); f.flush()\n"
+    )
+    marker = "startup_tracker_replay_check"  # only in the child's command line
+    child = subprocess.Popen([sys.executable, "-c", busy, marker])
+    try:
+        def run(source, items):
+            store = st.monitor_items(items, duration_s, interval, source=source)
+            return [st.item_to_dict(it, with_series=False) for it in items], list(store.tick_ts), store.missed_ticks
+
+        item = make_item("Replay check", f"{marker} --busy")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "live.trace"
+            recorder = st.TraceRecorder(st.ProcessSampler(), path, [item])
+            try:
+                recorded = run(recorder, [item])
+            finally:
+                recorder.close()
+            replay = st.TraceReplaySource(path)
+            replayed = run(replay, replay.items())
+    finally:
+        child.kill()
+        child.wait()
+
+    summary = recorded[0][0]
+    print(f"replay round trip: {len(recorded[1])} ticks, {recorded[2]} missed, "
+          f"matched pid {summary['matched_pid']}, cpu_seconds {summary['cpu_seconds']}")
+    assert summary["matched_pid"] == child.pid, "live run didn't match the busy child process"
+    assert recorded == replayed, "replaying the live trace gave different results"
+
+# -----------------------------
+# Scaling sweeps
+# -----------------------------
+
+SWEEP_SIZES = (100, 1000, 10_000)
+BASELINE_PATH = Path(__file__).with_name("startup_tracker_bench_baseline.json")
+REGRESSION_RATIO = 1.5  # slower than this x baseline counts as a regression
+
+# case name -> best seconds, filled in by the sweeps
+RESULTS: Dict[str, float] = {}
+
+def record(case: str, seconds: float) -> None:
+    RESULTS[case] = seconds
+    print(f"  {case:<40} {seconds * 1000:10.2f} ms")
+
+def repeats_for(n: int) -> int:
+    return 5 if n <= 1000 else 3
+
+def sweep_process_index(sizes) -> None:
+    """
+    ProcessTable over a simulated table: cold full index, then a warm tick with churn.
+    The live build_process_index() is timed once for reference (not swept, not baselined).
+    """
+    print("process index")
+    for n in sizes:
+        sim = st.SimulatedProcessSource(n_procs=n, n_apps=0)
+        record(f"process_index.cold/n={n}", timeit(lambda: st.ProcessTable(sim).refresh(), repeats_for(n)))
+
+        sim = st.SimulatedProcessSource(n_procs=n, n_apps=0, churn_per_s=n / 100)
+        table = st.ProcessTable(sim)
+        table.refresh()
+
+        def warm():
+            sim.sleep(1.0)
+            table.refresh()
+            table.snapshot()
+        record(f"process_index.tick/n={n}", timeit(warm, repeats_for(n)))
+    try:
+        t = timeit(st.build_process_index, repeat=1)
+        print(f"  (live build_process_index: {t * 1000:.1f} ms)")
+    except ImportError:
+        pass
+
+def sweep_matching(sizes) -> None:
+    """
+    match_item_to_process (linear, 100 items) and MatcherIndex (n items) over n processes,
+    and a steady-state PendingMatcher tick (n items still pending, 1% of the processes new).
+    """
+    print("matching")
+    for n in sizes:
+        procs = synthetic_proc_index(n)
+        few = synthetic_items(100, n)
+        record(f"match.linear_100_items/procs={n}",
+               timeit(lambda: [st.match_item_to_process(it, procs) for it in few], repeats_for(n)))
+        items = synthetic_items(n, n)
+        record(f"match.indexed/n={n}", timeit(lambda: st.MatcherIndex(procs).match_all(items), repeats_for(n)))
+        matcher = st.PendingMatcher()
+        pending = [it for it, pid in zip(items, matcher.match(items, procs, [])) if pid is None]
+        added = synthetic_proc_index(max(1, n // 100), seed=n)
+        record(f"match.pending_tick/n={n}",
+               timeit(lambda: matcher.match(pending, procs, added), repeats_for(n)))
+
+def sweep_monitor_tick(sizes, ticks: int = 10) -> None:
+    """
+    Full monitor_items ticks (index refresh, matching, tree, sampling, rollup) on a
+    simulated table of n processes with n / 20 startup items, per tick.
+    """
+    print("monitor_items tick")
+    for n in sizes:
+        def run():
+            sim = st.SimulatedProcessSource(n_procs=n, n_apps=max(1, n // 40), churn_per_s=n / 100, seed=n)
+            st.monitor_items(sim.startup_items(n_unmatched=max(1, n // 40)), ticks, 1.0, source=sim)
+        record(f"monitor.tick/n={n}", timeit(run, 2 if n <= 1000 else 1) / ticks)
+
+class FakeWinreg:
+    """
+    Just enough of winreg for enum_registry_run_items, serving values from a dict.
+    """
+    HKEY_CURRENT_USER, HKEY_LOCAL_MACHINE, KEY_READ = 1, 2, 0x20019
+
+    def __init__(self, values: Dict[int, List]):
+        self.values = values
+
+    def OpenKey(self, hive, subkey, reserved=0, access=0):
+        values = self.values.get(hive) if "WOW6432Node" not in subkey else None
+        if values is None:
+            raise FileNotFoundError(subkey)
+        return _FakeKey(values)
+
+    def EnumValue(self, key, i):
+        if i >= len(key.values):
+            raise OSError("no more values")
+        name, data = key.values[i]
+        return name, data, 1
+
+class _FakeKey:
+    def __init__(self, values):
+        self.values = values
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+def schtasks_csv_lines(n: int) -> List[str]:
+    header = '"HostName","TaskName","Next Run Time","Status","Logon Mode","Task To Run","Triggers"'
+    lines = [header]
+    for i in range(n):
+        trig = "At log on of any user" if i % 2 == 0 else "Daily at 03:00"
+        lines.append(f'"HOST","\\Vendor\\Task{i}","N/A","Ready","Interactive only",'
+                     f'"C:\\Program Files\\Vendor{i}\\task{i}.exe /run","{trig}"')
+        if i % 500 == 499:
+            lines += ["", header]  # schtasks repeats the header per folder
+    return lines
+
+def fixture_sources(root: Path, n: int) -> List[st.StartupSource]:
+    """
+    One source per enumerator, over fixtures with about n entries in total:
+    fake Run keys, a startup folder, schtasks CSV, XDG autostart, systemd wants, crontab.
+    """
+    per = max(1, n // 6)
+    startup = root / "startup"
+    autostart = root / "autostart"
+    wants = root / "default.target.wants"
+    for d in (startup, autostart, wants):
+        d.mkdir(parents=True, exist_ok=True)
+    for i in range(per):
+        (startup / f"App{i}.lnk").write_text("x")
+        (autostart / f"app{i}.desktop").write_text(
+            f"[Desktop Entry]\nType=Application\nName=App {i}\nExec=/opt/app{i}/app{i} --tray\n")
+        (wants / f"svc{i}.service").write_text(f"[Service]\nExecStart=/usr/bin/svc{i} --daemon\n")
+    run_values = {FakeWinreg.HKEY_CURRENT_USER: [(f"App{i}", f"\"C:\\Apps\\app{i}.exe\" -min") for i in range(per)]}
+    csv_lines = schtasks_csv_lines(per * 2)  # half of the tasks are logon tasks
+    crontab = "\n".join(f"@reboot /opt/job{i}.sh" for i in range(per))
+
+    def registry():
+        # enum_registry_run_items imports winreg itself; hand it the fake for the call
+        saved = sys.modules.get("winreg")
+        sys.modules["winreg"] = FakeWinreg(run_values)
+        try:
+            return st.enum_registry_run_items()
+        finally:
+            if saved is None:
+                sys.modules.pop("winreg", None)
+            else:
+                sys.modules["winreg"] = saved
+
+    def startup_folder():
+        items = []
+        for p in sorted(startup.iterdir()):
+            items.append(st.StartupItem(name=p.stem, source="StartupFolder:User", command=str(p), location=str(p)))
+        return items
+
+    none = lambda item, backup_dir: (False, "fixture")
+    return [
+        st.FunctionSource("registry", ("Registry:",), registry, none),
+        st.FunctionSource("startup_folder", ("StartupFolder:",), startup_folder, none),
+        st.FunctionSource("scheduled_tasks", ("TaskScheduler",), lambda: list(st.parse_schtasks_csv(csv_lines)), none,
+                          iter_fn=lambda: st.parse_schtasks_csv(csv_lines)),
+        st.FunctionSource("xdg_autostart", ("XDGAutostart:",),
+                          lambda: st.enum_xdg_autostart_items([("XDGAutostart:User", autostart)]), none),
+        st.FunctionSource("systemd", ("Systemd:",),
+                          lambda: st.enum_systemd_units([("Systemd:User", wants)]), none),
+        st.FunctionSource("cron", ("Cron:",), lambda: st.enum_cron_reboot_items(crontab), none),
+    ]
+
+def sweep_enumeration(sizes) -> None:
+    """
+    enumerate_all_startup_items over fixture registries/folders/CSV with n entries in total.
+    """
+    print("enumeration")
+    for n in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            sources = fixture_sources(Path(tmp), n)
+            count = len(st.enumerate_all_startup_items(sources))
+            record(f"enumerate/n={n}", timeit(lambda: st.enumerate_all_startup_items(sources), repeats_for(n)))
+            assert count >= n - 6, f"fixtures produced {count} items, expected about {n}"
+
+def sweep_render(sizes) -> None:
+    """
+    App._render_items with n rows, full table and virtualized, in a real (headless) Tk.
+    Skipped when there is no display.
+    """
+    try:
+        import tkinter as tk
+        import startup_tracker_gui as gui
+    except ImportError as e:
+        print(f"render: skipped ({e})")
+        return
+
+    class BenchApp(gui.App):
+        def refresh(self):
+            pass  # no live enumeration (or cache writes) while benchmarking
+
+    try:
+        app = BenchApp()
+    except tk.TclError as e:
+        print(f"render: skipped, no display ({e})")
+        return
+    app.withdraw()
+    print("render")
+    try:
+        for n in sizes:
+            items = synthetic_items(n, max(n, 100))
+            for virtual in (False, True):
+                if not virtual and n > gui.VIRTUAL_AUTO_ROWS:
+                    continue  # _render_items switches to virtual above this anyway
+
+                def render():
+                    app.virtual_var.set(virtual)
+                    app._clear_tree()
+                    app.items = items
+                    app._render_items()
+                    app.update_idletasks()
+                mode = "virtual" if virtual else "full"
+                record(f"render.{mode}/n={n}", timeit(render, 3 if n <= 1000 else 1))
+    finally:
+        app.destroy()
+
+SWEEPS = {
+    "process_index": sweep_process_index,
+    "matching": sweep_matching,
+    "monitor": sweep_monitor_tick,
+    "enumeration": sweep_enumeration,
+    "render": sweep_render,
+}
+
+# -----------------------------
+# Baselines
+# -----------------------------
+
+def load_baseline(path: Path = BASELINE_PATH) -> Dict[str, float]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f).get("results", {})
+    except FileNotFoundError:
+        return {}
+
+def save_baseline(results: Dict[str, float], path: Path = BASELINE_PATH) -> None:
+    doc = {
+        "machine": f"{platform.system()} {platform.machine()}, Python {platform.python_version()}",
+        "results": {k: round(v, 6) for k, v in sorted(results.items())},
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(doc, f, indent=1)
+        f.write("\n")
+    print(f"baseline written: {path}")
+
+def compare_to_baseline(results: Dict[str, float], baseline: Dict[str, float],
+                        ratio: float = REGRESSION_RATIO) -> List[str]:
+    """
+    Print now vs baseline per case; returns the cases slower than ratio x baseline.
+    """
+    if not baseline:
+        print("no baseline; run with --save-baseline to create one")
+        return []
+    regressions = []
+    print(f"vs baseline (regression above {ratio:.2f}x)")
+    for case in sorted(results):
+        base = baseline.get(case)
+        if not base:
+            continue
+        r = results[case] / base
+        flag = ""
+        if r > ratio:
+            flag = "  REGRESSION"
+            regressions.append(case)
+        print(f"  {case:<40} {r:6.2f}x{flag}")
+    return regressions
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+    parser = argparse.ArgumentParser(description="startup_tracker benchmarks")
+    parser.add_argument("--max-n", type=int, default=max(SWEEP_SIZES), help="Largest sweep size to run")
+    parser.add_argument("--only", choices=sorted(SWEEPS), action="append", help="Run only these sweeps")
+    parser.add_argument("--sweeps-only", action="store_true", help="Skip the one-off reports")
+    parser.add_argument("--save-baseline", action="store_true", help=f"Write results to {BASELINE_PATH.name}")
+    parser.add_argument("--check", action="store_true", help="Exit 1 on regressions vs the baseline")
+    args = parser.parse_args(argv)
+
+    if not args.sweeps_only and not args.only:
+        check_import_budget()
+        check_replay_roundtrip()
+        bench_matcher()
+        bench_item_memory()
+        bench_normalization()
+
+    sizes = [n for n in SWEEP_SIZES if n <= args.max_n]
+    for name in args.only or SWEEPS:
+        SWEEPS[name](sizes)
+
+    if args.save_baseline:
+        save_baseline({**load_baseline(), **RESULTS})
+        return 0
+    regressions = compare_to_baseline(RESULTS, load_baseline())
+    if regressions and args.check:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
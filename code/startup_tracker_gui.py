@@ -0,0 +1,1075 @@
+# Tk GUI for startup_tracker.py
+# Kept in its own module so the library and the headless CLI never import tkinter.
+
+import os
+import time
+import threading
+from collections import deque
+from operator import attrgetter
+from pathlib import Path
+from typing import Optional, List, Dict, Tuple
+
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+
+from startup_tracker import (
+    StartupItem, EnumerationCache, MonitorControl, active_startup_sources, default_capture_path, disable_items,
+    item_key, iter_startup_sources, latest_journal, load_capture, mb, monitor_items, relaunch_as_admin,
+    restore_journal,
+)
+
+# Live CPU/RAM values are pushed into visible rows at most this many times per second
+LIVE_FPS = 15
+
+# Above this many rows the table switches to the virtualized view automatically
+VIRTUAL_AUTO_ROWS = 5000
+
+# Column -> StartupItem attribute path used for sorting (monitoring stats live on .result)
+SORT_ATTRS = {
+    "Name": "name", "Source": "source", "Enabled": "enabled", "Command/Path": "command",
+    "PID": "result.matched_pid", "ProcName": "result.matched_proc_name", "AvgCPU%": "result.avg_cpu",
+    "PeakCPU%": "result.peak_cpu", "P95CPU%": "result.p95_cpu", "AvgMemMB": "result.avg_mem_mb",
+    "PeakMemMB": "result.peak_mem_mb", "AvgDiskMB/s": "result.avg_disk_mb_s", "PeakDiskMB/s": "result.peak_disk_mb_s",
+    "Procs": "process_count", "Impact": "result.impact_score", "Notes": "result.notes",
+}
+NUMERIC_COLUMNS = {"PID", "AvgCPU%", "PeakCPU%", "P95CPU%", "AvgMemMB", "PeakMemMB", "AvgDiskMB/s", "PeakDiskMB/s", "Procs",
+                   "Impact"}
+
+# Rows are ranked by impact (biggest first) until another column is clicked
+DEFAULT_SORT_COLUMN = "Impact"
+
+def rollup_rows(rows) -> Dict[Tuple[str, str], Tuple[StartupItem, float, float]]:
+    """
+    Per-tick sampler rows (one per PID, children included) -> item key: (item, cpu %, rss MB).
+    """
+    totals: Dict[Tuple[str, str], list] = {}
+    for it, pid, sample in rows:
+        key = item_key(it)
+        t = totals.get(key)
+        if t is None:
+            totals[key] = [it, sample[0], sample[1]]
+        else:
+            t[1] += sample[0]
+            t[2] += sample[1]
+    return {key: (it, cpu, mb(rss)) for key, (it, cpu, rss) in totals.items()}
+
+# Bounded ordered-event backlog; workers block in post() when the UI falls this far behind
+UI_EVENT_BACKLOG = 256
+
+class UIEventBus:
+    """
+    Worker -> Tk hand-off. Three kinds of traffic:
+      post(kind, payload)      ordered events (item batches, done, error); bounded, and
+                               post() blocks when full so a slow UI throttles the worker
+      latest(kind, payload)    coalesced: only the newest payload per kind is kept (progress)
+      snapshot(key, payload)   coalesced per item key (live CPU/RAM)
+    The Tk loop is woken via wake() once per empty -> non-empty transition; drain() takes
+    everything pending in one go.
+    """
+
+    def __init__(self, wake, maxsize: int = UI_EVENT_BACKLOG):
+        self._wake = wake
+        self.maxsize = maxsize
+        self._cond = threading.Condition()
+        self._events: deque = deque()
+        self._latest: Dict[str, object] = {}
+        self._snapshots: Dict[Tuple[str, str], object] = {}
+        self._woken = False
+        self.closed = False
+
+    def post(self, kind: str, payload=None, timeout: Optional[float] = None) -> bool:
+        with self._cond:
+            if not self._cond.wait_for(lambda: self.closed or len(self._events) < self.maxsize, timeout):
+                return False
+            if self.closed:
+                return False
+            self._events.append((kind, payload))
+            need_wake = self._mark_pending()
+        if need_wake:
+            self._signal()
+        return True
+
+    def latest(self, kind: str, payload=None) -> None:
+        with self._cond:
+            self._latest[kind] = payload
+            need_wake = self._mark_pending()
+        if need_wake:
+            self._signal()
+
+    def snapshot(self, key: Tuple[str, str], payload) -> None:
+        with self._cond:
+            self._snapshots[key] = payload
+            need_wake = self._mark_pending()
+        if need_wake:
+            self._signal()
+
+    def drain(self):
+        """
+        (events, latest, snapshots) pending since the last drain. Tk thread only.
+        """
+        with self._cond:
+            events = list(self._events)
+            self._events.clear()
+            latest, self._latest = self._latest, {}
+            snapshots, self._snapshots = self._snapshots, {}
+            self._woken = False
+            self._cond.notify_all()
+        return events, latest, snapshots
+
+    def close(self) -> None:
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+
+    def _mark_pending(self) -> bool:
+        if self._woken or self.closed:
+            return False
+        self._woken = True
+        return True
+
+    def _signal(self) -> None:
+        # Called without the lock held: a cross-thread Tk call waits for the main loop,
+        # which may itself be about to drain()
+        try:
+            self._wake()
+        except (RuntimeError, tk.TclError):
+            # Main loop not running yet (or already gone); the next post retries and
+            # App drains once at startup
+            with self._cond:
+                self._woken = False
+
+# Live chart: top-N processes, history length, redraw cap
+CHART_TOP_N = 5
+CHART_POINTS = 240
+CHART_FPS = 10
+CHART_COLORS = ("#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd", "#8c564b")
+
+class ChartFeed:
+    """
+    Sampler -> UI hand-off for the chart. Samples are batched here and the bus only
+    carries a coalesced "chart" notification, so a burst of ticks costs one redraw.
+    Per-item backlog is bounded, so a stalled Tk thread can't make it grow without limit.
+    """
+
+    def __init__(self, bus: UIEventBus, max_backlog: int = CHART_POINTS):
+        self.bus = bus
+        self.max_backlog = max_backlog
+        self._lock = threading.Lock()
+        self._pending: Dict[Tuple[str, str], deque] = {}
+        self._names: Dict[Tuple[str, str], str] = {}
+
+    def push(self, ts: float, totals) -> None:
+        """
+        totals is one tick's rollup_rows() output.
+        """
+        with self._lock:
+            for key, (it, cpu, rss_mb) in totals.items():
+                buf = self._pending.get(key)
+                if buf is None:
+                    buf = self._pending[key] = deque(maxlen=self.max_backlog)
+                    self._names[key] = it.name
+                buf.append((ts, cpu, rss_mb))
+        self.bus.latest("chart")
+
+    def take(self):
+        """
+        Swap out the pending batch: {key: [(ts, cpu, rss_mb), ...]}, {key: name}.
+        """
+        with self._lock:
+            batch, self._pending = self._pending, {}
+            names = dict(self._names)
+        return batch, names
+
+class ChartPanel(ttk.Frame):
+    """
+    CPU% and RSS over time for the top-N tracked processes (by recent CPU), drawn on
+    plain Tk canvases. Redraws are coalesced and capped at CHART_FPS.
+    """
+
+    def __init__(self, master, height: int = 150):
+        super().__init__(master)
+        self.history: Dict[Tuple[str, str], deque] = {}
+        self.names: Dict[Tuple[str, str], str] = {}
+        self._redraw_job = None
+        self._last_draw = 0.0
+        self.cpu_canvas = tk.Canvas(self, height=height, background="white", highlightthickness=0)
+        self.mem_canvas = tk.Canvas(self, height=height, background="white", highlightthickness=0)
+        self.cpu_canvas.pack(side="left", fill="both", expand=True, padx=(0, 5))
+        self.mem_canvas.pack(side="left", fill="both", expand=True, padx=(5, 0))
+
+    def clear(self):
+        self.history.clear()
+        self.names.clear()
+        self.request_redraw()
+
+    def add(self, batch, names):
+        for key, points in batch.items():
+            hist = self.history.get(key)
+            if hist is None:
+                hist = self.history[key] = deque(maxlen=CHART_POINTS)
+            hist.extend(points)
+        self.names.update(names)
+        self.request_redraw()
+
+    def request_redraw(self):
+        if self._redraw_job is not None:
+            return  # one redraw is already scheduled; it will pick up the new data
+        wait_ms = max(0, int((self._last_draw + 1.0 / CHART_FPS - time.monotonic()) * 1000))
+        self._redraw_job = self.after(wait_ms, self._redraw)
+
+    def _top_keys(self) -> List[Tuple[str, str]]:
+        def recent_cpu(key):
+            hist = self.history[key]
+            tail = list(hist)[-10:]
+            return sum(p[1] for p in tail) / len(tail)
+        return sorted((k for k in self.history if self.history[k]), key=recent_cpu, reverse=True)[:CHART_TOP_N]
+
+    def _redraw(self):
+        self._redraw_job = None
+        self._last_draw = time.monotonic()
+        keys = self._top_keys()
+        self._draw(self.cpu_canvas, keys, 1, "CPU %")
+        self._draw(self.mem_canvas, keys, 2, "RSS MB")
+
+    def _draw(self, canvas: tk.Canvas, keys, col: int, title: str):
+        canvas.delete("all")
+        w = max(canvas.winfo_width(), 100)
+        h = max(canvas.winfo_height(), 60)
+        pad_l, pad_r, pad_t, pad_b = 40, 110, 16, 14
+        canvas.create_text(pad_l, 2, text=title, anchor="nw", font=("TkDefaultFont", 8))
+        if not keys:
+            return
+        t_max = max(self.history[k][-1][0] for k in keys)
+        t_min = min(self.history[k][0][0] for k in keys)
+        v_max = max(max(p[col] for p in self.history[k]) for k in keys) or 1.0
+        span_t = max(t_max - t_min, 1e-6)
+        plot_w, plot_h = w - pad_l - pad_r, h - pad_t - pad_b
+        canvas.create_text(pad_l - 4, pad_t, text=f"{v_max:.0f}", anchor="ne", font=("TkDefaultFont", 7))
+        canvas.create_line(pad_l, pad_t + plot_h, pad_l + plot_w, pad_t + plot_h, fill="#999")
+
+        for n, key in enumerate(keys):
+            color = CHART_COLORS[n % len(CHART_COLORS)]
+            coords = []
+            for p in self.history[key]:
+                coords.append(pad_l + (p[0] - t_min) / span_t * plot_w)
+                coords.append(pad_t + plot_h - p[col] / v_max * plot_h)
+            if len(coords) >= 4:
+                canvas.create_line(*coords, fill=color, width=1.5)
+            canvas.create_text(
+                w - pad_r + 6, pad_t + n * 14, text=self.names.get(key, "?")[:16],
+                anchor="nw", fill=color, font=("TkDefaultFont", 8)
+            )
+
+class RowIndex:
+    """
+    Backing store for the table: all items plus cached sort orders and a filter index.
+    Sort orders are computed once per column and reused (reversed for descending)
+    until the data changes, so clicking between headings doesn't re-sort each time.
+    """
+
+    def __init__(self):
+        self.items: List[StartupItem] = []
+        self.sort_col: Optional[str] = DEFAULT_SORT_COLUMN
+        self.sort_desc = DEFAULT_SORT_COLUMN in NUMERIC_COLUMNS
+        self.filter_text = ""
+        self.view: List[int] = []  # indices into items, sorted and filtered
+        self._orders: Dict[str, List[int]] = {}
+        self._haystack: Optional[List[str]] = None
+
+    def set_items(self, items: List[StartupItem]) -> None:
+        """
+        New or changed data: drop cached orders and rebuild the view.
+        """
+        self.items = items
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """
+        Item fields changed in place (e.g. notes): drop cached orders and filter text, rebuild the view.
+        """
+        self._orders.clear()
+        self._haystack = None
+        self.rebuild()
+
+    def sort_by(self, col: str) -> None:
+        if col not in SORT_ATTRS:
+            return
+        if col == self.sort_col:
+            self.sort_desc = not self.sort_desc
+        else:
+            self.sort_col = col
+            self.sort_desc = col in NUMERIC_COLUMNS  # biggest first for stats
+        self.rebuild()
+
+    def set_filter(self, text: str) -> None:
+        self.filter_text = text.strip().lower()
+        self.rebuild()
+
+    def _order(self, col: str) -> List[int]:
+        order = self._orders.get(col)
+        if order is None:
+            get = attrgetter(SORT_ATTRS[col])
+            items = self.items
+
+            def key(i):
+                v = get(items[i])
+                # Missing values sort last; text compares case-insensitively
+                return (v is None, v.lower() if isinstance(v, str) else (v if v is not None else 0))
+
+            order = self._orders[col] = sorted(range(len(items)), key=key)
+        return order
+
+    def rebuild(self) -> None:
+        if self.sort_col in SORT_ATTRS:
+            order = self._order(self.sort_col)
+            if self.sort_desc:
+                # Keep missing values at the end when descending too
+                get = attrgetter(SORT_ATTRS[self.sort_col])
+                present = [i for i in order if get(self.items[i]) is not None]
+                missing = order[len(present):]
+                order = present[::-1] + missing
+        else:
+            order = range(len(self.items))
+
+        if self.filter_text:
+            if self._haystack is None:
+                self._haystack = [
+                    f"{it.name}\t{it.source}\t{it.command}\t{it.result.notes}".lower() for it in self.items
+                ]
+            hay, needle = self._haystack, self.filter_text
+            self.view = [i for i in order if needle in hay[i]]
+        else:
+            self.view = list(order)
+
+    def __len__(self) -> int:
+        return len(self.view)
+
+    def window(self, first: int, count: int) -> List[StartupItem]:
+        return [self.items[i] for i in self.view[first:first + count]]
+
+# -----------------------------
+# GUI
+# -----------------------------
+
+class App(tk.Tk):
+    def __init__(self):
+        super().__init__()
+        self.title("Windows Startup Tracker (Python)")
+        self.geometry("1250x820")
+
+        self.items: List[StartupItem] = []
+        self.item_by_iid: Dict[str, StartupItem] = {}
+
+        # Diffing renderer state: stable row id per (source, location), last values sent to Tk
+        self.iid_by_key: Dict[Tuple[str, str], str] = {}
+        self.row_cache: Dict[str, tuple] = {}
+        self.row_order: List[str] = []
+        self.shown: Dict[Tuple[str, str], str] = {}  # item key -> iid of rows currently in the tree
+        # Selection by item key: virtual-mode slots show different items as the view moves,
+        # so the Treeview's own selection only says which lines are highlighted
+        self.selected_keys = set()
+
+        # Sorted/filtered backing store; in virtual mode only a window of it is in the tree
+        self.rows = RowIndex()
+        self.virtual_first = 0
+
+        # Latest live sample per item key, merged in from the event bus
+        self.live_values: Dict[Tuple[str, str], Tuple[float, float]] = {}
+        self.live_dirty = set()
+
+        # Workers talk to the Tk thread only through this bus
+        self.bus = UIEventBus(lambda: self.event_generate("<<UIEvents>>", when="tail"))
+        self.bind("<<UIEvents>>", lambda e: self._drain_ui_events())
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.monitor_thread: Optional[threading.Thread] = None
+        self.refresh_thread: Optional[threading.Thread] = None
+        self.action_thread: Optional[threading.Thread] = None  # batch disable / restore
+        self.refresh_gen = 0  # bumped per refresh so late batches from an old refresh are dropped
+        self.item_keys = set()
+        self.monitor_control = MonitorControl()
+
+        self.backup_dir = Path.home() / "StartupTracker_Backups"
+        self.enum_cache = EnumerationCache()
+
+        self._build_ui()
+        self.refresh()
+
+        # Picks up anything posted before the main loop was running
+        self.after_idle(self._drain_ui_events)
+
+    def _build_ui(self):
+        top = ttk.Frame(self)
+        top.pack(fill="x", padx=10, pady=10)
+
+        ttk.Button(top, text="Refresh Startup List", command=self.refresh).pack(side="left")
+        ttk.Button(top, text="Open Capture...", command=self.open_capture).pack(side="left", padx=(6, 0))
+
+        ttk.Label(top, text="  Monitor duration (sec):").pack(side="left")
+        self.duration_var = tk.IntVar(value=120)
+        ttk.Entry(top, textvariable=self.duration_var, width=8).pack(side="left")
+
+        ttk.Label(top, text="  Sample interval (sec):").pack(side="left")
+        self.interval_var = tk.DoubleVar(value=1.0)
+        ttk.Entry(top, textvariable=self.interval_var, width=6).pack(side="left")
+
+        ttk.Button(top, text="Start Monitoring", command=self.start_monitoring).pack(side="left", padx=(8, 0))
+        self.pause_btn = ttk.Button(top, text="Pause", command=self.toggle_pause, state="disabled")
+        self.pause_btn.pack(side="left", padx=(4, 0))
+        self.stop_btn = ttk.Button(top, text="Stop", command=self.stop_monitoring, state="disabled")
+        self.stop_btn.pack(side="left", padx=(4, 8))
+
+        self.progress = ttk.Progressbar(top, length=250, mode="determinate")
+        self.progress.pack(side="left", padx=8)
+        self.progress["value"] = 0
+
+        ttk.Button(top, text="Disable Selected (One Click)", command=self.disable_selected).pack(side="right")
+        ttk.Button(top, text="Restore Last Disable", command=self.restore_last_disable).pack(side="right", padx=(0, 4))
+
+        # Filter + virtual view toggle
+        bar = ttk.Frame(self)
+        bar.pack(fill="x", padx=10, pady=(0, 6))
+        ttk.Label(bar, text="Filter:").pack(side="left")
+        self.filter_var = tk.StringVar(value="")
+        self.filter_var.trace_add("write", lambda *_: self._apply_filter())
+        ttk.Entry(bar, textvariable=self.filter_var, width=40).pack(side="left", padx=(4, 12))
+        self.virtual_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            bar, text="Virtual table (large inventories)", variable=self.virtual_var,
+            command=self._toggle_virtual
+        ).pack(side="left")
+
+        # Tree/table
+        cols = (
+            "Name", "Source", "Enabled", "Impact", "Command/Path", "PID", "ProcName", "CPU%", "MemMB",
+            "AvgCPU%", "PeakCPU%", "P95CPU%", "AvgMemMB", "PeakMemMB", "AvgDiskMB/s", "PeakDiskMB/s",
+            "Procs", "Notes"
+        )
+        table = ttk.Frame(self)
+        table.pack(fill="both", expand=True, padx=10, pady=(0,10))
+        self.tree = ttk.Treeview(table, columns=cols, show="headings", height=22)
+        self.vscroll = ttk.Scrollbar(table, orient="vertical", command=self._on_scroll)
+        self.vscroll.pack(side="right", fill="y")
+        self.tree.configure(yscrollcommand=self.vscroll.set)
+        for c in cols:
+            # CPU% / MemMB are live readings, not item fields; those headings don't sort
+            self.tree.heading(c, text=c, command=(lambda c=c: self._sort_by(c)) if c in SORT_ATTRS else "")
+            # widths
+            w = 120
+            if c in ("Command/Path", "Notes"):
+                w = 420 if c == "Command/Path" else 260
+            if c in ("CPU%", "MemMB", "AvgCPU%", "PeakCPU%", "P95CPU%", "AvgMemMB", "PeakMemMB", "PID",
+                     "AvgDiskMB/s", "PeakDiskMB/s"):
+                w = 90
+            if c in ("Procs", "Impact"):
+                w = 60
+            if c in ("Enabled",):
+                w = 70
+            self.tree.column(c, width=w, anchor="w")
+        self.tree.pack(side="left", fill="both", expand=True)
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tree.bind(seq, self._on_wheel)
+        self.tree.bind("<Double-1>", self._show_process_tree)
+        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+
+        # Live chart (fed during monitoring)
+        self.chart = ChartPanel(self)
+        self.chart.pack(fill="x", padx=10, pady=(0, 6))
+        self.chart_feed = ChartFeed(self.bus)
+
+        # Bottom help
+        bottom = ttk.Frame(self)
+        bottom.pack(fill="x", padx=10, pady=(0,10))
+        ttk.Label(
+            bottom,
+            text=(
+                "Tip: Run as Administrator to disable HKLM Run entries and some scheduled tasks. "
+                f"Startup-folder removals are backed up to: {self.backup_dir}"
+            )
+        ).pack(side="left")
+        self.status_var = tk.StringVar(value="")
+        ttk.Label(bottom, textvariable=self.status_var).pack(side="right")
+
+    def refresh(self):
+        """
+        Enumerate in the background; each source's rows are added as soon as it finishes.
+        """
+        if self.refresh_thread and self.refresh_thread.is_alive():
+            return
+        self.refresh_gen += 1
+        gen = self.refresh_gen
+        self.items = []
+        self.item_keys = set()
+        self._render_items()
+
+        def worker():
+            # Sources whose fingerprint didn't change are served from the on-disk cache
+            sources = self.enum_cache.cached(active_startup_sources())
+            for src, batch in iter_startup_sources(sources):
+                self.bus.post("items", (gen, batch))
+            try:
+                self.enum_cache.save()
+            except OSError:
+                pass
+            self.bus.post("items_done", (gen, list(self.enum_cache.added), list(self.enum_cache.removed)))
+
+        self.refresh_thread = threading.Thread(target=worker, daemon=True)
+        self.refresh_thread.start()
+
+    def _add_items(self, batch: List[StartupItem]):
+        added = False
+        for it in batch:
+            key = item_key(it)
+            if key in self.item_keys:
+                continue
+            self.item_keys.add(key)
+            self.items.append(it)
+            added = True
+        if added:
+            self._render_items()
+
+    def open_capture(self):
+        path = filedialog.askopenfilename(
+            title="Open boot capture",
+            initialdir=str(default_capture_path().parent),
+            filetypes=[("Capture files", "*.json"), ("All files", "*.*")]
+        )
+        if not path:
+            return
+        try:
+            items, meta = load_capture(Path(path))
+        except Exception as e:
+            messagebox.showerror("Open Capture", f"Could not read capture:\n{e}")
+            return
+        self.refresh_gen += 1  # ignore rows still arriving from a refresh
+        self.items = items
+        self.item_keys = {item_key(it) for it in items}
+        self._render_items()
+
+    def _show_changes(self, added: List[StartupItem], removed: List[Dict]):
+        """
+        Flag entries added since the previous refresh and summarize removed ones.
+        """
+        for it in added:
+            it.result.notes = (it.result.notes + " " if it.result.notes else "") + "New since last refresh."
+        if added:
+            self.rows.invalidate()  # notes are sorted on and searched by the filter
+            self._render_view()
+        if not added and not removed:
+            self.status_var.set("No startup changes since last refresh.")
+            return
+        msg = f"Since last refresh: {len(added)} added, {len(removed)} removed"
+        if removed:
+            names = ", ".join(d["name"] for d in removed[:5])
+            msg += f" (removed: {names}{', ...' if len(removed) > 5 else ''})"
+        self.status_var.set(msg)
+
+    def _iid_for(self, it: StartupItem) -> str:
+        """
+        Stable Treeview row id for an item, by its (source, location) key.
+        """
+        key = item_key(it)
+        iid = self.iid_by_key.get(key)
+        if iid is None:
+            iid = self.iid_by_key[key] = f"row{len(self.iid_by_key)}"
+        return iid
+
+    def _render_items(self):
+        """
+        Data changed: refresh the backing store (drops cached sort orders) and redraw.
+        """
+        self.rows.set_items(self.items)
+        if not self.virtual_var.get() and len(self.items) > VIRTUAL_AUTO_ROWS:
+            self.virtual_var.set(True)
+            self._clear_tree()
+        self._render_view()
+
+    def _render_view(self):
+        if self.virtual_var.get():
+            self._render_window()
+        else:
+            self._render_rows([self.rows.items[i] for i in self.rows.view])
+
+    def _clear_tree(self):
+        if self.row_cache:
+            self.tree.delete(*self.row_cache)
+        self.row_cache.clear()
+        self.row_order = []
+        self.shown = {}
+        self.item_by_iid = {}
+
+    def _render_rows(self, items: List[StartupItem]):
+        """
+        Bring the table in line with items, touching only rows that changed:
+        stale rows are deleted, new ones inserted, changed ones updated in place.
+        """
+        wanted: List[str] = []
+        by_iid: Dict[str, StartupItem] = {}
+        for it in items:
+            iid = self._iid_for(it)
+            if iid not in by_iid:
+                by_iid[iid] = it
+                wanted.append(iid)
+        self._sync_rows(wanted, by_iid)
+
+        if list(self.tree.get_children()) != wanted:
+            for idx, iid in enumerate(wanted):
+                self.tree.move(iid, "", idx)
+
+    def _sync_rows(self, wanted: List[str], by_iid: Dict[str, StartupItem]):
+        stale = [iid for iid in self.row_cache if iid not in by_iid]
+        if stale:
+            self.tree.delete(*stale)
+            for iid in stale:
+                del self.row_cache[iid]
+
+        for iid in wanted:
+            vals = self._row_values(by_iid[iid])
+            old = self.row_cache.get(iid)
+            if old is None:
+                self.tree.insert("", "end", iid=iid, values=vals)
+            elif old != vals:
+                self.tree.item(iid, values=vals)
+            self.row_cache[iid] = vals
+
+        self.item_by_iid = by_iid
+        self.row_order = wanted
+        self.shown = {item_key(it): iid for iid, it in by_iid.items()}
+        self._apply_selection()
+
+    def _on_select(self, event=None):
+        """
+        The user changed the highlighted rows: update the selection for the items
+        on screen, keeping selected items that are scrolled or filtered out.
+        """
+        on_screen = set(self.shown)
+        picked = {item_key(self.item_by_iid[iid]) for iid in self.tree.selection() if iid in self.item_by_iid}
+        self.selected_keys = (self.selected_keys - on_screen) | picked
+
+    def _apply_selection(self):
+        """
+        Highlight the rows whose items are selected (after slots were refilled).
+        """
+        want = [iid for key, iid in self.shown.items() if key in self.selected_keys]
+        if set(self.tree.selection()) != set(want):
+            self.tree.selection_set(want)
+
+    def _selected_items(self) -> List[StartupItem]:
+        """
+        Selected items in the current view (filter applied), in view order.
+        """
+        items = self.rows.items
+        return [items[i] for i in self.rows.view if item_key(items[i]) in self.selected_keys]
+
+    def _window_size(self) -> int:
+        return int(self.tree.cget("height"))
+
+    def _render_window(self):
+        """
+        Virtual mode: the tree holds one reusable row slot per visible line,
+        filled from the backing store starting at virtual_first.
+        """
+        n = len(self.rows)
+        size = self._window_size()
+        self.virtual_first = max(0, min(self.virtual_first, n - size))
+        window = self.rows.window(self.virtual_first, size)
+        by_iid = {f"slot{i}": it for i, it in enumerate(window)}
+        self._sync_rows(list(by_iid), by_iid)
+        if n:
+            self.vscroll.set(self.virtual_first / n, min(1.0, (self.virtual_first + size) / n))
+        else:
+            self.vscroll.set(0.0, 1.0)
+
+    def _on_scroll(self, *args):
+        if not self.virtual_var.get():
+            self.tree.yview(*args)
+            return
+        n, size = len(self.rows), self._window_size()
+        if args[0] == "moveto":
+            self.virtual_first = int(float(args[1]) * n)
+        elif args[0] == "scroll":
+            step = size if args[2] == "pages" else 1
+            self.virtual_first += int(args[1]) * step
+        self._render_window()
+
+    def _on_wheel(self, event):
+        if not self.virtual_var.get():
+            return None
+        if getattr(event, "num", None) == 4 or getattr(event, "delta", 0) > 0:
+            self.virtual_first -= 3
+        else:
+            self.virtual_first += 3
+        self._render_window()
+        return "break"
+
+    def _toggle_virtual(self):
+        self._clear_tree()
+        self.virtual_first = 0
+        if not self.virtual_var.get():
+            self.tree.configure(yscrollcommand=self.vscroll.set)
+        else:
+            self.tree.configure(yscrollcommand="")
+        self._render_view()
+
+    def _sort_by(self, col: str):
+        self.rows.sort_by(col)
+        self.virtual_first = 0
+        self._render_view()
+
+    def _apply_filter(self):
+        self.rows.set_filter(self.filter_var.get())
+        self.virtual_first = 0
+        self._render_view()
+
+    def _update_row(self, it: StartupItem):
+        iid = self.shown.get(item_key(it))
+        if iid is None:
+            return
+        vals = self._row_values(it)
+        if vals != self.row_cache[iid]:
+            self.tree.item(iid, values=vals)
+            self.row_cache[iid] = vals
+
+    def _visible_iids(self) -> List[str]:
+        if not self.row_order:
+            return []
+        if self.virtual_var.get():
+            return self.row_order  # only the visible window is in the tree
+        lo, hi = self.tree.yview()
+        n = len(self.row_order)
+        return self.row_order[int(lo * n):int(hi * n) + 1]
+
+    def _live_frame(self):
+        """
+        Push the latest live samples into rows that are on screen; rows scrolled
+        out of view keep their pending update for a later frame.
+        """
+        dirty, self.live_dirty = self.live_dirty, set()
+        if dirty:
+            for iid in self._visible_iids():
+                it = self.item_by_iid.get(iid)
+                if it is not None and item_key(it) in dirty:
+                    dirty.discard(item_key(it))
+                    self._update_row(it)
+            self.live_dirty |= dirty
+        if self.monitor_thread and self.monitor_thread.is_alive():
+            self.after(1000 // LIVE_FPS, self._live_frame)
+
+    def _row_values(self, it: StartupItem):
+        def fmt(x, digits=2):
+            return "" if x is None else f"{x:.{digits}f}"
+
+        live = self.live_values.get(item_key(it), (None, None))
+        res = it.result
+        return (
+            it.name,
+            it.source,
+            "Yes" if it.enabled else "No",
+            fmt(res.impact_score, 1),
+            it.command,
+            "" if res.matched_pid is None else str(res.matched_pid),
+            res.matched_proc_name or "",
+            fmt(live[0], 1),
+            fmt(live[1], 1),
+            fmt(res.avg_cpu, 2),
+            fmt(res.peak_cpu, 2),
+            fmt(res.p95_cpu, 2),
+            fmt(res.avg_mem_mb, 2),
+            fmt(res.peak_mem_mb, 2),
+            fmt(res.avg_disk_mb_s, 2),
+            fmt(res.peak_disk_mb_s, 2),
+            "" if it.process_count is None else str(it.process_count),
+            res.notes or ""
+        )
+
+    def _show_process_tree(self, event):
+        """
+        Double-click: per-process breakdown of the item's rolled-up stats.
+        """
+        it = self.item_by_iid.get(self.tree.identify_row(event.y))
+        if it is None or it.result.matched_pid is None:
+            return
+        res = it.result
+
+        def fmt(x):
+            return "-" if x is None else f"{x:.1f}"
+
+        lines = [
+            f"{res.matched_pid}  {res.matched_proc_name or '?'}  (matched)",
+            f"    total: avg CPU {fmt(res.avg_cpu)}%, peak CPU {fmt(res.peak_cpu)}%, "
+            f"avg {fmt(res.avg_mem_mb)} MB, peak {fmt(res.peak_mem_mb)} MB",
+            f"    disk: avg {fmt(res.avg_disk_mb_s)} MB/s, peak {fmt(res.peak_disk_mb_s)} MB/s, "
+            f"read {fmt(res.disk_read_mb)} MB, written {fmt(res.disk_write_mb)} MB",
+            f"    impact {fmt(res.impact_score)}: {fmt(res.cpu_seconds)} CPU-s, "
+            f"settled after {fmt(res.time_to_idle_s)} s",
+        ]
+        for c in sorted(res.children or (), key=lambda c: c.get("avg_cpu") or 0, reverse=True)[:30]:
+            lines.append(
+                f"{c['pid']}  {c.get('name') or '?'}  (parent {c.get('ppid')}): avg CPU {fmt(c.get('avg_cpu'))}%, "
+                f"peak CPU {fmt(c.get('peak_cpu'))}%, peak {fmt(c.get('peak_mem_mb'))} MB, "
+                f"disk {fmt(c.get('avg_disk_mb_s'))} MB/s"
+            )
+        if len(res.children or ()) > 30:
+            lines.append(f"... and {len(res.children) - 30} more")
+        messagebox.showinfo(f"Process tree: {it.name}", "\n".join(lines))
+
+    def start_monitoring(self):
+        if self.monitor_thread and self.monitor_thread.is_alive():
+            messagebox.showinfo("Monitoring", "Monitoring is already running.")
+            return
+
+        # Clear previous results
+        for it in self.items:
+            it.clear_results()
+        self.live_values = {}
+        self.live_dirty = set()
+        self.chart.clear()
+        self.chart_feed.take()
+
+        self._render_items()
+        self.progress["value"] = 0
+
+        duration = max(10, int(self.duration_var.get() or 120))
+        interval = max(0.25, float(self.interval_var.get() or 1.0))
+
+        def progress_cb(frac, samples):
+            self.bus.latest("progress", frac)
+
+        def sample_cb(ts, rows):
+            # Live values are per item: the matched process plus its children
+            totals = rollup_rows(rows)
+            for key, (it, cpu, rss_mb) in totals.items():
+                self.bus.snapshot(key, (cpu, rss_mb))
+            self.chart_feed.push(ts, totals)
+
+        control = self.monitor_control = MonitorControl()
+
+        def worker():
+            try:
+                store = monitor_items(self.items, duration, interval, progress_cb=progress_cb,
+                                      workers=min(8, os.cpu_count() or 1), sample_cb=sample_cb,
+                                      control=control)
+                self.bus.post("done", store.timing())
+            except Exception as e:
+                self.bus.post("error", str(e))
+
+        self.monitor_thread = threading.Thread(target=worker, daemon=True)
+        self.monitor_thread.start()
+        self.pause_btn.config(text="Pause", state="normal")
+        self.stop_btn.config(state="normal")
+        self.after(1000 // LIVE_FPS, self._live_frame)
+
+    def toggle_pause(self):
+        if self.monitor_control.paused:
+            self.monitor_control.resume()
+            self.pause_btn.config(text="Pause")
+            self.status_var.set("Monitoring resumed.")
+        else:
+            self.monitor_control.pause()
+            self.pause_btn.config(text="Resume")
+            self.status_var.set("Monitoring paused; paused time doesn't count towards the window.")
+
+    def stop_monitoring(self):
+        """
+        Ends the run at once; samples taken so far are still turned into stats.
+        """
+        self.monitor_control.stop()
+        self.pause_btn.config(state="disabled")
+        self.stop_btn.config(state="disabled")
+        self.status_var.set("Stopping monitoring...")
+
+    def _monitoring_finished(self):
+        self.pause_btn.config(text="Pause", state="disabled")
+        self.stop_btn.config(state="disabled")
+
+    def _action_busy(self) -> bool:
+        if self.action_thread and self.action_thread.is_alive():
+            messagebox.showinfo("Busy", "A disable or restore is still running.")
+            return True
+        return False
+
+    def disable_selected(self):
+        sel = self._selected_items()
+        if not sel:
+            messagebox.showwarning("Disable", "Select at least one startup entry.")
+            return
+        if self._action_busy():
+            return
+
+        # Confirm, naming what will be touched (in virtual mode some may be scrolled out of view)
+        names = "\n".join(f"  {it.name}" for it in sel[:10]) + ("\n  ..." if len(sel) > 10 else "")
+        if not messagebox.askyesno(
+            "Confirm Disable",
+            f"This will disable/remove {len(sel)} selected startup entr{'y' if len(sel) == 1 else 'ies'}:\n"
+            f"{names}\n\n"
+            "Registry Run entries will be deleted.\n"
+            "Startup-folder files will be moved to a backup folder.\n"
+            "Scheduled tasks will be disabled.\n\n"
+            "The previous state is journaled first; \"Restore Last Disable\" undoes the batch.\n\nProceed?"
+        ):
+            return
+
+        targets = []
+        msgs = []
+        for it in sel:
+            if not it.enabled:
+                msgs.append(f"{it.name}: already disabled / unavailable.")
+                continue
+            targets.append(it)
+        if not targets:
+            messagebox.showinfo("Disable", "\n".join(msgs[:20]) + ("\n..." if len(msgs) > 20 else ""))
+            return
+
+        # Don't fight a running monitor over the progress bar
+        monitoring = bool(self.monitor_thread and self.monitor_thread.is_alive())
+        progress_cb = None if monitoring else (lambda done, n: self.bus.latest("progress", done / n))
+
+        # The items are only read by the workers; results are applied on the Tk thread
+        def worker():
+            try:
+                journal, results = disable_items(targets, self.backup_dir, progress_cb=progress_cb)
+                self.bus.post("disable_done", (str(journal.path), results, msgs))
+            except Exception as e:
+                self.bus.post("action_error", f"Disable failed:\n{e}")
+
+        self.status_var.set(f"Disabling {len(targets)} item(s)...")
+        if not monitoring:
+            self.progress["value"] = 0
+        self.action_thread = threading.Thread(target=worker, daemon=True)
+        self.action_thread.start()
+
+    def restore_last_disable(self):
+        if self._action_busy():
+            return
+        path = latest_journal(self.backup_dir)
+        if path is None:
+            messagebox.showinfo("Restore", "No disable batch left to restore.")
+            return
+        if not messagebox.askyesno(
+            "Confirm Restore",
+            f"Undo the last disable batch?\n\n{path}\n\n"
+            "Registry values, startup files, tasks, units and crontab are put back as they were."
+        ):
+            return
+
+        def worker():
+            try:
+                results = restore_journal(path)
+                self.bus.post("restore_done", [((d["source"], d["location"]), d["name"], ok, msg)
+                                               for d, ok, msg in results])
+            except Exception as e:
+                self.bus.post("action_error", f"Restore failed:\n{e}")
+
+        self.status_var.set("Restoring...")
+        self.action_thread = threading.Thread(target=worker, daemon=True)
+        self.action_thread.start()
+
+    def _disable_finished(self, journal_path: str, results, msgs: List[str]):
+        ok_count = 0
+        for it, success, msg in results:
+            it.result.notes = msg
+            if success:
+                ok_count += 1
+                it.enabled = False
+            else:
+                msgs.append(f"{it.name}: {msg}")
+        self._render_items()
+        if not (self.monitor_thread and self.monitor_thread.is_alive()):
+            self.progress["value"] = 100
+        self.status_var.set(f"Disabled {ok_count} item(s). Journal: {journal_path}" if ok_count
+                            else "Nothing was disabled.")
+        if msgs:
+            self.after_idle(lambda: messagebox.showwarning(
+                "Some actions failed", "\n".join(msgs[:20]) + ("\n..." if len(msgs) > 20 else "")))
+        else:
+            self.after_idle(lambda: messagebox.showinfo("Disable", f"Disabled/removed {ok_count} item(s)."))
+
+    def _restore_finished(self, results):
+        by_key = {item_key(it): it for it in self.items}
+        msgs = []
+        ok_count = 0
+        for key, name, success, msg in results:
+            it = by_key.get(key)
+            if success:
+                ok_count += 1
+                if it:
+                    it.enabled = True
+            else:
+                msgs.append(f"{name}: {msg}")
+            if it:
+                it.result.notes = msg
+        self._render_items()
+        self.status_var.set(f"Restored {ok_count} item(s).")
+        if msgs:
+            self.after_idle(lambda: messagebox.showwarning(
+                "Some restores failed", "\n".join(msgs[:20]) + ("\n..." if len(msgs) > 20 else "")))
+        else:
+            self.after_idle(lambda: messagebox.showinfo("Restore", f"Restored {ok_count} item(s)."))
+
+    def _drain_ui_events(self):
+        """
+        Handle everything the workers posted since the last wake-up. Dialogs are
+        deferred to after_idle so their nested event loop can't re-enter this drain
+        halfway through a batch.
+        """
+        events, latest, snapshots = self.bus.drain()
+        for kind, payload in events:
+            if kind == "items":
+                gen, batch = payload
+                if gen == self.refresh_gen:
+                    self._add_items(batch)
+            elif kind == "items_done":
+                gen, added, removed = payload
+                if gen == self.refresh_gen:
+                    self._show_changes(added, removed)
+            elif kind == "done":
+                if not payload["cancelled"]:
+                    self.progress["value"] = 100
+                self.live_values = {}
+                latest.pop("progress", None)
+                snapshots = {}
+                self._monitoring_finished()
+                self._render_items()
+                headline = ("Monitoring stopped. Partial stats from the samples taken so far are in the table."
+                            if payload["cancelled"] else "Monitoring complete. Stats updated in the table.")
+                self.status_var.set(headline)
+                self.after_idle(lambda t=payload: messagebox.showinfo(
+                    "Monitoring",
+                    f"{headline}\n\n"
+                    f"Achieved sample rate: {t['rate_hz']:.2f}/s "
+                    f"(interval jitter {t['jitter'] * 1000:.0f} ms)"
+                ))
+            elif kind == "error":
+                self._monitoring_finished()
+                self.after_idle(lambda m=payload: messagebox.showerror("Error", f"Monitoring error:\n{m}"))
+            elif kind == "disable_done":
+                if not (self.monitor_thread and self.monitor_thread.is_alive()):
+                    latest.pop("progress", None)
+                self._disable_finished(*payload)
+            elif kind == "restore_done":
+                self._restore_finished(payload)
+            elif kind == "action_error":
+                self.status_var.set("")
+                self.after_idle(lambda m=payload: messagebox.showerror("Error", m))
+
+        if "progress" in latest:
+            self.progress["value"] = latest["progress"] * 100
+        if "chart" in latest:
+            self.chart.add(*self.chart_feed.take())
+        if snapshots:
+            # Rendered by _live_frame at LIVE_FPS
+            self.live_values.update(snapshots)
+            self.live_dirty.update(snapshots)
+
+    def _on_close(self):
+        self.monitor_control.stop()
+        self.bus.close()  # unblock workers waiting in post()
+        self.destroy()
+
+def run_gui() -> int:
+    relaunch_as_admin()
+    app = App()
+    app.mainloop()
+    return 0
+
+if __name__ == "__main__":
+    run_gui()